@@ -0,0 +1,151 @@
+"""
+Benchmark for process-pool transcript extraction.
+
+Generates synthetic Teams-style transcripts as .docx and .pdf files, then
+times sequential extraction against `extract_files` with increasing worker
+counts.
+
+Usage:
+    python benchmark_extraction.py --files 2000 --workers 1,2,4,8
+"""
+import os
+import time
+import random
+import zipfile
+import argparse
+import tempfile
+from pathlib import Path
+from typing import List
+
+from src.Agentic.utils.store_to_mongodb import extract_transcripts
+from src.Agentic.utils.extraction_pool import extract_files
+
+SPEAKERS = ["Alice Johnson", "Brian Smith", "Carla Gomez", "David Chen", "Emma Brown", "Farid Khan"]
+WORDS = ("update sprint backlog deploy review blocker api release test design "
+         "customer metrics pipeline migration dashboard latency budget").split()
+
+
+# ======================================================================
+# SYNTHETIC TRANSCRIPTS
+# ======================================================================
+def synthetic_transcript(index: int, turns: int = 60) -> List[str]:
+    rng = random.Random(index)
+    lines = [
+        f"Project{index % 25}-20250101_100000-Meeting Recording",
+        "1 January 2025, 10:00am",
+        "32m 10s",
+    ]
+    for turn in range(turns):
+        lines.append(f"{rng.choice(SPEAKERS)} {turn // 2}:{turn % 60:02d}")
+        lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))))
+    return lines
+
+
+def write_docx(path: Path, lines: List[str]):
+    """Minimal WordprocessingML package (enough for docx2txt)."""
+    paragraphs = "".join(
+        f"<w:p><w:r><w:t xml:space=\"preserve\">{line}</w:t></w:r></w:p>" for line in lines
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml",
+                   '<?xml version="1.0" encoding="UTF-8"?>'
+                   '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                   '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                   '<Default Extension="xml" ContentType="application/xml"/>'
+                   '<Override PartName="/word/document.xml" '
+                   'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                   '</Types>')
+        z.writestr("_rels/.rels",
+                   '<?xml version="1.0" encoding="UTF-8"?>'
+                   '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                   '<Relationship Id="rId1" '
+                   'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                   'Target="word/document.xml"/></Relationships>')
+        z.writestr("word/document.xml",
+                   '<?xml version="1.0" encoding="UTF-8"?>'
+                   '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                   f'<w:body>{paragraphs}</w:body></w:document>')
+
+
+def write_pdf(path: Path, lines: List[str]):
+    """Single-font PDF with one text line per transcript line, paginated."""
+    per_page = 50
+    pages = [lines[i:i + per_page] for i in range(0, len(lines), per_page)]
+
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_lines in pages:
+        escaped = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in page_lines]
+        content = "BT /F1 9 Tf 11 TL 40 800 Td " + " ".join(f"({line}) '" for line in escaped) + " ET"
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+        content_id = len(objects)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+def generate_files(directory: Path, count: int) -> List[Path]:
+    files = []
+    for i in range(count):
+        lines = synthetic_transcript(i)
+        if i % 2:
+            path = directory / f"transcript_{i:05d}.pdf"
+            write_pdf(path, lines)
+        else:
+            path = directory / f"transcript_{i:05d}.docx"
+            write_docx(path, lines)
+        files.append(path)
+    return files
+
+
+# ======================================================================
+# BENCHMARK
+# ======================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark process-pool transcript extraction")
+    parser.add_argument("--files", type=int, default=2000, help="number of synthetic files")
+    parser.add_argument("--workers", default=",".join(str(n) for n in (1, 2, 4, 8)),
+                        help="comma-separated worker counts to try")
+    parser.add_argument("--dir", default=None, help="directory for generated files (default: temp dir)")
+    args = parser.parse_args()
+
+    worker_counts = [int(n) for n in args.workers.split(",") if n.strip()]
+    directory = Path(args.dir or tempfile.mkdtemp(prefix="orbit-extract-bench-"))
+    directory.mkdir(parents=True, exist_ok=True)
+
+    print(f"Generating {args.files} synthetic .docx/.pdf files in {directory} ...")
+    files = generate_files(directory, args.files)
+    print(f"CPU count: {os.cpu_count()}")
+
+    started = time.perf_counter()
+    for path in files:
+        extract_transcripts([str(path)])
+    baseline = time.perf_counter() - started
+    print(f"\n{'mode':<14}{'seconds':>10}{'files/s':>10}{'speedup':>10}")
+    print(f"{'sequential':<14}{baseline:>10.2f}{len(files) / baseline:>10.1f}{1.0:>10.2f}")
+
+    for workers in worker_counts:
+        started = time.perf_counter()
+        results = extract_files(files, workers=workers)
+        elapsed = time.perf_counter() - started
+        failed = sum(1 for r in results.values() if "error" in r)
+        label = f"pool x{workers}"
+        print(f"{label:<14}{elapsed:>10.2f}{len(files) / elapsed:>10.1f}{baseline / elapsed:>10.2f}"
+              + (f"   ({failed} failed)" if failed else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from loguru import logger
 
 # Import your schemas
 from src.Agentic.utils.pydantic_schemas import SummaryList, UsersAnalysis
+from src.Agentic.utils.transcript_store import transcript_content_hash
 
 # ======================================================================
 # LOGURU CONFIGURATION
@@ -40,6 +41,55 @@ class OrchestratorState(BaseModel):
 
     participant_db_path: Optional[str] = "participants_data.csv"
 
+    content_hash: Optional[str] = None
+    duplicate: bool = False
+
+    email_mode: str = "immediate"
+    email_result: Optional[Dict[str, Any]] = None
+
+
+# ======================================================================
+# DEDUPLICATION NODES (ASYNC)
+# ======================================================================
+
+async def check_duplicate(state: OrchestratorState, check_tool):
+    logger.info("Step 0: Checking transcript content hash...")
+    content_hash = state.content_hash or transcript_content_hash(state.transcript)
+
+    if check_tool is None:
+        return state.model_copy(update={"content_hash": content_hash})
+
+    try:
+        duplicate = await check_tool.ainvoke({"content_hash": content_hash})
+    except Exception as e:
+        logger.error(f"Error checking transcript hash: {e}")
+        raise
+
+    if duplicate:
+        logger.warning(f"Identical transcript already processed ({content_hash[:12]}). Skipping.")
+    return state.model_copy(update={"content_hash": content_hash, "duplicate": bool(duplicate)})
+
+
+def route_after_duplicate_check(state: OrchestratorState):
+    return END if state.duplicate else "summary"
+
+
+async def record_processed(state: OrchestratorState, record_tool):
+    if record_tool is None:
+        return state
+
+    logger.info("Step 11: Recording transcript content hash...")
+    try:
+        await record_tool.ainvoke({
+            "content_hash": state.content_hash,
+            "project_key": state.project_key,
+            "meeting_name": state.meeting_name
+        })
+        return state
+    except Exception as e:
+        logger.error(f"Error recording transcript hash: {e}")
+        raise
+
 
 # ======================================================================
 # AGENT NODES (ASYNC)
@@ -200,7 +250,7 @@ async def send_emails(state: OrchestratorState, email_tool):
     global_text = state.global_summary
 
     try:
-        await email_tool.ainvoke({
+        email_result = await email_tool.ainvoke({
             "input_data": {
                 "project_key": state.project_key,
                 "project_name": state.project_name,
@@ -208,11 +258,19 @@ async def send_emails(state: OrchestratorState, email_tool):
                 "meeting_summary_text": meeting_text,
                 "participant_analysis_text": participant_text,
                 "global_summary_text": global_text,
+                "participants": state.participants,
+                "participant_summaries": [
+                    ua.participant_summary.model_dump() for ua in state.user_analysis_list
+                ],
             },
-            "participant_db_path": state.participant_db_path
+            "participant_db_path": state.participant_db_path,
+            "delivery_mode": state.email_mode
         })
-        logger.success("Emails sent successfully.")
-        return state
+        if state.email_mode == "digest":
+            logger.success("Email sections queued for digest.")
+        else:
+            logger.success("Emails sent successfully.")
+        return state.model_copy(update={"email_result": email_result})
     except Exception as e:
         logger.error(f"Error sending emails: {e}")
         raise
@@ -229,10 +287,13 @@ def build_orchestrator_graph(
     save_tool,
     fetch_tool,
     save_project_summary_tool,
-    email_tool
+    email_tool,
+    dedup_check_tool=None,
+    dedup_record_tool=None
 ):
     workflow = StateGraph(OrchestratorState)
 
+    workflow.add_node("dedup", partial(check_duplicate, check_tool=dedup_check_tool))
     workflow.add_node("summary", partial(run_summary_agent, summary_agent=summary_agent))
     workflow.add_node("build_summary", build_summary_object)
     workflow.add_node("participant", partial(run_participant_agent, participant_agent=participant_agent))
@@ -244,8 +305,10 @@ def build_orchestrator_graph(
     workflow.add_node("global_summary", partial(run_global_summary, global_agent=global_summary_agent))
     workflow.add_node("save_project_summary", partial(save_project_summary_to_db, save_tool=save_project_summary_tool))
     workflow.add_node("email", partial(send_emails, email_tool=email_tool))
+    workflow.add_node("record_processed", partial(record_processed, record_tool=dedup_record_tool))
 
-    workflow.add_edge("__start__", "summary")
+    workflow.add_edge("__start__", "dedup")
+    workflow.add_conditional_edges("dedup", route_after_duplicate_check, ["summary", END])
 
     workflow.add_edge("summary", "build_summary")
     workflow.add_edge("build_summary", "participant")
@@ -256,6 +319,7 @@ def build_orchestrator_graph(
     workflow.add_edge("fetch", "global_summary")
     workflow.add_edge("global_summary", "save_project_summary")
     workflow.add_edge("save_project_summary", "email")
-    workflow.add_edge("email", END)
+    workflow.add_edge("email", "record_processed")
+    workflow.add_edge("record_processed", END)
 
     return workflow.compile()
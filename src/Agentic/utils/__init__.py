@@ -3,13 +3,16 @@ from src.Agentic.utils.tools import (
     save_summaries_to_mongo,
     fetch_project_data_from_mongo,
     send_project_emails,
-    save_project_summary_to_mongo
+    save_project_summary_to_mongo,
+    check_transcript_processed,
+    record_transcript_processed
 )
 
 __all__ = [
     "save_summaries_to_mongo",
     "fetch_project_data_from_mongo",
     "send_project_emails",
-    "save_project_summary_to_mongo"
+    "save_project_summary_to_mongo",
+    "check_transcript_processed",
+    "record_transcript_processed"
 ]
-
@@ -0,0 +1,416 @@
+"""
+Write-side indexing of transcripts and summaries for chat retrieval.
+
+Transcripts are split into chunks of consecutive speaker turns when they are
+ingested; meeting summary points, participant analyses and the global
+project summary are added when they are saved. Each entry is stored in
+OMNI_MEET_DB.Transcript_chunks with a sparse hashed term-frequency vector
+(NumPy arrays serialised as bytes) and its exact term counts (BM25
+postings), both computed on write. The chatbot's retrieval layer
+(src/chatbot/retrieval.py) only reads these entries.
+
+Meetings and summaries written before indexing existed are indexed by the
+backfill functions.
+"""
+import re
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from bson import Binary, ObjectId
+from loguru import logger
+
+from src.Agentic.utils.transcript_store import load_transcript_text, load_inline_transcript
+
+# ======================================================================
+# CONFIGURATION
+# ======================================================================
+RAW_COLLECTION = "Raw_Transcripts"
+CHUNK_COLLECTION = "Transcript_chunks"
+SUMMARY_COLLECTION = "Meeting_summary"
+
+KIND_TRANSCRIPT = "transcript"
+KIND_SUMMARY = "summary"
+KIND_PARTICIPANT = "participant"            # one entry per participant per meeting
+KIND_PROJECT_SUMMARY = "project_summary"    # the global project summary, in chunks
+
+PARTICIPANT_COLLECTION = "Participants_analysis"
+PROJECT_SUMMARY_COLLECTION = "Project_summary"
+PROJECT_SUMMARY_MEETING = "Project summary"  # meeting_name of project summary entries
+
+# Raw_Transcripts field recording that a project's pre-existing records have
+# been indexed; bump BACKFILL_VERSION when a new backfill step is added
+BACKFILL_FIELD = "index_backfilled"
+BACKFILL_VERSION = 1
+
+VECTOR_DIM = 1 << 12          # hashed feature space
+CHUNK_MAX_CHARS = 1200        # target chunk size (a long single turn may exceed it)
+
+# Teams-style speaker header, "Firstname Lastname 12:34" (as in process_transcript)
+SPEAKER_LINE = re.compile(r"^([A-Z][a-zA-Z]+\s[A-Z][a-zA-Z]+)\s\d+:\d{2}")
+TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "the", "and", "for", "that", "this", "with", "you", "are", "was", "but", "have",
+    "not", "what", "all", "can", "had", "her", "his", "she", "they", "will", "would",
+    "there", "their", "about", "just", "from", "been", "were", "its", "it", "is", "to",
+    "of", "in", "on", "at", "be", "so", "we", "do", "if", "or", "an", "as", "by", "my",
+    "me", "our", "us", "yeah", "okay", "um", "uh", "like", "know", "think", "going"
+}
+
+
+# ======================================================================
+# CHUNKING
+# ======================================================================
+def chunk_transcript(text: str, max_chars: int = CHUNK_MAX_CHARS) -> List[Dict[str, Any]]:
+    """
+    Split a transcript into chunks of whole speaker turns.
+
+    Returns:
+        [{"text": str, "speakers": [names]}, ...]
+    """
+    # Group lines into turns, each starting at a speaker header line
+    turns: List[Tuple[Optional[str], List[str]]] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = SPEAKER_LINE.match(line)
+        if match or not turns:
+            turns.append((match.group(1) if match else None, [line]))
+        else:
+            turns[-1][1].append(line)
+
+    chunks: List[Dict[str, Any]] = []
+    current: List[str] = []
+    speakers: List[str] = []
+    size = 0
+    for speaker, lines in turns:
+        turn_text = "\n".join(lines)
+        if current and size + len(turn_text) > max_chars:
+            chunks.append({"text": "\n".join(current), "speakers": speakers})
+            current, speakers, size = [], [], 0
+        current.append(turn_text)
+        size += len(turn_text) + 1
+        if speaker and speaker not in speakers:
+            speakers.append(speaker)
+
+    if current:
+        chunks.append({"text": "\n".join(current), "speakers": speakers})
+    return chunks
+
+
+# ======================================================================
+# HASHED TERM VECTORS
+# ======================================================================
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def term_counts(text: str) -> Dict[str, int]:
+    """Exact term counts for the BM25 index."""
+    return dict(Counter(tokenize(text)))
+
+
+def hashed_term_vector(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sparse sublinear term frequencies in the hashed space: (indices, weights)."""
+    return hash_tokens(tokenize(text))
+
+
+def hash_tokens(tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    if not tokens:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    hashed = np.fromiter((zlib.crc32(t.encode()) % VECTOR_DIM for t in tokens), dtype=np.int32, count=len(tokens))
+    indices, counts = np.unique(hashed, return_counts=True)
+    return indices.astype(np.int32), (1.0 + np.log(counts)).astype(np.float32)
+
+
+# ======================================================================
+# INGEST-TIME INDEXING
+# ======================================================================
+def ensure_chunk_indexes(db):
+    db[CHUNK_COLLECTION].create_index([("project_id", 1), ("meeting_name", 1), ("chunk_index", 1)])
+
+
+def _index_entry(project_id, project_key, meeting_name, meeting_time, kind, position, text, speakers):
+    indices, weights = hashed_term_vector(text)
+    return {
+        "project_id": project_id,
+        "project_key": project_key,
+        "meeting_name": meeting_name,
+        "meeting_time": meeting_time,
+        "kind": kind,
+        "chunk_index": position,
+        "speakers": speakers,
+        "text": text,
+        "term_idx": Binary(indices.tobytes()),
+        "term_tf": Binary(weights.tobytes()),
+        "terms": term_counts(text)
+    }
+
+
+def bump_content_version(db, project_id: ObjectId):
+    """Invalidate cached chat indexes for a project (see chatbot cache)."""
+    db[RAW_COLLECTION].update_one({"_id": project_id}, {"$inc": {"content_version": 1}})
+
+
+def _replace_entries(
+    db,
+    project_id,
+    meeting_name: str,
+    kind: str,
+    docs: List[Dict[str, Any]],
+    bump_version: bool = True
+):
+    collection = db[CHUNK_COLLECTION]
+    ensure_chunk_indexes(db)
+
+    kind_filter = {"$in": [kind, None]} if kind == KIND_TRANSCRIPT else kind
+    collection.delete_many({"project_id": project_id, "meeting_name": meeting_name, "kind": kind_filter})
+    if docs:
+        collection.insert_many(docs, ordered=False)
+    if bump_version:
+        bump_content_version(db, project_id)
+
+
+def index_meeting_chunks(
+    db,
+    project_id: ObjectId,
+    project_key: str,
+    meeting_name: str,
+    meeting_time: str,
+    transcript: str,
+    bump_version: bool = True
+) -> int:
+    """
+    Chunk a meeting transcript and store the chunks with their term vectors.
+    Re-indexing a meeting replaces its previous chunks and bumps the
+    project's content_version.
+
+    Returns:
+        Number of chunks stored
+    """
+    docs = [
+        _index_entry(project_id, project_key, meeting_name, meeting_time,
+                     KIND_TRANSCRIPT, i, chunk["text"], chunk["speakers"])
+        for i, chunk in enumerate(chunk_transcript(transcript))
+    ]
+    _replace_entries(db, project_id, meeting_name, KIND_TRANSCRIPT, docs, bump_version)
+    return len(docs)
+
+
+def index_summary_points(
+    db,
+    project_id: ObjectId,
+    project_key: str,
+    meeting_name: str,
+    meeting_time: str,
+    summary_points: List[str],
+    bump_version: bool = True
+) -> int:
+    """
+    Index a meeting's summary points, one entry per point.
+    Re-indexing a meeting replaces its previous summary entries and bumps the
+    project's content_version.
+
+    Returns:
+        Number of entries stored
+    """
+    docs = [
+        _index_entry(project_id, project_key, meeting_name, meeting_time,
+                     KIND_SUMMARY, i, point.strip(), [])
+        for i, point in enumerate(summary_points)
+        if point and point.strip()
+    ]
+    _replace_entries(db, project_id, meeting_name, KIND_SUMMARY, docs, bump_version)
+    return len(docs)
+
+
+def format_participant_insight(summary: Dict[str, Any]) -> str:
+    """One participant's analysis (updates, roadblocks, actions) as a line of text."""
+    parts = []
+    for field, label in (("key_updates", "updates"), ("roadblocks", "roadblocks"), ("actionable", "actions")):
+        items = summary.get(field) or []
+        if items:
+            parts.append(f"{label}: {'; '.join(items)}")
+    if not parts:
+        return ""
+    return f"{summary.get('participant_name', 'Unknown')}: {' | '.join(parts)}"
+
+
+def index_participant_insights(
+    db,
+    project_id: ObjectId,
+    project_key: str,
+    meeting_name: str,
+    meeting_time: str,
+    participant_summaries: List[Dict[str, Any]],
+    bump_version: bool = True
+) -> int:
+    """
+    Index a meeting's participant analysis, one entry per participant.
+    Re-indexing a meeting replaces its previous participant entries.
+
+    Returns:
+        Number of entries stored
+    """
+    docs = []
+    for summary in participant_summaries:
+        text = format_participant_insight(summary)
+        if text:
+            docs.append(_index_entry(project_id, project_key, meeting_name, meeting_time,
+                                     KIND_PARTICIPANT, len(docs), text,
+                                     [summary.get("participant_name", "Unknown")]))
+    _replace_entries(db, project_id, meeting_name, KIND_PARTICIPANT, docs, bump_version)
+    return len(docs)
+
+
+def _split_paragraphs(text: str, max_chars: int = CHUNK_MAX_CHARS) -> List[str]:
+    """Group a plain-text document's lines into chunks of about max_chars."""
+    chunks, current, size = [], [], 0
+    for line in (line.strip() for line in text.splitlines()):
+        if not line:
+            continue
+        if current and size + len(line) > max_chars:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def index_project_summary(
+    db,
+    project_id: ObjectId,
+    project_key: str,
+    global_summary: str,
+    last_updated: str = "",
+    bump_version: bool = True
+) -> int:
+    """
+    Index the global project summary in chunks, replacing the previous one.
+
+    Returns:
+        Number of entries stored
+    """
+    docs = [
+        _index_entry(project_id, project_key, PROJECT_SUMMARY_MEETING, last_updated,
+                     KIND_PROJECT_SUMMARY, i, chunk, [])
+        for i, chunk in enumerate(_split_paragraphs(global_summary or ""))
+    ]
+    _replace_entries(db, project_id, PROJECT_SUMMARY_MEETING, KIND_PROJECT_SUMMARY, docs, bump_version)
+    return len(docs)
+
+
+# ======================================================================
+# BACKFILL
+# ======================================================================
+def backfill_project_chunks(db, project_doc: Dict[str, Any]) -> int:
+    """Chunk any of a project's meetings that were ingested before chunking existed."""
+    project_id = project_doc["_id"]
+    indexed = set(db[CHUNK_COLLECTION].distinct(
+        "meeting_name", {"project_id": project_id, "kind": {"$in": [KIND_TRANSCRIPT, None]}}
+    ))
+
+    added = 0
+    for meeting_index, meeting in enumerate(project_doc.get("meetings", [])):
+        meeting_name = meeting.get("meeting_name", "")
+        if meeting_name in indexed:
+            continue
+
+        text = load_transcript_text(db, meeting)
+        if not text and not meeting.get("transcript_ref"):
+            text = load_inline_transcript(db, project_id, meeting_index)
+        if not text:
+            continue
+
+        # No version bump: the index being loaded already includes these
+        added += index_meeting_chunks(
+            db, project_id, project_doc.get("Project_key", ""),
+            meeting_name, meeting.get("meeting_time", ""), text,
+            bump_version=False
+        )
+
+    if added:
+        logger.info(f"Backfilled {added} transcript chunk(s) for project {project_id}")
+    return added
+
+
+def backfill_project_summaries(db, project_doc: Dict[str, Any]) -> int:
+    """
+    Index summary points, participant analyses and the project summary saved
+    before they were indexed at write time.
+    """
+    project_id = project_doc["_id"]
+    project_key = project_doc.get("Project_key", "")
+    times = {m.get("meeting_name"): m.get("meeting_time", "") for m in project_doc.get("meetings", [])}
+
+    def indexed(kind: str) -> set:
+        return set(db[CHUNK_COLLECTION].distinct("meeting_name", {"project_id": project_id, "kind": kind}))
+
+    # No version bumps: the index being loaded already includes these
+    added = 0
+    summaries = db[SUMMARY_COLLECTION].find_one({"project_key": project_key}, {"meetings": 1})
+    if summaries:
+        done = indexed(KIND_SUMMARY)
+        for meeting in summaries.get("meetings", []):
+            meeting_name = meeting.get("meeting_name", "")
+            if meeting_name in done or not meeting.get("summary_points"):
+                continue
+            added += index_summary_points(
+                db, project_id, project_key, meeting_name,
+                times.get(meeting_name, ""), meeting["summary_points"],
+                bump_version=False
+            )
+
+    analyses = db[PARTICIPANT_COLLECTION].find_one({"project_key": project_key}, {"meetings": 1})
+    if analyses:
+        done = indexed(KIND_PARTICIPANT)
+        for meeting in analyses.get("meetings", []):
+            meeting_name = meeting.get("meeting_name", "")
+            if meeting_name in done or not meeting.get("participant_summaries"):
+                continue
+            added += index_participant_insights(
+                db, project_id, project_key, meeting_name,
+                times.get(meeting_name, ""), meeting["participant_summaries"],
+                bump_version=False
+            )
+
+    if not indexed(KIND_PROJECT_SUMMARY):
+        project_summary = db[PROJECT_SUMMARY_COLLECTION].find_one(
+            {"project_key": project_key}, {"global_summary": 1, "last_updated": 1}
+        )
+        if project_summary and project_summary.get("global_summary"):
+            added += index_project_summary(
+                db, project_id, project_key, project_summary["global_summary"],
+                project_summary.get("last_updated", ""), bump_version=False
+            )
+
+    if added:
+        logger.info(f"Backfilled {added} summary entr(ies) for project {project_id}")
+    return added
+
+
+def needs_backfill(project_doc: Dict[str, Any]) -> bool:
+    return project_doc.get(BACKFILL_FIELD, 0) < BACKFILL_VERSION
+
+
+def mark_needs_backfill(db, project_id: ObjectId):
+    """Flag a project for backfill after a write-time index update failed."""
+    db[RAW_COLLECTION].update_one({"_id": project_id}, {"$unset": {BACKFILL_FIELD: ""}})
+
+
+def backfill_project(db, project_doc: Dict[str, Any]) -> int:
+    """
+    Index a project's records saved before write-time indexing, once. The
+    project is then marked so later index loads skip the backfill scans.
+    """
+    if not needs_backfill(project_doc):
+        return 0
+
+    added = backfill_project_chunks(db, project_doc) + backfill_project_summaries(db, project_doc)
+    db[RAW_COLLECTION].update_one({"_id": project_doc["_id"]}, {"$set": {BACKFILL_FIELD: BACKFILL_VERSION}})
+    return added
@@ -0,0 +1,298 @@
+"""
+Concurrent SMTP delivery for OrbitMeetAI emails.
+
+Messages are sent from a bounded thread pool that shares a small pool of
+authenticated SMTP sessions. The session pool lives at module level, one per
+settings, so consecutive delivery runs reuse logged-in sessions; a session
+left idle for a while is checked with NOOP before it is handed out again.
+Each message is retried with exponential backoff on transient failures (a
+failed session is discarded and reopened), and every delivery run returns
+throughput metrics.
+
+Configuration (environment):
+    SMTP_SERVER, SMTP_PORT, SMTP_EMAIL, SMTP_PASSWORD   as before
+    SMTP_USE_SSL          "false" to connect in plain text (e.g. port 587); the
+                          session is upgraded with STARTTLS before logging in
+    SMTP_POOL_SIZE        sessions / parallel senders (default 4)
+    SMTP_MAX_RETRIES      retries per message after the first attempt (default 2)
+    SMTP_RETRY_BACKOFF    base backoff in seconds (default 1.0)
+
+For local testing, run `python -m aiosmtpd -n -l localhost:8025` and set
+SMTP_SERVER=localhost, SMTP_PORT=8025, SMTP_USE_SSL=false, SMTP_PASSWORD=""
+(no password, so no login and no STARTTLS).
+"""
+import os
+import ssl
+import time
+import queue
+import asyncio
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+# Idle sessions older than this are checked with NOOP before reuse; servers
+# commonly drop sessions that sit idle for a few minutes
+IDLE_CHECK_SECONDS = 30.0
+
+
+# ======================================================================
+# SETTINGS
+# ======================================================================
+def smtp_settings_from_env() -> Dict[str, Any]:
+    """Read SMTP delivery settings from the environment."""
+    return {
+        "server": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+        "port": int(os.getenv("SMTP_PORT", 465)),
+        "email": os.getenv("SMTP_EMAIL"),
+        "password": os.getenv("SMTP_PASSWORD"),
+        "use_ssl": os.getenv("SMTP_USE_SSL", "true").lower() != "false",
+        "pool_size": max(1, int(os.getenv("SMTP_POOL_SIZE", 4))),
+        "max_retries": max(0, int(os.getenv("SMTP_MAX_RETRIES", 2))),
+        "retry_backoff": float(os.getenv("SMTP_RETRY_BACKOFF", 1.0)),
+    }
+
+
+# ======================================================================
+# CONNECTION POOL
+# ======================================================================
+class SMTPConnectionPool:
+    """
+    Lazily opens up to `size` authenticated SMTP sessions and hands them out
+    to sender threads. Broken sessions are closed and replaced on demand.
+    """
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings = settings
+        self.size = settings["pool_size"]
+        # (session, monotonic time it was released)
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        s = self.settings
+        if s["use_ssl"]:
+            conn = smtplib.SMTP_SSL(s["server"], s["port"], context=ssl.create_default_context())
+        else:
+            conn = smtplib.SMTP(s["server"], s["port"])
+        if s["password"]:
+            try:
+                if not s["use_ssl"]:
+                    # Never send the password in plain text; fails if the server lacks STARTTLS
+                    conn.starttls(context=ssl.create_default_context())
+                conn.login(s["email"], s["password"])
+            except Exception:
+                conn.close()
+                raise
+        return conn
+
+    def _usable(self, idle: Tuple[smtplib.SMTP, float]) -> bool:
+        """False (and the session discarded) if a long-idle session has gone stale."""
+        conn, released_at = idle
+        if time.monotonic() - released_at < IDLE_CHECK_SECONDS:
+            return True
+        try:
+            if conn.noop()[0] == 250:
+                return True
+        except (smtplib.SMTPException, OSError):
+            pass
+        self.release(conn, broken=True)
+        return False
+
+    def acquire(self) -> smtplib.SMTP:
+        while True:
+            try:
+                idle = self._idle.get_nowait()
+                if self._usable(idle):
+                    return idle[0]
+                continue
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                break
+
+            # Pool exhausted: wait for a session to come back (or a slot to free up)
+            try:
+                idle = self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if self._usable(idle):
+                return idle[0]
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def release(self, conn: smtplib.SMTP, broken: bool = False):
+        if not broken:
+            self._idle.put((conn, time.monotonic()))
+            return
+
+        with self._lock:
+            self._opened -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.quit()
+            except Exception:
+                conn.close()
+        with self._lock:
+            self._opened = 0
+
+
+_pools: Dict[Tuple, SMTPConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(settings: Dict[str, Any]) -> SMTPConnectionPool:
+    """Shared session pool for these settings, created on first use."""
+    key = tuple(sorted(settings.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SMTPConnectionPool(dict(settings))
+        return pool
+
+
+def close_connection_pools():
+    """Log out of every pooled session (e.g. on shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# ======================================================================
+# MESSAGE BUILDING
+# ======================================================================
+def build_message(sender: str, to_email: str, subject: str, html: str) -> str:
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = f"OrbitMeetAI <{sender}>"
+    msg["To"] = to_email
+    msg["Reply-To"] = sender  # Set reply-to to avoid no-reply issues
+    msg.attach(MIMEText(html, "html"))
+    return msg.as_string()
+
+
+# ======================================================================
+# DELIVERY
+# ======================================================================
+def _send_with_retry(pool: SMTPConnectionPool, message: Dict[str, str], stats: Dict[str, Any], stats_lock):
+    settings = pool.settings
+    sender = settings["email"]
+    try:
+        payload = build_message(sender, message["to"], message["subject"], message["html"])
+    except Exception as e:
+        logger.error(f"Could not build email to {message['to']}: {e}")
+        return False, str(e)
+
+    last_error = None
+    for attempt in range(settings["max_retries"] + 1):
+        if attempt:
+            time.sleep(settings["retry_backoff"] * (2 ** (attempt - 1)))
+            with stats_lock:
+                stats["retries"] += 1
+
+        conn = None
+        try:
+            conn = pool.acquire()
+            conn.sendmail(sender, message["to"], payload)
+            pool.release(conn)
+            return True, None
+        except smtplib.SMTPRecipientsRefused as e:
+            # Permanent for this recipient; the session itself is fine
+            pool.release(conn)
+            return False, str(e)
+        except (smtplib.SMTPException, OSError) as e:
+            last_error = e
+            if conn is not None:
+                pool.release(conn, broken=True)
+            logger.warning(f"SMTP send to {message['to']} failed (attempt {attempt + 1}): {e}")
+        except Exception as e:
+            # Not a delivery problem (e.g. an address that can't be encoded): retrying
+            # won't help, and the rest of the batch must still go out
+            if conn is not None:
+                pool.release(conn, broken=True)
+            logger.error(f"SMTP send to {message['to']} failed: {e}")
+            return False, str(e)
+
+    return False, str(last_error)
+
+
+def deliver_emails(messages: List[Dict[str, str]], settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Send messages concurrently over the shared pool of SMTP sessions for
+    these settings; the sessions stay open for the next run.
+
+    Args:
+        messages: dicts with "to", "subject" and "html"
+        settings: SMTP settings, defaults to smtp_settings_from_env()
+
+    Returns:
+        Dictionary with delivered / failed recipients and throughput metrics
+    """
+    settings = settings or smtp_settings_from_env()
+    pool = get_connection_pool(settings)
+
+    stats = {"retries": 0}
+    stats_lock = threading.Lock()
+    delivered: List[str] = []
+    failed: List[Dict[str, str]] = []
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix="smtp") as executor:
+        futures = [
+            (message, executor.submit(_send_with_retry, pool, message, stats, stats_lock))
+            for message in messages
+        ]
+        for message, future in futures:
+            ok, error = future.result()
+            if ok:
+                delivered.append(message["to"])
+            else:
+                failed.append({"to": message["to"], "error": error})
+    elapsed = time.perf_counter() - started
+
+    metrics = {
+        "messages": len(messages),
+        "delivered": len(delivered),
+        "failed": len(failed),
+        "retries": stats["retries"],
+        "pool_size": pool.size,
+        "elapsed_seconds": round(elapsed, 3),
+        "messages_per_second": round(len(delivered) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+    logger.info(f"SMTP delivery: {metrics['delivered']}/{metrics['messages']} sent in "
+                f"{metrics['elapsed_seconds']}s ({metrics['messages_per_second']} msg/s, "
+                f"{metrics['retries']} retries, {metrics['failed']} failed)")
+
+    return {"delivered": delivered, "failed": failed, "metrics": metrics}
+
+
+async def adeliver_emails(messages: List[Dict[str, str]], settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Async wrapper that runs `deliver_emails` off the event loop."""
+    return await asyncio.to_thread(deliver_emails, messages, settings)
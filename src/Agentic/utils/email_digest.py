@@ -0,0 +1,99 @@
+"""
+Per-recipient email digests for scheduler batches.
+
+In digest mode the orchestrator's email step returns rendered meeting
+sections instead of sending them. The scheduler adds those sections to the
+process-wide `email_digest` buffer and flushes it at the end of each run (or
+every EMAIL_DIGEST_WINDOW_MINUTES), so each person receives one combined
+email per flush instead of one email per meeting.
+
+Sections for recipients whose email could not be delivered stay queued for
+the next flush, up to EMAIL_DIGEST_MAX_ATTEMPTS flushes (default 5).
+"""
+import os
+import threading
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from src.Agentic.utils.email_templates import render_digest_email
+from src.Agentic.utils.email_delivery import deliver_emails
+
+max_flush_attempts = max(1, int(os.getenv("EMAIL_DIGEST_MAX_ATTEMPTS", 5)))
+
+
+class EmailDigest:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, digest_items: List[Dict[str, str]]):
+        """Queue rendered sections ({"to", "name", "html"}) per recipient."""
+        with self._lock:
+            for item in digest_items:
+                entry = self._pending.setdefault(
+                    item["to"].lower(),
+                    {"to": item["to"], "name": item["name"], "sections": [], "attempts": 0}
+                )
+                entry["sections"].append(item["html"])
+
+    def _requeue(self, entries: List[Dict[str, Any]]):
+        """Put undelivered entries back, ahead of sections queued since the flush."""
+        with self._lock:
+            for entry in entries:
+                if entry["attempts"] >= max_flush_attempts:
+                    logger.error(f"Dropping {len(entry['sections'])} digest section(s) for {entry['to']} "
+                                 f"after {entry['attempts']} failed flushes")
+                    continue
+                newer = self._pending.get(entry["to"].lower())
+                if newer:
+                    entry["sections"].extend(newer["sections"])
+                self._pending[entry["to"].lower()] = entry
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Send one combined email per queued recipient and clear the buffer.
+        Recipients whose email failed stay queued for the next flush.
+
+        Returns:
+            deliver_emails() result, or an empty result when nothing is queued
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending = {}
+
+        if not pending:
+            return {"delivered": [], "failed": [], "metrics": {"messages": 0}}
+
+        messages = []
+        for entry in pending:
+            count = len(entry["sections"])
+            subject = f"OrbitMeetAI Digest: {count} meeting summar{'y' if count == 1 else 'ies'}"
+            messages.append({
+                "to": entry["to"],
+                "subject": subject,
+                "html": render_digest_email(entry["name"], subject, entry["sections"])
+            })
+
+        sections = sum(len(entry["sections"]) for entry in pending)
+        logger.info(f"Flushing email digest: {sections} meeting section(s) to {len(messages)} recipient(s)")
+        for entry in pending:
+            entry["attempts"] += 1
+
+        try:
+            result = deliver_emails(messages)
+        except Exception:
+            self._requeue(pending)
+            raise
+
+        failed = {failure["to"].lower() for failure in result["failed"]}
+        self._requeue([entry for entry in pending if entry["to"].lower() in failed])
+        return result
+
+
+# Process-wide digest buffer shared by scheduler runs
+email_digest = EmailDigest()
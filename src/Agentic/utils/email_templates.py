@@ -0,0 +1,224 @@
+"""
+Precompiled Jinja2 templates for OrbitMeetAI meeting emails.
+
+Templates are compiled once when this module is imported. A meeting email is
+rendered once per audience (participants / executives); the only
+per-recipient field, the receiver name, is left as a placeholder and filled
+in with `personalize`, so sending to N people costs N string substitutions
+rather than N template renders.
+
+Participant recipients get only their own analysis card: cards are rendered
+once per participant and swapped into the participant body by `personalize`.
+
+Digest mode renders the same content as a per-meeting section instead of a
+full email; `render_digest_email` later combines one recipient's sections.
+"""
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, List
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+# ======================================================================
+# TEMPLATE ENVIRONMENT (compiled once)
+# ======================================================================
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False
+)
+
+meeting_template = _env.get_template("meeting_email.html")
+participant_section_template = _env.get_template("participant_section.html")
+executive_section_template = _env.get_template("executive_section.html")
+digest_section_template = _env.get_template("digest_section.html")
+digest_template = _env.get_template("digest_email.html")
+
+# Markers substituted per recipient after the audience body has been rendered
+RECEIVER_PLACEHOLDER = "__ORBIT_RECEIVER_NAME__"
+PARTICIPANT_SECTION_PLACEHOLDER = "__ORBIT_PARTICIPANT_SECTION__"
+
+AUDIENCE_PARTICIPANT = "participant"
+AUDIENCE_EXECUTIVE = "executive"
+
+
+# ======================================================================
+# SECTION FORMATTERS
+# ======================================================================
+def to_bullets(text: str) -> Markup:
+    """Convert newline-separated text into an HTML bullet list."""
+    items = [
+        Markup("<li>{}</li>").format(line.strip())
+        for line in text.split("\n")
+        if line.strip()
+    ]
+    return Markup("<ul>") + Markup("").join(items) + Markup("</ul>")
+
+
+def parse_participant_analysis(participant_text: str) -> List[Dict[str, Any]]:
+    """
+    Parses participant analysis text into card dictionaries.
+    Expected format per line: "Name | Updates: ... Roadblocks: ... Actionable: ..."
+    """
+    cards = []
+    for line in participant_text.split("\n"):
+        if not line.strip() or " | " not in line:
+            continue
+
+        participant_name, rest = line.split(" | ", 1)
+        rest = rest.strip()
+
+        updates = []
+        roadblocks = []
+        actionable = []
+
+        updates_match = re.search(r'Updates:\s*(.+?)(?:\s+Roadblocks:|$)', rest, re.IGNORECASE)
+        if updates_match:
+            updates = [u.strip() for u in updates_match.group(1).split(",") if u.strip()]
+
+        roadblocks_match = re.search(r'Roadblocks:\s*(.+?)(?:\s+Actionable:|$)', rest, re.IGNORECASE)
+        if roadblocks_match:
+            roadblocks = [r.strip() for r in roadblocks_match.group(1).split(",") if r.strip()]
+
+        actionable_match = re.search(r'Actionable:\s*(.+?)$', rest, re.IGNORECASE)
+        if actionable_match:
+            actionable = [a.strip() for a in actionable_match.group(1).split(",") if a.strip()]
+
+        # Skip if no data found
+        if not (updates or roadblocks or actionable):
+            continue
+
+        cards.append({
+            "name": participant_name.strip(),
+            "updates": updates,
+            "roadblocks": roadblocks,
+            "actionable": actionable
+        })
+
+    return cards
+
+
+def cards_from_summaries(participant_summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build cards from structured UserSummary dictionaries."""
+    cards = []
+    for ps in participant_summaries:
+        card = {
+            "name": ps.get("participant_name", ""),
+            "updates": ps.get("key_updates", []),
+            "roadblocks": ps.get("roadblocks", []),
+            "actionable": ps.get("actionable", [])
+        }
+        if card["updates"] or card["roadblocks"] or card["actionable"]:
+            cards.append(card)
+    return cards
+
+
+def format_participant_section(cards: List[Dict[str, Any]]) -> Markup:
+    """Render participant cards into the participant analysis section."""
+    if not cards:
+        return Markup("")
+    return Markup(participant_section_template.render(cards=cards))
+
+
+def render_participant_sections(cards: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Render a single-card participant section per participant, keyed by card name."""
+    return {card["name"]: str(format_participant_section([card])) for card in cards}
+
+
+def format_global_summary(global_text: str) -> Markup:
+    """Render the executive project summary section."""
+    if not global_text or not global_text.strip():
+        return Markup("")
+
+    formatted = global_text.strip().replace("\n\n", "\n")
+    return Markup(executive_section_template.render(global_summary=formatted))
+
+
+# ======================================================================
+# AUDIENCE RENDERING
+# ======================================================================
+def render_audience_bodies(
+    meeting_name: str,
+    project_name: str,
+    meeting_text: str,
+    global_text: str
+) -> Dict[str, str]:
+    """
+    Render the meeting email once per audience.
+
+    Returns:
+        {"participant": html, "executive": html}, each still containing
+        RECEIVER_PLACEHOLDER (and, for participants, the participant section
+        placeholder) for `personalize`.
+    """
+    common = {
+        "receiver_name": Markup(RECEIVER_PLACEHOLDER),
+        "subject": meeting_name,
+        "project_name": project_name,
+        "meeting_summary": to_bullets(meeting_text),
+        "year": datetime.now().year
+    }
+
+    return {
+        AUDIENCE_PARTICIPANT: meeting_template.render(
+            participant_section=Markup(PARTICIPANT_SECTION_PLACEHOLDER),
+            executive_section="",
+            **common
+        ),
+        AUDIENCE_EXECUTIVE: meeting_template.render(
+            participant_section="",
+            executive_section=format_global_summary(global_text),
+            **common
+        )
+    }
+
+
+def render_digest_sections(
+    meeting_name: str,
+    project_name: str,
+    meeting_text: str,
+    global_text: str
+) -> Dict[str, str]:
+    """
+    Render a meeting's digest section once per audience, with the same
+    placeholders as `render_audience_bodies`.
+    """
+    common = {
+        "meeting_name": meeting_name,
+        "project_name": project_name,
+        "meeting_summary": to_bullets(meeting_text)
+    }
+
+    return {
+        AUDIENCE_PARTICIPANT: digest_section_template.render(
+            participant_section=Markup(PARTICIPANT_SECTION_PLACEHOLDER),
+            executive_section="",
+            **common
+        ),
+        AUDIENCE_EXECUTIVE: digest_section_template.render(
+            participant_section="",
+            executive_section=format_global_summary(global_text),
+            **common
+        )
+    }
+
+
+def render_digest_email(receiver_name: str, subject: str, sections: List[str]) -> str:
+    """Combine one recipient's pre-rendered meeting sections into a single email."""
+    return digest_template.render(
+        receiver_name=receiver_name,
+        subject=subject,
+        sections=[Markup(section) for section in sections],
+        year=datetime.now().year
+    )
+
+
+def personalize(body: str, receiver_name: str, participant_section: str = "") -> str:
+    """Fill the per-recipient fields of a pre-rendered audience body."""
+    return body\
+        .replace(RECEIVER_PLACEHOLDER, str(escape(receiver_name)))\
+        .replace(PARTICIPANT_SECTION_PLACEHOLDER, participant_section)
@@ -0,0 +1,136 @@
+"""
+Content-addressed cache of extracted transcript text and metadata.
+
+Entries are keyed by the SHA-256 of the source file's bytes, so a file is
+parsed once no matter how many ingest paths look at it (project-key lookup,
+upload, startup reconciliation), and renamed or copied files hit the same
+entry. File hashes are memoised per (path, size, mtime) so repeated lookups
+cost a stat().
+
+The in-memory tier is a bounded LRU. Setting EXTRACTION_CACHE_DIR adds a
+gzip-compressed JSON tier on disk that survives restarts.
+
+Configuration (environment):
+    EXTRACTION_CACHE_SIZE   in-memory entries (default 256)
+    EXTRACTION_CACHE_DIR    directory for the disk tier (default: disabled)
+"""
+import os
+import gzip
+import json
+import tempfile
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from src.Agentic.utils.ingest_manifest import file_sha256
+
+# Bump when extraction/parsing changes so stale disk entries are ignored
+CACHE_VERSION = 1
+
+
+class ExtractionCache:
+    def __init__(self, max_entries: int = 256, disk_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._file_hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    # ---------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------
+    def file_key(self, path) -> str:
+        """SHA-256 of a file, recomputed only when its size or mtime changes."""
+        path = str(Path(path).resolve())
+        stat = os.stat(path)
+        with self._lock:
+            known = self._file_hashes.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+
+        digest = file_sha256(Path(path))
+        with self._lock:
+            self._file_hashes[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    # ---------------------------------------------------------
+    # Tiers
+    # ---------------------------------------------------------
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json.gz"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable extraction cache entry {path.name}: {e}")
+            return None
+        if data.get("version") != CACHE_VERSION:
+            return None
+        return data["entry"]
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]):
+        path = self._disk_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "entry": entry}, f)
+            os.replace(tmp, path)
+        except Exception as e:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            logger.warning(f"Could not write extraction cache entry {path.name}: {e}")
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry
+
+        if self.disk_dir is not None:
+            entry = self._read_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+                return entry
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        self._remember(key, entry)
+        if self.disk_dir is not None:
+            self._write_disk(key, entry)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.disk_dir is not None and self._disk_path(key).exists()
+
+
+# Process-wide cache shared by every ingest path
+extraction_cache = ExtractionCache(
+    max_entries=max(1, int(os.getenv("EXTRACTION_CACHE_SIZE", 256))),
+    disk_dir=os.getenv("EXTRACTION_CACHE_DIR") or None
+)
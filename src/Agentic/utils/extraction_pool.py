@@ -0,0 +1,168 @@
+"""
+Process-pool text extraction for bulk transcript ingest.
+
+docx2txt and pdfminer are pure-Python and CPU bound, so extracting many files
+in one process uses a single core and (when called from the ingest job)
+blocks the event loop. `extract_files` fans files out over a small set of
+worker processes instead.
+
+Each file has its own deadline, counted from when a worker starts it. A
+worker that misses its deadline (a pathological PDF, for example) is killed
+and replaced straight away, and a worker that crashes is replaced the same
+way, so a bad file fails on its own without holding a worker slot for the
+rest of the batch.
+
+Configuration (environment):
+    INGEST_WORKERS         worker processes (default: CPU count)
+    INGEST_FILE_TIMEOUT    seconds allowed per file (default 120)
+"""
+import os
+import time
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from loguru import logger
+
+from src.Agentic.utils.store_to_mongodb import extract_transcripts
+
+DEFAULT_WORKERS = max(1, int(os.getenv("INGEST_WORKERS", os.cpu_count() or 1)))
+DEFAULT_FILE_TIMEOUT = float(os.getenv("INGEST_FILE_TIMEOUT", 120))
+
+# Recycle workers periodically so parser memory growth can't accumulate
+MAX_TASKS_PER_CHILD = 50
+
+
+def _worker_main(conn: Connection):
+    """Worker loop: extract each path received on `conn` until it receives None."""
+    while True:
+        path = conn.recv()
+        if path is None:
+            return
+        try:
+            conn.send(("text", extract_transcripts([path])))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    """One extraction process and the file it is working on."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        self.path: Optional[str] = None
+        self.deadline = 0.0
+        self.tasks = 0
+
+    def submit(self, path: str, timeout: float):
+        self.conn.send(path)
+        self.path = path
+        self.deadline = time.monotonic() + timeout
+        self.tasks += 1
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def extract_files(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract transcript text from many files in parallel.
+
+    Args:
+        paths: files to extract
+        workers: worker processes, defaults to INGEST_WORKERS
+        timeout: seconds allowed per file, defaults to INGEST_FILE_TIMEOUT
+
+    Returns:
+        {str(path): {"text": str} or {"error": str}} for every input path
+    """
+    paths = [str(p) for p in paths]
+    if not paths:
+        return {}
+
+    workers = min(workers or DEFAULT_WORKERS, len(paths))
+    timeout = timeout or DEFAULT_FILE_TIMEOUT
+    results: Dict[str, Dict[str, Any]] = {}
+
+    context = multiprocessing.get_context()
+    queued = deque(paths)
+    idle = [_Worker(context) for _ in range(workers)]
+    busy: Dict[Connection, _Worker] = {}
+
+    def replace_worker():
+        # Stand in for a killed or recycled worker, if there is still work for it
+        if queued:
+            idle.append(_Worker(context))
+
+    started = time.perf_counter()
+    try:
+        while queued or busy:
+            while queued and idle:
+                worker = idle.pop()
+                worker.submit(queued.popleft(), timeout)
+                busy[worker.conn] = worker
+
+            next_deadline = min(worker.deadline for worker in busy.values())
+            for conn in wait(list(busy), timeout=max(0.0, next_deadline - time.monotonic())):
+                worker = busy.pop(conn)
+                try:
+                    kind, value = conn.recv()
+                except (EOFError, OSError):
+                    # The worker died mid-task (e.g. a parser crashed the interpreter)
+                    results[worker.path] = {"error": "extraction worker crashed"}
+                    logger.error(f"Extraction of {Path(worker.path).name} crashed its worker")
+                    worker.kill()
+                    replace_worker()
+                    continue
+
+                results[worker.path] = {kind: value}
+                if kind == "error":
+                    logger.error(f"Extraction of {Path(worker.path).name} failed: {value}")
+                if worker.tasks >= MAX_TASKS_PER_CHILD:
+                    worker.stop()
+                    replace_worker()
+                else:
+                    idle.append(worker)
+
+            now = time.monotonic()
+            for conn, worker in list(busy.items()):
+                if now >= worker.deadline:
+                    # Hung parser: kill it now so its slot goes to the next file
+                    del busy[conn]
+                    results[worker.path] = {"error": f"extraction timed out after {timeout:.0f}s"}
+                    logger.error(f"Extraction of {Path(worker.path).name} timed out")
+                    worker.kill()
+                    replace_worker()
+    finally:
+        for worker in busy.values():
+            worker.kill()
+        for worker in idle:
+            worker.stop()
+
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for r in results.values() if "error" in r)
+    logger.info(f"Extracted {len(paths) - failed}/{len(paths)} file(s) with {workers} worker(s) "
+                f"in {elapsed:.2f}s ({failed} failed)")
+    return results
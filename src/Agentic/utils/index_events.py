@@ -0,0 +1,228 @@
+"""
+Write-time index updates for summaries.
+
+save_summaries_to_mongo and save_project_summary_to_mongo emit an index
+event instead of indexing inline. A single background thread collects
+events into batches (up to INDEX_BATCH_SIZE, or whatever arrived within
+INDEX_BATCH_WAIT_SECONDS of the first), computes the term vectors and BM25
+counts for every entry, and writes them to Transcript_chunks next to the
+text they describe. Query paths then only read precomputed entries.
+
+Per batch, repeated events for the same record keep only the latest, each
+project is looked up once, and each project's content_version is bumped
+once (invalidating cached chat indexes and answers).
+
+The thread starts on the first event. flush() waits for queued events to be
+written; the FastAPI lifespan calls it on shutdown, and scripts that run the
+pipeline without the API flush at exit.
+
+Configuration (environment):
+    INDEX_BATCH_SIZE          events per batch (default 32)
+    INDEX_BATCH_WAIT_SECONDS  time to gather a batch (default 0.5)
+    INDEX_FLUSH_TIMEOUT_SECONDS  longest wait for pending events at exit (default 30)
+"""
+import os
+import time
+import queue
+import atexit
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import certifi
+from loguru import logger
+from pymongo import MongoClient
+
+from src.Agentic.utils.chunk_index import (
+    RAW_COLLECTION,
+    index_summary_points,
+    index_participant_insights,
+    index_project_summary,
+    bump_content_version,
+    mark_needs_backfill
+)
+
+
+DB_NAME = "OMNI_MEET_DB"
+
+EVENT_SUMMARY = "summary"
+EVENT_PARTICIPANTS = "participants"
+EVENT_PROJECT_SUMMARY = "project_summary"
+
+
+class IndexEventWorker:
+    def __init__(
+        self,
+        mongo_uri: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        batch_wait_seconds: Optional[float] = None
+    ):
+        self.mongo_uri = mongo_uri or os.getenv("MONGO_URI")
+        self.batch_size = batch_size or int(os.getenv("INDEX_BATCH_SIZE", 32))
+        self.batch_wait_seconds = batch_wait_seconds if batch_wait_seconds is not None else float(
+            os.getenv("INDEX_BATCH_WAIT_SECONDS", 0.5)
+        )
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._client: Optional[MongoClient] = None
+
+        # Events emitted but not yet written, for flush()
+        self._pending = 0
+        self._idle = threading.Condition()
+
+        self._stats = {"events": 0, "batches": 0, "entries": 0, "errors": 0}
+
+    # ---------------------------------------------------------
+    # Producer side
+    # ---------------------------------------------------------
+    def emit(self, kind: str, project_key: str, meeting_name: Optional[str] = None, **payload):
+        """Queue an index update; returns immediately."""
+        with self._idle:
+            self._pending += 1
+        self._queue.put({"kind": kind, "project_key": project_key, "meeting_name": meeting_name, **payload})
+        self._ensure_started()
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="index-events", daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been written.
+
+        Returns:
+            False if events were still pending when the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    logger.warning(f"Index events still pending at flush timeout: {self._pending}")
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._idle:
+            return {**self._stats, "pending": self._pending}
+
+    # ---------------------------------------------------------
+    # Consumer side
+    # ---------------------------------------------------------
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                with self._idle:
+                    self._stats["errors"] += len(batch)
+                logger.error(f"Index event batch failed ({len(batch)} event(s)): {e}")
+            finally:
+                with self._idle:
+                    self._pending -= len(batch)
+                    self._idle.notify_all()
+
+    def _db(self):
+        if self._client is None:
+            self._client = MongoClient(self.mongo_uri, tls=True, tlsCAFile=certifi.where())
+        return self._client[DB_NAME]
+
+    def _process_batch(self, batch: List[Dict[str, Any]]):
+        db = self._db()
+
+        # Latest event per record wins
+        latest: Dict[Tuple[str, str, Optional[str]], Dict[str, Any]] = {}
+        for event in batch:
+            latest[(event["kind"], event["project_key"], event["meeting_name"])] = event
+
+        projects: Dict[str, Optional[Dict[str, Any]]] = {}
+        touched = set()
+        entries = errors = 0
+
+        for event in latest.values():
+            project_key = event["project_key"]
+            if project_key not in projects:
+                projects[project_key] = db[RAW_COLLECTION].find_one(
+                    {"Project_key": project_key},
+                    {"_id": 1, "meetings.meeting_name": 1, "meetings.meeting_time": 1}
+                )
+            project = projects[project_key]
+            if not project:
+                # Summaries for a project not ingested into Raw_Transcripts (e.g. /process-meeting)
+                continue
+
+            meeting_time = next(
+                (m.get("meeting_time", "") for m in project.get("meetings", [])
+                 if m.get("meeting_name") == event["meeting_name"]),
+                ""
+            )
+            try:
+                entries += self._index(db, project["_id"], project_key, meeting_time, event)
+                touched.add(project["_id"])
+            except Exception as e:
+                errors += 1
+                logger.warning(f"Could not index {event['kind']} for '{project_key}': {e}")
+                # The next chat index load picks up what was missed
+                mark_needs_backfill(db, project["_id"])
+
+        for project_id in touched:
+            bump_content_version(db, project_id)
+
+        with self._idle:
+            self._stats["events"] += len(batch)
+            self._stats["batches"] += 1
+            self._stats["entries"] += entries
+            self._stats["errors"] += errors
+
+        logger.info(f"Indexed {entries} entr(ies) from {len(batch)} event(s) across {len(touched)} project(s)")
+
+    @staticmethod
+    def _index(db, project_id, project_key: str, meeting_time: str, event: Dict[str, Any]) -> int:
+        kind = event["kind"]
+        if kind == EVENT_SUMMARY:
+            return index_summary_points(
+                db, project_id, project_key, event["meeting_name"], meeting_time,
+                event["summary_points"], bump_version=False
+            )
+        if kind == EVENT_PARTICIPANTS:
+            return index_participant_insights(
+                db, project_id, project_key, event["meeting_name"], meeting_time,
+                event["participant_summaries"], bump_version=False
+            )
+        if kind == EVENT_PROJECT_SUMMARY:
+            return index_project_summary(
+                db, project_id, project_key, event["global_summary"],
+                event.get("last_updated", ""), bump_version=False
+            )
+        raise ValueError(f"Unknown index event kind: {kind}")
+
+
+FLUSH_TIMEOUT_SECONDS = float(os.getenv("INDEX_FLUSH_TIMEOUT_SECONDS", 30))
+
+# Process-wide worker used by the summary-saving tools
+index_events = IndexEventWorker()
+
+
+@atexit.register
+def _flush_at_exit():
+    index_events.flush(timeout=FLUSH_TIMEOUT_SECONDS)
@@ -0,0 +1,120 @@
+"""
+Persisted manifest of transcript files already handled by transcript_to_mongo.
+
+Each entry records a file's size, mtime and SHA-256 along with the ingest
+outcome. A file whose size and mtime are unchanged is skipped with a single
+stat(); if only the mtime moved (copied or touched), the bytes are hashed and
+compared before the file is treated as new. Nothing is ever parsed to decide
+whether a file was seen before.
+
+The manifest is a JSON file (default: `.ingest_manifest.json` in the
+transcripts directory) rewritten atomically after each change.
+"""
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+MANIFEST_FILENAME = ".ingest_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> "IngestManifest":
+        if not self.path.exists():
+            return self
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.entries = data.get("files", {})
+            logger.info(f"Loaded ingest manifest with {len(self.entries)} file(s) from {self.path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ingest manifest {self.path}: {e}")
+            self.entries = {}
+        return self
+
+    def save(self):
+        with self._lock:
+            payload = json.dumps({"version": MANIFEST_VERSION, "files": self.entries}, indent=2)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".manifest-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ---------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------
+    def lookup(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Return the manifest entry if this exact file content was handled
+        before, otherwise None (also if the file has been deleted since it
+        was listed).
+        """
+        key = str(Path(file_path).resolve())
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(key)
+            if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+                return entry
+
+            # Touched or copied over: compare content before treating it as new
+            if stat.st_size == entry["size"] and file_sha256(Path(key)) == entry["sha256"]:
+                with self._lock:
+                    entry["mtime_ns"] = stat.st_mtime_ns
+                return entry
+        except FileNotFoundError:
+            pass
+        return None
+
+    def record(self, file_path: Path, status: str, sha256: Optional[str] = None, **fields):
+        """Record a handled file's current size, mtime and hash."""
+        path = Path(file_path).resolve()
+        stat = os.stat(path)
+        with self._lock:
+            self.entries[str(path)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha256 or file_sha256(path),
+                "status": status,
+                "recorded_at": datetime.now().isoformat(timespec="seconds"),
+                **fields
+            }
+
+    def forget_missing(self) -> int:
+        """Drop entries for files that no longer exist."""
+        with self._lock:
+            missing = [key for key in self.entries if not os.path.exists(key)]
+            for key in missing:
+                del self.entries[key]
+        return len(missing)
@@ -0,0 +1,199 @@
+"""
+Cached, indexed participant directory used for email routing.
+
+The participant CSV (EmployeeName, EmployeeEmail, Department, Role) is parsed
+once per process into `Participant` records, indexed by name and email, and
+split into executives and non-executives. It is only re-read when the file's
+mtime changes, so sending a meeting's emails does no file I/O beyond a stat().
+
+`resolve_recipients` maps the names found in a transcript onto directory
+entries (fuzzy, since transcripts spell names loosely) and adds the
+executives of the project's department (the attendees' most common one).
+"""
+import os
+import csv
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from rapidfuzz import fuzz, process
+
+from src.Agentic.utils.pydantic_schemas import Participant
+
+# Roles that receive the executive project summary instead of participant cards
+EXEC_ROLES = {
+    "manager", "senior manager", "director",
+    "vp", "vice president", "chief",
+    "head", "lead"
+}
+
+
+# Minimum token_sort_ratio for a transcript name to match a directory name
+NAME_MATCH_THRESHOLD = 85
+
+
+def normalize_name(name: str) -> str:
+    """Lower-case and collapse whitespace for name lookups."""
+    return " ".join(name.lower().split())
+
+
+def fuzzy_lookup(name: str, mapping: Dict[str, Any], threshold: int = NAME_MATCH_THRESHOLD) -> Optional[Any]:
+    """
+    Look up a name in a dict keyed by normalize_name(), exact match first,
+    then the best fuzzy match above the threshold.
+    """
+    key = normalize_name(name)
+    if key in mapping:
+        return mapping[key]
+    if not mapping:
+        return None
+
+    match = process.extractOne(key, mapping.keys(), scorer=fuzz.token_sort_ratio, score_cutoff=threshold)
+    return mapping[match[0]] if match else None
+
+
+# ======================================================================
+# PARTICIPANT DIRECTORY
+# ======================================================================
+class ParticipantDirectory:
+    def __init__(self, path: str):
+        self.path = path
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.participants: List[Participant] = []
+        self.by_name: Dict[str, Participant] = {}
+        self.by_email: Dict[str, Participant] = {}
+        self.executives: List[Participant] = []
+        self.non_executives: List[Participant] = []
+
+    # ---------------------------------------------------------
+    # Reload the CSV only if it changed on disk
+    # ---------------------------------------------------------
+    def refresh(self) -> "ParticipantDirectory":
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        if mtime_ns == self._mtime_ns:
+            return self
+
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                self._load()
+                self._mtime_ns = mtime_ns
+
+        return self
+
+    def _load(self):
+        participants = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                participants.append(Participant(
+                    name=row["EmployeeName"].strip(),
+                    email=row["EmployeeEmail"].strip(),
+                    role=row["Role"].lower().strip(),
+                    department=row.get("Department", "").strip()
+                ))
+
+        # Build new indexes first, then swap them in one go
+        self.by_name = {normalize_name(p.name): p for p in participants}
+        self.by_email = {p.email.lower(): p for p in participants}
+        self.executives = [p for p in participants if self.is_executive(p)]
+        self.non_executives = [p for p in participants if not self.is_executive(p)]
+        self.participants = participants
+
+        logger.info(f"Loaded participant directory from {self.path} "
+                    f"({len(self.executives)} executives, {len(self.non_executives)} participants)")
+
+    # ---------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------
+    @staticmethod
+    def is_executive(participant: Participant) -> bool:
+        return participant.role in EXEC_ROLES
+
+    def get_by_name(self, name: str) -> Optional[Participant]:
+        return self.by_name.get(normalize_name(name))
+
+    def get_by_email(self, email: str) -> Optional[Participant]:
+        return self.by_email.get(email.lower().strip())
+
+    def match_name(self, name: str) -> Optional[Participant]:
+        """Match a transcript speaker name against EmployeeName."""
+        return fuzzy_lookup(name, self.by_name)
+
+    # ---------------------------------------------------------
+    # Recipient targeting
+    # ---------------------------------------------------------
+    def resolve_recipients(self, attendees: List[str]) -> Dict[str, Any]:
+        """
+        Resolve a meeting's attendees into email recipients.
+
+        Returns:
+            {
+              "participants": [(Participant, attendee_name), ...]  non-executive attendees,
+              "executives":   [Participant, ...]  executive attendees plus the
+                              executives of the project's department (every
+                              executive if no attendee could be matched),
+              "unmatched":    [attendee_name, ...]
+            }
+        """
+        participants: List[Tuple[Participant, str]] = []
+        executives: Dict[str, Participant] = {}
+        unmatched: List[str] = []
+        departments = Counter()
+        seen = set()
+
+        for attendee in attendees:
+            match = self.match_name(attendee)
+            if match is None:
+                unmatched.append(attendee)
+                continue
+            if match.email in seen:
+                continue
+            seen.add(match.email)
+
+            departments[match.department.lower()] += 1
+            if self.is_executive(match):
+                executives[match.email] = match
+            else:
+                participants.append((match, attendee))
+
+        if departments:
+            project_department = departments.most_common(1)[0][0]
+            for p in self.executives:
+                if p.department.lower() == project_department:
+                    executives.setdefault(p.email, p)
+        else:
+            # No department to infer: keep executives informed rather than email nobody
+            logger.warning("No attendee matched the participant directory; "
+                           "sending the executive summary to all executives")
+            for p in self.executives:
+                executives.setdefault(p.email, p)
+
+        return {
+            "participants": participants,
+            "executives": list(executives.values()),
+            "unmatched": unmatched
+        }
+
+
+# ======================================================================
+# PROCESS-WIDE CACHE
+# ======================================================================
+_directories: Dict[str, ParticipantDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def get_participant_directory(path: str) -> ParticipantDirectory:
+    """
+    Return the cached directory for a CSV path, reloading it if the file changed.
+    """
+    key = os.path.abspath(path)
+
+    with _directories_lock:
+        directory = _directories.get(key)
+        if directory is None:
+            directory = ParticipantDirectory(key)
+            _directories[key] = directory
+
+    return directory.refresh()
@@ -0,0 +1,45 @@
+"""
+LLM rate limiters.
+
+Every ChatGroq client used by the scheduler is created with
+`llm_rate_limiter`, so concurrent scheduler workers draw from one token
+bucket instead of each hitting the provider's limits on their own.
+
+The interactive /process-meeting endpoint uses `api_llm_rate_limiter`, a
+separate bucket that is off by default, so a scheduler backlog never adds
+latency to API requests.
+
+Configuration (environment):
+    LLM_REQUESTS_PER_SECOND       scheduler sustained request rate (default 1.0)
+    LLM_MAX_BURST                 scheduler bucket size (default 5)
+    API_LLM_REQUESTS_PER_SECOND   API request rate (default 0, unlimited)
+    API_LLM_MAX_BURST             API bucket size (default 5)
+
+A rate of 0 disables the corresponding limiter.
+"""
+import os
+from typing import Optional
+
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+
+def build_rate_limiter(requests_per_second: float, max_burst: int) -> Optional[InMemoryRateLimiter]:
+    """Token-bucket limiter, or None for an unlimited rate (<= 0)."""
+    if requests_per_second <= 0:
+        return None
+    return InMemoryRateLimiter(
+        requests_per_second=requests_per_second,
+        check_every_n_seconds=0.1,
+        max_bucket_size=max_burst
+    )
+
+
+llm_rate_limiter = build_rate_limiter(
+    float(os.getenv("LLM_REQUESTS_PER_SECOND", 1.0)),
+    int(os.getenv("LLM_MAX_BURST", 5))
+)
+
+api_llm_rate_limiter = build_rate_limiter(
+    float(os.getenv("API_LLM_REQUESTS_PER_SECOND", 0)),
+    int(os.getenv("API_LLM_MAX_BURST", 5))
+)
@@ -7,6 +7,23 @@ from rapidfuzz import fuzz
 import docx2txt
 from dotenv import load_dotenv
 
+from pymongo.errors import DuplicateKeyError
+
+from src.Agentic.utils.transcript_store import (
+    store_transcript_blob,
+    delete_transcript_blob,
+    transcript_content_hash,
+    ensure_transcript_indexes,
+    find_transcript_blob_by_hash
+)
+from src.Agentic.utils.extraction_cache import extraction_cache
+from src.Agentic.utils.chunk_index import (
+    BACKFILL_FIELD,
+    BACKFILL_VERSION,
+    index_meeting_chunks,
+    mark_needs_backfill
+)
+
 load_dotenv()
 
 
@@ -113,18 +130,66 @@ def process_transcript(transcript):
     }
 
 
+# ===================================================================================================
+
+def cache_extracted_transcript(transcript_path, transcript):
+    """
+    Parse already-extracted text and cache it under the file's content hash.
+    Returns the process_transcript() metadata.
+    """
+    meta = process_transcript(transcript)
+    extraction_cache.put(extraction_cache.file_key(transcript_path), meta)
+    return meta
+
+
+def extract_transcript_cached(transcript_path):
+    """
+    extract_transcripts() + process_transcript() for a single file, cached by
+    the file's content hash so each document is parsed only once.
+    """
+    key = extraction_cache.file_key(transcript_path)
+    meta = extraction_cache.get(key)
+    if meta is None:
+        meta = process_transcript(extract_transcripts([transcript_path]))
+        extraction_cache.put(key, meta)
+    return meta
+
+
+# ===================================================================================================
+
+def _index_chunks(db, project_id, project_key, meeting_name, meta):
+    """Chunk + vectorise the new meeting for chat retrieval (best effort)."""
+    try:
+        index_meeting_chunks(db, project_id, project_key, meeting_name,
+                             meta["Date_time"], meta["Full_Transcript"])
+    except Exception as e:
+        # The chatbot backfills missing chunks on its next load of the project
+        print(f"[Warning] Could not index transcript chunks for [{meeting_name}]: {e}")
+        try:
+            mark_needs_backfill(db, project_id)
+        except Exception as flag_error:
+            print(f"[Warning] Could not flag project [{project_key}] for backfill: {flag_error}")
+
+
 # ===================================================================================================
 
 
 def add_transcript_to_mongo(transcript_path,
-                            mongo_uri=os.getenv("MONGO_URI")):
+                            mongo_uri=os.getenv("MONGO_URI"),
+                            transcript=None):
     """
     Extracts transcript → processes metadata → inserts into OMNI_MEET_DB.Raw_Transcripts.
-    Stores participants as NAME ONLY.
+    Stores participants as NAME ONLY. The transcript body itself is stored
+    compressed in Transcript_blobs and referenced by `transcript_ref`.
+    Identical transcripts (by normalised content hash) are never stored twice.
+    Pass `transcript` when the text was already extracted (e.g. by the
+    extraction pool); otherwise the shared extraction cache is used.
     """
 
-    transcript = extract_transcripts([transcript_path])
-    meta = process_transcript(transcript)
+    if transcript is None:
+        meta = extract_transcript_cached(transcript_path)
+    else:
+        meta = process_transcript(transcript)
 
     client = MongoClient(mongo_uri)
     db_name = "OMNI_MEET_DB"
@@ -139,14 +204,17 @@ def add_transcript_to_mongo(transcript_path,
 
     participants_list = meta["Participants_list"]
 
-    new_meeting = {
-        "meeting_name": meeting_name,
-        "meeting_time": meta["Date_time"],
-        "duration": meta["Duration"],
-        "participants": participants_list,
-        "Transcript": [meta["Full_Transcript"]],
-        "processed": False
-    }
+    # --------------------------------------------------
+    # CONTENT-HASH DUPLICATE CHECK (renamed copies too)
+    # --------------------------------------------------
+    content_hash = transcript_content_hash(meta["Full_Transcript"])
+    ensure_transcript_indexes(db)
+
+    if find_transcript_blob_by_hash(db, content_hash):
+        return (
+            f"transcript already exists with content_hash [{content_hash}] "
+            f"(meeting_name [{meeting_name}])"
+        )
 
     # ----------------------------------------
     # Try matching project using fuzzy match
@@ -181,17 +249,46 @@ def add_transcript_to_mongo(transcript_path,
                     f"and meeting_name [{meeting_name}]"
                 )
 
+    # --------------------------------------------------
+    # Store transcript body out-of-line (compressed)
+    # --------------------------------------------------
+    try:
+        transcript_ref = store_transcript_blob(db, meta["Full_Transcript"], content_hash)
+    except DuplicateKeyError:
+        return (
+            f"transcript already exists with content_hash [{content_hash}] "
+            f"(meeting_name [{meeting_name}])"
+        )
+
+    new_meeting = {
+        "meeting_name": meeting_name,
+        "meeting_time": meta["Date_time"],
+        "duration": meta["Duration"],
+        "participants": participants_list,
+        "transcript_ref": transcript_ref,
+        "transcript_chars": len(meta["Full_Transcript"]),
+        "content_hash": content_hash,
+        "processed": False
+    }
+
     # --------------------------------------------------
     # CASE 1: Append to existing project
     # --------------------------------------------------
     if matched_project_key:
-        collection.update_one(
-            {"_id": matched_project_id},
-            {
-                "$set": {"Project_name": project_name},
-                "$push": {"meetings": new_meeting}
-            }
-        )
+        try:
+            collection.update_one(
+                {"_id": matched_project_id},
+                {
+                    "$set": {"Project_name": project_name},
+                    "$push": {"meetings": new_meeting},
+                    "$inc": {"content_version": 1}
+                }
+            )
+        except Exception:
+            # An orphaned blob would make every retry look like a duplicate
+            delete_transcript_blob(db, transcript_ref)
+            raise
+        _index_chunks(db, matched_project_id, matched_project_key, meeting_name, meta)
 
         return (
             f"Added new meeting to existing project into with _id: [{matched_project_id}] into [{db_name}.{coll_name}], "
@@ -204,10 +301,18 @@ def add_transcript_to_mongo(transcript_path,
     new_doc = {
         "Project_key": project_key,
         "Project_name": project_name,
-        "meetings": [new_meeting]
+        "meetings": [new_meeting],
+        "content_version": 1,
+        # Indexed at write time from the start; nothing to backfill
+        BACKFILL_FIELD: BACKFILL_VERSION
     }
 
-    result = collection.insert_one(new_doc)
+    try:
+        result = collection.insert_one(new_doc)
+    except Exception:
+        delete_transcript_blob(db, transcript_ref)
+        raise
+    _index_chunks(db, result.inserted_id, project_key, meeting_name, meta)
 
     return (
         f"Created new project with _id: [{result.inserted_id}] into [{db_name}.{coll_name}] "
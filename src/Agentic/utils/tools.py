@@ -2,14 +2,30 @@ import os
 from langchain.tools import tool
 from typing import Dict, Any, Optional, List
 from pymongo import MongoClient
-import csv
-import ssl
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from datetime import datetime
+from loguru import logger
+
+from src.Agentic.utils.transcript_store import is_transcript_processed, mark_transcript_processed
+from src.Agentic.utils.participant_directory import get_participant_directory, normalize_name, fuzzy_lookup
+from src.Agentic.utils.email_templates import (
+    render_audience_bodies,
+    render_digest_sections,
+    render_participant_sections,
+    format_participant_section,
+    parse_participant_analysis,
+    cards_from_summaries,
+    personalize,
+    AUDIENCE_PARTICIPANT,
+    AUDIENCE_EXECUTIVE
+)
+from src.Agentic.utils.email_delivery import deliver_emails
+from src.Agentic.utils.index_events import (
+    index_events,
+    EVENT_SUMMARY,
+    EVENT_PARTICIPANTS,
+    EVENT_PROJECT_SUMMARY
+)
 
 
 load_dotenv()
@@ -71,6 +87,9 @@ def save_summaries_to_mongo(
             upsert=True
         )
 
+        # Index the summary points for the chatbot in the background
+        index_events.emit(EVENT_SUMMARY, project_key, meeting_name, summary_points=data["summary_points"])
+
         return (
             f"Meeting summary saved for meeting '{meeting_name}' "
             f"in project '{project_key}'."
@@ -115,6 +134,8 @@ def save_summaries_to_mongo(
             upsert=True
         )
 
+        index_events.emit(EVENT_PARTICIPANTS, project_key, meeting_name, participant_summaries=participant_summaries)
+
         return (
             f"Participant summary saved for meeting '{meeting_name}' "
             f"in project '{project_key}'."
@@ -149,6 +170,7 @@ def save_project_summary_to_mongo(
     col = db["Project_summary"]
     
     # Update or insert project summary
+    last_updated = datetime.now().isoformat()
     col.update_one(
         {"project_key": project_key},
         {
@@ -156,16 +178,51 @@ def save_project_summary_to_mongo(
                 "project_key": project_key,
                 "project_name": project_name,
                 "global_summary": global_summary,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": last_updated
             }
         },
         upsert=True
     )
+
+    index_events.emit(EVENT_PROJECT_SUMMARY, project_key, global_summary=global_summary, last_updated=last_updated)
     
     return (
         f"Project summary saved/updated for project '{project_key}'."
     )
 
+# =====================================================================================================
+# Transcript content-hash registry (duplicate detection)
+# =====================================================================================================
+@tool
+def check_transcript_processed(content_hash: str) -> bool:
+    """
+    Returns True if a transcript with this normalised-content SHA-256
+    has already been summarised, so the pipeline can skip it.
+    """
+    mongo_uri = os.getenv("MONGO_URI")
+    client = MongoClient(mongo_uri)
+    db = client["OMNI_MEET_DB"]
+
+    return is_transcript_processed(db, content_hash)
+
+
+@tool
+def record_transcript_processed(
+    content_hash: str,
+    project_key: str,
+    meeting_name: str
+) -> str:
+    """
+    Records a transcript content hash as processed in Processed_transcripts.
+    """
+    mongo_uri = os.getenv("MONGO_URI")
+    client = MongoClient(mongo_uri)
+    db = client["OMNI_MEET_DB"]
+
+    mark_transcript_processed(db, content_hash, project_key, meeting_name)
+
+    return f"Transcript hash recorded for meeting '{meeting_name}' in project '{project_key}'."
+
 # =====================================================================================================
 # Fetch complete project history from MongoDB
 # =====================================================================================================
@@ -228,15 +285,20 @@ def fetch_project_data_from_mongo(
 def send_project_emails(
     input_data: Dict[str, Any],
     participant_db_path: str = "participants_data.csv",
+    delivery_mode: str = "immediate",
 ) -> Dict[str, Any]:
     """
     Sends formatted OrbitMeetAI emails using `src/utils/meeting_email.html`.
-    """
 
-    import os, csv, ssl, smtplib
-    from email.mime.multipart import MIMEMultipart
-    from email.mime.text import MIMEText
-    from datetime import datetime
+    Recipients are the meeting's participants (input_data["participants"],
+    fuzzy-matched against the directory), who each get only their own
+    analysis card, plus the executives of the project's department. Without
+    a participant list (missing or empty, e.g. when none could be parsed from
+    the transcript) every directory entry is emailed, as before.
+
+    With delivery_mode="digest" nothing is sent; the rendered per-recipient
+    meeting sections are returned as `digest_items` for the caller to batch.
+    """
 
     # ----------------------------
     # Extract data
@@ -248,230 +310,105 @@ def send_project_emails(
     participant_text = input_data["participant_analysis_text"]
     global_text = input_data["global_summary_text"]
 
+    attendees = input_data.get("participants")
+    participant_summaries = input_data.get("participant_summaries")
+
+    cards = (
+        cards_from_summaries(participant_summaries)
+        if participant_summaries is not None
+        else parse_participant_analysis(participant_text)
+    )
+
     # ----------------------------
-    # Load HTML template file
+    # Load participants (cached, reloaded only when the CSV changes)
     # ----------------------------
-    # Get the directory where this file (tools.py) is located
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    template_path = os.path.join(current_dir, "meeting_email.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        template_html = f.read()
+    directory = get_participant_directory(participant_db_path)
 
     # ----------------------------
-    # Convert text → HTML bullets (for meeting summary)
+    # Resolve recipients
     # ----------------------------
-    def to_bullets(text: str) -> str:
-        items = [
-            f"<li>{line.strip()}</li>"
-            for line in text.split("\n")
-            if line.strip()
+    subject = f"Meeting Summary: {meeting_name} | {project_name}"
+    unmatched = []
+
+    if not attendees:
+        # No participant list: everyone gets the full participant analysis
+        if attendees is not None:
+            logger.warning(f"No participants found for meeting '{meeting_name}'; emailing the whole directory")
+        all_cards_section = str(format_participant_section(cards))
+        participant_recipients = [(p, all_cards_section) for p in directory.non_executives]
+        executive_recipients = directory.executives
+    else:
+        recipients = directory.resolve_recipients(attendees)
+        unmatched = recipients["unmatched"]
+
+        # One rendered card section per participant, looked up by transcript name
+        sections = {
+            normalize_name(name): section
+            for name, section in render_participant_sections(cards).items()
+        }
+        participant_recipients = [
+            (p, fuzzy_lookup(attendee, sections) or "")
+            for p, attendee in recipients["participants"]
         ]
-        return "<ul>" + "".join(items) + "</ul>"
-    
+        executive_recipients = recipients["executives"]
+
+        if unmatched:
+            logger.warning(f"No directory entry for participant(s): {', '.join(unmatched)}")
+
     # ----------------------------
-    # Format participant analysis as structured cards
+    # Digest mode: return rendered sections instead of sending
     # ----------------------------
-    def format_participant_analysis(participant_text: str) -> str:
-        """
-        Formats participant analysis text into structured HTML cards.
-        Expected format: "Name | Updates: ... Roadblocks: ... Actionable: ..."
-        """
-        if not participant_text.strip():
-            return ""
-        
-        cards = []
-        # Split by participant (assuming each line is a participant)
-        for line in participant_text.split("\n"):
-            if not line.strip() or " | " not in line:
-                continue
-            
-            # Parse the line: "Name | Updates: ... Roadblocks: ... Actionable: ..."
-            parts = line.split(" | ", 1)
-            if len(parts) < 2:
-                continue
-            
-            participant_name = parts[0].strip()
-            rest = parts[1].strip()
-            
-            # Extract Updates, Roadblocks, Actionable using regex for better parsing
-            import re
-            
-            updates = []
-            roadblocks = []
-            actionable = []
-            
-            # Extract Updates
-            updates_match = re.search(r'Updates:\s*(.+?)(?:\s+Roadblocks:|$)', rest, re.IGNORECASE)
-            if updates_match:
-                updates_str = updates_match.group(1).strip()
-                updates = [u.strip() for u in updates_str.split(",") if u.strip()]
-            
-            # Extract Roadblocks
-            roadblocks_match = re.search(r'Roadblocks:\s*(.+?)(?:\s+Actionable:|$)', rest, re.IGNORECASE)
-            if roadblocks_match:
-                roadblocks_str = roadblocks_match.group(1).strip()
-                roadblocks = [r.strip() for r in roadblocks_str.split(",") if r.strip()]
-            
-            # Extract Actionable
-            actionable_match = re.search(r'Actionable:\s*(.+?)$', rest, re.IGNORECASE)
-            if actionable_match:
-                actionable_str = actionable_match.group(1).strip()
-                actionable = [a.strip() for a in actionable_str.split(",") if a.strip()]
-            
-            # Skip if no data found
-            if not (updates or roadblocks or actionable):
-                continue
-            
-            # Build participant card HTML
-            card_html = f"""
-            <div class="participant-card">
-                <div class="participant-name">{participant_name}</div>
-            """
-            
-            if updates:
-                card_html += f"""
-                <div class="participant-section">
-                    <div class="participant-section-label">📊 Key Updates</div>
-                    <div class="participant-section-content">
-                        <ul>
-                            {''.join([f'<li>{update}</li>' for update in updates])}
-                        </ul>
-                    </div>
-                </div>
-                """
-            
-            if roadblocks:
-                card_html += f"""
-                <div class="participant-section">
-                    <div class="participant-section-label">⚠️ Roadblocks</div>
-                    <div class="participant-section-content">
-                        <ul>
-                            {''.join([f'<li>{roadblock}</li>' for roadblock in roadblocks])}
-                        </ul>
-                    </div>
-                </div>
-                """
-            
-            if actionable:
-                card_html += f"""
-                <div class="participant-section">
-                    <div class="participant-section-label">✅ Action Items</div>
-                    <div class="participant-section-content">
-                        <ul>
-                            {''.join([f'<li>{action}</li>' for action in actionable])}
-                        </ul>
-                    </div>
-                </div>
-                """
-            
-            card_html += "</div>"
-            cards.append(card_html)
-        
-        if not cards:
-            return ""
-        
-        return f"""
-        <div class="section">
-            <h2 class="section-title">👥 Participant Analysis</h2>
-            {''.join(cards)}
-        </div>
-        """
-    
+    if delivery_mode == "digest":
+        sections = render_digest_sections(meeting_name, project_name, meeting_text, global_text)
+
+        digest_items = [
+            {"to": p.email, "name": p.name, "html": personalize(sections[AUDIENCE_PARTICIPANT], p.name, section)}
+            for p, section in participant_recipients
+        ] + [
+            {"to": p.email, "name": p.name, "html": personalize(sections[AUDIENCE_EXECUTIVE], p.name)}
+            for p in executive_recipients
+        ]
+
+        return {
+            "status": "deferred",
+            "meeting_name": meeting_name,
+            "digest_items": digest_items,
+            "unmatched_participants": unmatched
+        }
+
     # ----------------------------
-    # Format global summary (for executives)
+    # Render each audience variant once (templates are precompiled)
     # ----------------------------
-    def format_global_summary(global_text: str) -> str:
-        """Formats global summary with proper HTML structure"""
-        if not global_text.strip():
-            return ""
-        
-        # Preserve line breaks and format
-        formatted = global_text.strip().replace("\n\n", "\n")
-        
-        return f"""
-        <div class="section">
-            <h2 class="section-title">📊 Executive Project Summary</h2>
-            <div class="executive-summary">
-                <div class="section-content">{formatted}</div>
-            </div>
-        </div>
-        """
-
-    meeting_html = to_bullets(meeting_text)
+    bodies = render_audience_bodies(
+        meeting_name,
+        project_name,
+        meeting_text,
+        global_text
+    )
 
     # ----------------------------
-    # Load participants
+    # Build one message per recipient
     # ----------------------------
-    participants = []
-    with open(participant_db_path, "r", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            participants.append({
-                "name": row["EmployeeName"],
-                "email": row["EmployeeEmail"],
-                "role": row["Role"].lower().strip()
-            })
-
-    EXEC_ROLES = {
-        "manager", "senior manager", "director",
-        "vp", "vice president", "chief",
-        "head", "lead"
-    }
+    messages = [
+        {"to": p.email, "subject": subject, "html": personalize(bodies[AUDIENCE_PARTICIPANT], p.name, section)}
+        for p, section in participant_recipients
+    ] + [
+        {"to": p.email, "subject": subject, "html": personalize(bodies[AUDIENCE_EXECUTIVE], p.name)}
+        for p in executive_recipients
+    ]
 
     # ----------------------------
-    # SMTP (SSL)
+    # Deliver concurrently over a pool of SMTP sessions
     # ----------------------------
-    SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    SMTP_PORT = int(os.getenv("SMTP_PORT", 465))
-    SMTP_EMAIL = os.getenv("SMTP_EMAIL")
-    SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
-
-    context = ssl.create_default_context()
-
-    sent = {"participants": [], "executives": []}
-
-    with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context) as smtp:
-        smtp.login(SMTP_EMAIL, SMTP_PASSWORD)
-
-        def send_formatted(to_email: str, html: str):
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = f"Meeting Summary: {meeting_name} | {project_name}"
-            msg["From"] = f"OrbitMeetAI <{SMTP_EMAIL}>"
-            msg["To"] = to_email
-            msg["Reply-To"] = SMTP_EMAIL  # Set reply-to to avoid no-reply issues
-            msg.attach(MIMEText(html, "html"))
-            smtp.sendmail(SMTP_EMAIL, to_email, msg.as_string())
-
-        for p in participants:
-            name = p["name"]
-            email = p["email"]
-            is_exec = p["role"] in EXEC_ROLES
-
-            # Insert dynamic blocks
-            participant_section = ""
-            executive_section = ""
-
-            if is_exec:
-                executive_section = format_global_summary(global_text)
-                sent["executives"].append(email)
-            else:
-                participant_section = format_participant_analysis(participant_text)
-                sent["participants"].append(email)
-
-            # Build final email body
-            html_body = template_html\
-                .replace("{{receiver_name}}", name)\
-                .replace("{{subject}}", meeting_name)\
-                .replace("{{project_name}}", project_name)\
-                .replace("{{meeting_summary}}", meeting_html)\
-                .replace("{{participant_section}}", participant_section)\
-                .replace("{{executive_section}}", executive_section)\
-                .replace("{{year}}", str(datetime.now().year))
-
-            send_formatted(email, html_body)
+    result = deliver_emails(messages)
+    delivered = set(result["delivered"])
 
     return {
         "status": "success",
         "meeting_name": meeting_name,
-        "sent_to_participants": sent["participants"],
-        "sent_to_executives": sent["executives"]
+        "sent_to_participants": [p.email for p, _ in participant_recipients if p.email in delivered],
+        "sent_to_executives": [p.email for p in executive_recipients if p.email in delivered],
+        "unmatched_participants": unmatched,
+        "failed": result["failed"],
+        "delivery_metrics": result["metrics"]
     }
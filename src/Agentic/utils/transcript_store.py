@@ -0,0 +1,230 @@
+"""
+Out-of-line, compressed storage for raw meeting transcripts.
+
+Transcript bodies live in OMNI_MEET_DB.Transcript_blobs as zlib-compressed
+bytes and each meeting in Raw_Transcripts only keeps a `transcript_ref` to its
+blob. Listing and scheduling queries therefore never move transcript text over
+the wire; only the code paths that actually need the text decompress it.
+
+Meetings written before this change still carry the inline `Transcript` list,
+so every reader here accepts both shapes.
+
+Each blob also carries the SHA-256 of its normalised text (`content_hash`),
+unique across the collection, and Processed_transcripts records which hashes
+have already been through the orchestrator. Both give O(1) duplicate checks.
+"""
+import os
+import re
+import zlib
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import Binary, ObjectId
+from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError
+from loguru import logger
+
+# ======================================================================
+# CONFIGURATION
+# ======================================================================
+DB_NAME = "OMNI_MEET_DB"
+RAW_COLLECTION = "Raw_Transcripts"
+BLOB_COLLECTION = "Transcript_blobs"
+PROCESSED_COLLECTION = "Processed_transcripts"
+
+TRANSCRIPT_CODEC = "zlib"
+COMPRESSION_LEVEL = 6
+
+
+# ======================================================================
+# COMPRESSION
+# ======================================================================
+def compress_transcript(text: str) -> bytes:
+    """Compress transcript text with zlib."""
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def decompress_transcript(data: bytes, codec: str = TRANSCRIPT_CODEC) -> str:
+    """Decompress a transcript blob back into text."""
+    if codec != TRANSCRIPT_CODEC:
+        raise ValueError(f"Unsupported transcript codec: {codec}")
+    return zlib.decompress(bytes(data)).decode("utf-8")
+
+
+# ======================================================================
+# CONTENT HASHING
+# ======================================================================
+def normalize_transcript(text: str) -> str:
+    """Case-fold and collapse whitespace so trivially different copies hash equal."""
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def transcript_content_hash(text: str) -> str:
+    """SHA-256 hex digest of the normalised transcript text."""
+    return hashlib.sha256(normalize_transcript(text).encode("utf-8")).hexdigest()
+
+
+def ensure_transcript_indexes(db):
+    """Create the unique content-hash index on the blob collection (idempotent)."""
+    db[BLOB_COLLECTION].create_index(
+        "content_hash",
+        unique=True,
+        partialFilterExpression={"content_hash": {"$exists": True}}
+    )
+
+
+def find_transcript_blob_by_hash(db, content_hash: str) -> Optional[Dict[str, Any]]:
+    """Return the blob stub (without data) stored for a content hash, if any."""
+    return db[BLOB_COLLECTION].find_one({"content_hash": content_hash}, {"data": 0})
+
+
+# ======================================================================
+# WRITE PATH
+# ======================================================================
+def store_transcript_blob(db, text: str, content_hash: Optional[str] = None) -> ObjectId:
+    """
+    Store a transcript in the blob collection and return its _id, which the
+    meeting record keeps as `transcript_ref`.
+
+    Raises:
+        DuplicateKeyError: if a blob with the same content hash already exists
+    """
+    content_hash = content_hash or transcript_content_hash(text)
+    data = compress_transcript(text)
+
+    result = db[BLOB_COLLECTION].insert_one({
+        "content_hash": content_hash,
+        "codec": TRANSCRIPT_CODEC,
+        "raw_size": len(text),
+        "compressed_size": len(data),
+        "data": Binary(data)
+    })
+
+    return result.inserted_id
+
+
+def delete_transcript_blob(db, blob_id: ObjectId):
+    """
+    Remove a blob whose meeting record could not be written, so its content
+    hash does not reject the transcript when it is stored again.
+    """
+    db[BLOB_COLLECTION].delete_one({"_id": blob_id})
+
+
+# ======================================================================
+# PROCESSED-TRANSCRIPT REGISTRY
+# ======================================================================
+def is_transcript_processed(db, content_hash: str) -> bool:
+    """True if a transcript with this content hash was already summarised."""
+    return db[PROCESSED_COLLECTION].find_one({"_id": content_hash}, {"_id": 1}) is not None
+
+
+def mark_transcript_processed(db, content_hash: str, project_key: str, meeting_name: str):
+    """Record that a transcript hash went through the orchestrator."""
+    try:
+        db[PROCESSED_COLLECTION].insert_one({
+            "_id": content_hash,
+            "project_key": project_key,
+            "meeting_name": meeting_name,
+            "processed_at": datetime.now().isoformat()
+        })
+    except DuplicateKeyError:
+        pass
+
+
+# ======================================================================
+# READ PATH
+# ======================================================================
+def load_transcript_text(db, meeting: Dict[str, Any]) -> str:
+    """
+    Return the transcript text of a meeting record.
+
+    Meetings stored out-of-line are resolved through `transcript_ref`;
+    legacy meetings fall back to the inline `Transcript` field.
+    """
+    transcript_ref = meeting.get("transcript_ref")
+    if transcript_ref:
+        blob = db[BLOB_COLLECTION].find_one(
+            {"_id": transcript_ref},
+            {"data": 1, "codec": 1}
+        )
+        if not blob:
+            logger.warning(f"Transcript blob {transcript_ref} not found")
+            return ""
+        return decompress_transcript(blob["data"], blob.get("codec", TRANSCRIPT_CODEC))
+
+    transcript = meeting.get("Transcript")
+    if not transcript:
+        return ""
+    if isinstance(transcript, list):
+        return transcript[0] if transcript else ""
+    return str(transcript)
+
+
+def load_inline_transcript(db, document_id: ObjectId, meeting_index: int) -> str:
+    """
+    Fetch a single legacy inline transcript by position, for callers that
+    projected transcript bodies away when listing meetings.
+    """
+    doc = db[RAW_COLLECTION].find_one(
+        {"_id": document_id},
+        {"_id": 0, "meetings": {"$slice": [meeting_index, 1]}, "Project_key": 1}
+    )
+    meetings = (doc or {}).get("meetings", [])
+    return load_transcript_text(db, meetings[0]) if meetings else ""
+
+
+# ======================================================================
+# MIGRATION: INLINE → OUT-OF-LINE
+# ======================================================================
+def migrate_inline_transcripts(mongo_uri: Optional[str] = None) -> int:
+    """
+    Move inline `meetings[].Transcript` bodies into the blob collection.
+
+    Returns:
+        Number of meetings migrated
+    """
+    mongo_uri = mongo_uri or os.getenv("MONGO_URI")
+    if not mongo_uri:
+        raise ValueError("MONGO_URI not configured")
+
+    client = MongoClient(mongo_uri)
+    db = client[DB_NAME]
+    collection = db[RAW_COLLECTION]
+    ensure_transcript_indexes(db)
+
+    migrated = 0
+    for doc in collection.find({"meetings.Transcript": {"$exists": True}}):
+        for idx, meeting in enumerate(doc.get("meetings", [])):
+            if "Transcript" not in meeting:
+                continue
+
+            text = load_transcript_text(db, meeting)
+            content_hash = transcript_content_hash(text)
+
+            existing = find_transcript_blob_by_hash(db, content_hash)
+            blob_id = existing["_id"] if existing else store_transcript_blob(db, text, content_hash)
+
+            collection.update_one(
+                {"_id": doc["_id"]},
+                {
+                    "$set": {
+                        f"meetings.{idx}.transcript_ref": blob_id,
+                        f"meetings.{idx}.transcript_chars": len(text),
+                        f"meetings.{idx}.content_hash": content_hash
+                    },
+                    "$unset": {f"meetings.{idx}.Transcript": ""}
+                }
+            )
+            migrated += 1
+
+    logger.info(f"Migrated {migrated} inline transcript(s) to {DB_NAME}.{BLOB_COLLECTION}")
+    return migrated
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    migrate_inline_transcripts()
@@ -0,0 +1,153 @@
+"""
+Leader election for the background scheduler.
+
+Every uvicorn/gunicorn worker runs the FastAPI lifespan, but only one process
+should own the scheduler (cron, change stream watcher, orchestrator agents).
+Workers compete for a lock document in Scheduler_state; the holder renews it
+every LEADER_LEASE_SECONDS / 3 and runs `on_elected`. If the leader dies its
+lock expires and another worker takes over; a clean shutdown releases the
+lock immediately. Callbacks may be plain functions or coroutines (awaited).
+
+If `on_elected` raises (e.g. the orchestrator cannot be configured), the
+worker steps down at once: it runs `on_demoted` to undo any partial start,
+releases the lock and sits out one lease period so another worker can take
+over instead of this one re-acquiring and failing again.
+"""
+import os
+import asyncio
+import inspect
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from loguru import logger
+import certifi
+
+DB_NAME = "OMNI_MEET_DB"
+STATE_COLLECTION = "Scheduler_state"
+
+leader_lease_seconds = max(10, int(os.getenv("LEADER_LEASE_SECONDS", 30)))
+
+
+class LeaderElection:
+    def __init__(
+        self,
+        mongo_uri: str,
+        owner_id: str,
+        on_elected: Callable[[], Any],
+        on_demoted: Callable[[], Any],
+        name: str = "scheduler_leader"
+    ):
+        self.owner_id = owner_id
+        self.name = name
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.is_leader = False
+
+        self._collection = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())[DB_NAME][STATE_COLLECTION]
+        self._lease_until: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ---------------------------------------------------------
+    # Lock document
+    # ---------------------------------------------------------
+    def _try_acquire(self) -> bool:
+        """Take or renew the lock; False while another live owner holds it."""
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=leader_lease_seconds)
+        try:
+            doc = self._collection.find_one_and_update(
+                {"_id": self.name, "$or": [{"owner": self.owner_id}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": self.owner_id, "expires_at": expires_at, "renewed_at": now}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Lock exists and is held by someone else (the upsert lost the race)
+            return False
+
+        if doc and doc.get("owner") == self.owner_id:
+            self._lease_until = expires_at
+            return True
+        return False
+
+    def _release(self):
+        self._collection.delete_one({"_id": self.name, "owner": self.owner_id})
+
+    @staticmethod
+    async def _call(callback: Callable[[], Any]) -> bool:
+        """Run a callback; False (logged) if it raised."""
+        try:
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+            return True
+        except Exception as e:
+            logger.error(f"Leader callback {getattr(callback, '__name__', callback)} failed: {e}")
+            return False
+
+    async def _step_down(self):
+        """Give up leadership after a failed on_elected."""
+        self.is_leader = False
+        await self._call(self.on_demoted)
+        try:
+            await asyncio.to_thread(self._release)
+            logger.warning(f"Released scheduler leadership after a failed start ({self.owner_id})")
+        except Exception as e:
+            logger.error(f"Error releasing leader lock: {e}")
+
+    # ---------------------------------------------------------
+    # Election loop
+    # ---------------------------------------------------------
+    async def _run(self):
+        interval = leader_lease_seconds / 3
+        while True:
+            try:
+                acquired = await asyncio.to_thread(self._try_acquire)
+            except Exception as e:
+                logger.error(f"Leader lock renewal failed: {e}")
+                # Keep leading only while our last lease is still valid
+                acquired = self.is_leader and datetime.now(timezone.utc) < self._lease_until
+
+            if acquired and not self.is_leader:
+                self.is_leader = True
+                logger.success(f"Elected scheduler leader ({self.owner_id})")
+                if not await self._call(self.on_elected):
+                    await self._step_down()
+                    # Let another worker take the lock before competing again
+                    await asyncio.sleep(leader_lease_seconds)
+                    continue
+            elif not acquired and self.is_leader:
+                self.is_leader = False
+                logger.warning(f"Lost scheduler leadership ({self.owner_id})")
+                await self._call(self.on_demoted)
+
+            await asyncio.sleep(interval)
+
+    def start(self):
+        if self._task is None:
+            logger.info(f"Competing for scheduler leadership as {self.owner_id}")
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop competing; if leading, stop the scheduler and hand the lock over."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self.is_leader:
+            self.is_leader = False
+            await self._call(self.on_demoted)
+            try:
+                await asyncio.to_thread(self._release)
+                logger.info("Released scheduler leadership")
+            except Exception as e:
+                logger.error(f"Error releasing leader lock: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "owner_id": self.owner_id,
+            "is_leader": self.is_leader,
+            "lease_until": self._lease_until.isoformat() if self.is_leader and self._lease_until else None
+        }
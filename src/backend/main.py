@@ -2,11 +2,14 @@
 FastAPI application for OrbitMeetAI Orchestrator
 """
 import os
+import json
+import asyncio
 from typing import List, Optional, Dict, Any
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
@@ -22,23 +25,36 @@ from src.Agentic.agents.ProjectSummaryAgent import ProjectSummaryAnalyst
 from src.Agentic.agents.Orchestrator import build_orchestrator_graph, OrchestratorState
 
 # Import tools
-from src.Agentic.utils import save_summaries_to_mongo, fetch_project_data_from_mongo, send_project_emails, save_project_summary_to_mongo
+from src.Agentic.utils import (
+    save_summaries_to_mongo,
+    fetch_project_data_from_mongo,
+    send_project_emails,
+    save_project_summary_to_mongo,
+    check_transcript_processed,
+    record_transcript_processed
+)
+from src.Agentic.utils.rate_limiter import api_llm_rate_limiter
 from loguru import logger
 
 # Load environment variables
 load_dotenv()
 
+# There is no per-user access control, so an unscoped /orbit-chat/projects
+# request searches every project unless this is set
+cross_project_require_scope = os.getenv("CROSS_PROJECT_REQUIRE_SCOPE", "false").lower() == "true"
+
 # ======================================================================
 # GLOBAL STATE (Agents and Workflow)
 # ======================================================================
 agents = {}
 workflow = None
+scheduler_leader = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize agents and workflow on startup, start scheduler"""
-    global agents, workflow
+    global agents, workflow, scheduler_leader
     
     # Load API keys
     api_key = os.getenv("GROQ_API_KEY")
@@ -49,7 +65,8 @@ async def lifespan(app: FastAPI):
     llm = ChatGroq(
         model="openai/gpt-oss-20b",
         temperature=0.2,
-        api_key=api_key
+        api_key=api_key,
+        rate_limiter=api_llm_rate_limiter
     )
     
     # Initialize agents
@@ -66,19 +83,43 @@ async def lifespan(app: FastAPI):
         fetch_project_data_from_mongo,
         save_project_summary_to_mongo,
         send_project_emails,
+        check_transcript_processed,
+        record_transcript_processed,
     )
     
     # Start background scheduler (skip on Vercel - serverless doesn't support persistent processes)
+    # With several workers, only the elected leader runs it; the rest just serve HTTP
     if not os.getenv("VERCEL"):
-        from src.backend.scheduler import start_scheduler
-        start_scheduler()
+        from src.backend.scheduler import start_scheduler, stop_scheduler, worker_id
+        mongo_uri = os.getenv("MONGO_URI")
+        if mongo_uri:
+            from src.backend.leader import LeaderElection
+            scheduler_leader = LeaderElection(
+                mongo_uri,
+                owner_id=worker_id,
+                on_elected=start_scheduler,
+                on_demoted=stop_scheduler
+            )
+            scheduler_leader.start()
+        else:
+            start_scheduler()
     
     yield
     
     # Cleanup: Stop scheduler on shutdown (only if it was started)
     if not os.getenv("VERCEL"):
-        from src.backend.scheduler import stop_scheduler
-        stop_scheduler()
+        if scheduler_leader is not None:
+            await scheduler_leader.stop()
+        else:
+            await stop_scheduler()
+    
+    # Write any summary index updates still queued (including those from the
+    # run the scheduler just stopped) before the process exits
+    from src.Agentic.utils.index_events import index_events, FLUSH_TIMEOUT_SECONDS
+    await asyncio.to_thread(index_events.flush, FLUSH_TIMEOUT_SECONDS)
+    
+    from src.Agentic.utils.email_delivery import close_connection_pools
+    await asyncio.to_thread(close_connection_pools)
 
 
 # ======================================================================
@@ -144,12 +185,17 @@ class ProjectDataResponse(BaseModel):
 
 
 class ChatRequest(BaseModel):
-    """Request model for chat"""
-    project_name: str = Field(..., description="Project name to chat about")
+    """Request model for chat (give project_id or project_name)"""
+    project_id: Optional[str] = Field(default=None, description="Project ID (skips name resolution)")
+    project_name: Optional[str] = Field(default=None, description="Project name to chat about")
     question: str = Field(..., description="User's question")
+    session_id: Optional[str] = Field(
+        default=None,
+        description="Conversation to continue; omit to start one (returned in the response)"
+    )
     chat_history: Optional[List[Dict[str, str]]] = Field(
         default=None,
-        description="Optional chat history for context"
+        description="Optional chat history for context, used only without a session_id"
     )
 
 
@@ -158,6 +204,30 @@ class ChatResponse(BaseModel):
     answer: str = Field(..., description="Chatbot's answer")
     sources: List[str] = Field(..., description="List of meeting names used as sources")
     project_id: str = Field(..., description="Project ID used")
+    cached: bool = Field(default=False, description="True if answered from the answer cache")
+    tier: Optional[str] = Field(default=None, description="Context the answer came from: 'summary' or 'transcript'")
+    session_id: Optional[str] = Field(default=None, description="Conversation id to send with follow-up questions")
+
+
+class CrossProjectChatRequest(BaseModel):
+    """Request model for chat across several projects"""
+    question: str = Field(..., description="User's question")
+    project_ids: Optional[List[str]] = Field(default=None, description="Projects to search by ID")
+    project_names: Optional[List[str]] = Field(default=None, description="Projects to search by name")
+
+
+class CrossProjectSource(BaseModel):
+    """A project meeting cited in a cross-project answer"""
+    project_id: str
+    project_name: str
+    meeting_name: str
+
+
+class CrossProjectChatResponse(BaseModel):
+    """Response model for chat across several projects"""
+    answer: str = Field(..., description="Chatbot's answer, citing [Project / Meeting]")
+    sources: List[CrossProjectSource] = Field(..., description="Project meetings used as sources")
+    project_ids: List[str] = Field(..., description="Projects searched")
 
 
 # ======================================================================
@@ -219,6 +289,14 @@ async def process_meeting(request: ProcessMeetingRequest):
         # Run orchestrator workflow
         final_state = await workflow.ainvoke(initial_state)
         
+        if final_state.get("duplicate"):
+            return ProcessMeetingResponse(
+                status="skipped",
+                project_key=final_state["project_key"],
+                meeting_name=final_state["meeting_name"],
+                message=f"Identical transcript for '{request.meeting_name}' was already processed"
+            )
+        
         # Format participant summaries for response
         participant_summaries = None
         if final_state.get("user_analysis_list"):
@@ -328,7 +406,7 @@ async def get_project_data_by_id(project_id: str):
         collection = db["Raw_Transcripts"]
         
         # Fetch document to get project_key
-        doc = collection.find_one({"_id": object_id})
+        doc = collection.find_one({"_id": object_id}, {"Project_key": 1})
         
         if not doc:
             raise HTTPException(
@@ -377,6 +455,12 @@ async def trigger_scheduler_manually():
     
     Useful for testing or immediate processing without waiting for the hourly schedule.
     """
+    if scheduler_leader is not None and not scheduler_leader.is_leader:
+        return {
+            "status": "ok",
+            "message": "This worker is not the scheduler leader; the leader processes new meetings automatically."
+        }
+    
     try:
         from src.backend.scheduler import run_manual_check
         await run_manual_check()
@@ -391,41 +475,100 @@ async def trigger_scheduler_manually():
         )
 
 
+@app.get("/scheduler-status")
+async def scheduler_status():
+    """
+    Report the scheduler worker pool's progress and queue depth.
+    """
+    from src.backend.scheduler import get_scheduler_status
+    return {
+        **get_scheduler_status(),
+        "leader": scheduler_leader.status() if scheduler_leader is not None else None
+    }
+
+
+def resolve_chat_project(request: ChatRequest) -> str:
+    """
+    Project id for a chat request: the given project_id, or the project
+    found by name in the in-memory project name index. A name that is a
+    prefix of several projects is rejected with autocomplete suggestions.
+    """
+    if request.project_id:
+        try:
+            ObjectId(request.project_id)
+        except InvalidId:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid project_id format: {request.project_id}"
+            )
+        return request.project_id
+    
+    if not request.project_name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either project_id or project_name is required"
+        )
+    
+    return resolve_project_name(request.project_name)
+
+
+def resolve_project_name(project_name: str) -> str:
+    """
+    Project id for a project name from a chat request: 400 with autocomplete
+    suggestions if the name is a prefix of several projects, 404 if no
+    project matches.
+    """
+    from src.chatbot.orbit_chat import find_project_by_name, is_ambiguous_project_name, autocomplete_projects
+    project_id = find_project_by_name(project_name)
+    
+    if not project_id and is_ambiguous_project_name(project_name):
+        suggestions = autocomplete_projects(project_name, limit=5)
+        names = ", ".join(f"'{project['project_name']}'" for project in suggestions)
+        logger.warning(f"Ambiguous project name: {project_name}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Project name '{project_name}' matches several projects: {names}. "
+                   f"Use the full name or project_id."
+        )
+    
+    if not project_id:
+        logger.warning(f"Project not found: {project_name}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project '{project_name}' not found"
+        )
+    
+    return project_id
+
+
 @app.post("/orbit-chat", response_model=ChatResponse)
 async def orbit_chat(request: ChatRequest):
     """
     Chat with OrbitMeetAI about a specific project.
     
     This endpoint:
-    1. Finds the project by name
-    2. Fetches all meeting transcripts from MongoDB
-    3. Uses RAG (Retrieval Augmented Generation) with MongoDB Vector Search
-    4. Returns answer with source meetings
+    1. Uses project_id if given, otherwise finds the project by name
+       (in-memory name index: exact, unique word prefix, then fuzzy)
+    2. Answers from meeting summaries and participant insights first
+    3. If those are not enough, retrieves the transcript chunks most relevant
+       to the question and answers from them (constant prompt size per question)
+    4. Returns answer with source meetings and the tier used
     
-    The chatbot uses Voyage AI embeddings and stores vectors in MongoDB.
+    Chunks carry hashed TF-IDF vectors stored in MongoDB (Transcript_chunks).
     """
     try:
-        from src.chatbot.orbit_chat import chat_with_project, find_project_by_name
+        from src.chatbot.orbit_chat import chat_with_project
         
-        logger.info(f"Chat request for project: {request.project_name}")
+        project_id = resolve_chat_project(request)
         
-        # Find project by name
-        project_id = find_project_by_name(request.project_name)
-        
-        if not project_id:
-            logger.warning(f"Project not found: {request.project_name}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Project '{request.project_name}' not found"
-            )
-        
-        logger.info(f"Found project_id: {project_id}, processing question...")
+        logger.info(f"Chat request for project_id: {project_id}, processing question...")
         
         # Chat with project
         result = await chat_with_project(
             project_id=project_id,
             question=request.question,
-            chat_history=request.chat_history
+            chat_history=request.chat_history,
+            session_id=request.session_id
         )
         
         logger.success(f"Chat response generated successfully for project {project_id}")
@@ -433,7 +576,10 @@ async def orbit_chat(request: ChatRequest):
         return ChatResponse(
             answer=result["answer"],
             sources=result["sources"],
-            project_id=result["project_id"]
+            project_id=result["project_id"],
+            cached=result["cached"],
+            tier=result["tier"],
+            session_id=result["session_id"]
         )
     
     except HTTPException:
@@ -446,21 +592,190 @@ async def orbit_chat(request: ChatRequest):
         )
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}", exc_info=True)
-        error_detail = str(e)
-        # Provide more helpful error messages
-        if "VOYAGE_API_KEY" in error_detail or "voyage" in error_detail.lower():
-            error_detail = "Voyage AI API key not configured. Please set VOYAGE_API_KEY in your environment variables."
-        elif "MONGO_URI" in error_detail or "mongo" in error_detail.lower():
-            error_detail = "MongoDB connection error. Please check your MONGO_URI configuration."
-        elif "GROQ_API_KEY" in error_detail or "groq" in error_detail.lower():
-            error_detail = "Groq API key not configured. Please set GROQ_API_KEY in your environment variables."
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error in chat: {chat_error_detail(e)}"
+        )
+
+
+def chat_error_detail(error: Exception) -> str:
+    """More helpful messages for common chat configuration errors."""
+    error_detail = str(error)
+    if "VOYAGE_API_KEY" in error_detail or "voyage" in error_detail.lower():
+        error_detail = "Voyage AI API key not configured. Please set VOYAGE_API_KEY in your environment variables."
+    elif "MONGO_URI" in error_detail or "mongo" in error_detail.lower():
+        error_detail = "MongoDB connection error. Please check your MONGO_URI configuration."
+    elif "GROQ_API_KEY" in error_detail or "groq" in error_detail.lower():
+        error_detail = "Groq API key not configured. Please set GROQ_API_KEY in your environment variables."
+    return error_detail
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/orbit-chat/stream")
+async def orbit_chat_stream(request: ChatRequest):
+    """
+    Streaming variant of /orbit-chat over Server-Sent Events.
+    
+    Events, in order:
+    - `sources`: source meetings, project_id, tier and session_id, sent before the first token
+    - `token`: a piece of the answer (repeated)
+    - `done`: end of the answer
+    - `error`: generation failed part-way (the stream then ends)
+    
+    Project lookup and retrieval errors are reported with the same status
+    codes as /orbit-chat, before the stream starts.
+    """
+    try:
+        from src.chatbot.orbit_chat import stream_chat_with_project
+        
+        project_id = resolve_chat_project(request)
+        
+        logger.info(f"Streaming chat request for project_id: {project_id}")
+        
+        # Run retrieval up to the sources event now, so its errors get a status code
+        events = stream_chat_with_project(
+            project_id=project_id,
+            question=request.question,
+            chat_history=request.chat_history,
+            session_id=request.session_id
+        )
+        first_event = await events.__anext__()
+    
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error(f"ValueError in chat: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error in streaming chat endpoint: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error in chat: {chat_error_detail(e)}"
+        )
+    
+    async def event_stream():
+        yield sse_event(first_event["type"], first_event)
+        try:
+            async for event in events:
+                yield sse_event(event["type"], event)
+        except Exception as e:
+            logger.error(f"Error while streaming chat answer: {e}", exc_info=True)
+            yield sse_event("error", {"type": "error", "detail": f"Error in chat: {chat_error_detail(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Keep proxies (nginx, Render) from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/orbit-chat/projects", response_model=CrossProjectChatResponse)
+async def orbit_chat_across_projects(request: CrossProjectChatRequest):
+    """
+    Ask one question across several projects ("which projects are blocked
+    on staging access?").
+    
+    Searches the projects given by project_ids and/or project_names (names
+    resolve as in /orbit-chat, so an ambiguous name is a 400 with
+    suggestions). With neither, every project is searched: the API has no
+    per-user access control, so set CROSS_PROJECT_REQUIRE_SCOPE=true to
+    reject unscoped requests instead. Retrieval runs concurrently over each
+    project's index; the best snippets overall are merged under one context
+    budget and the answer cites project and meeting for each.
+    """
+    try:
+        from src.chatbot.orbit_chat import chat_across_projects
+        
+        if cross_project_require_scope and not (request.project_ids or request.project_names):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="project_ids or project_names is required"
+            )
+        
+        project_ids = list(request.project_ids or [])
+        for project_id in project_ids:
+            try:
+                ObjectId(project_id)
+            except InvalidId:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid project_id format: {project_id}"
+                )
+        
+        for project_name in request.project_names or []:
+            project_ids.append(resolve_project_name(project_name))
+        
+        logger.info(f"Cross-project chat request over {len(project_ids) or 'all'} project(s)")
+        
+        result = await chat_across_projects(request.question, project_ids or None)
         
+        return CrossProjectChatResponse(**result)
+    
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error(f"ValueError in cross-project chat: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error in cross-project chat endpoint: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error in chat: {error_detail}"
+            detail=f"Error in chat: {chat_error_detail(e)}"
         )
 
 
+@app.get("/projects/autocomplete")
+async def autocomplete_projects(q: str = "", limit: int = 10):
+    """
+    Suggest projects for a partially typed name.
+    
+    Matches any word of the project name by prefix, case- and
+    accent-insensitively, shortest names first. Returns project_id,
+    project_name and project_key for each suggestion.
+    """
+    try:
+        from src.chatbot.orbit_chat import autocomplete_projects as complete
+        return complete(q, limit=max(1, min(limit, 50)))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error completing project names: {str(e)}"
+        )
+
+
+@app.get("/orbit-chat/cache-stats")
+async def orbit_chat_cache_stats():
+    """
+    Report this worker's chatbot caches: the retrieval index cache (hits,
+    misses, evictions, content-version invalidations, estimated memory use)
+    and the semantic answer cache (hit rate, stored answers), plus the
+    write-time summary indexer (events, batches, pending).
+    """
+    from src.chatbot.orbit_chat import chatbot_instances, answer_cache
+    from src.Agentic.utils.index_events import index_events
+    return {
+        "index": chatbot_instances.stats(),
+        "answers": answer_cache.stats(),
+        "indexer": index_events.stats()
+    }
+
+
 @app.get("/transcripts")
 async def get_all_transcripts():
     """
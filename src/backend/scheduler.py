@@ -1,15 +1,21 @@
 """
 Background scheduler for processing new transcripts automatically.
-Checks for unprocessed meetings every hour and runs the orchestrator.
+Runs the orchestrator as soon as new meetings land in Raw_Transcripts (change
+stream, or short-interval polling where change streams are unavailable), with
+an hourly check kept as a safety net.
 """
 import os
+import uuid
+import socket
 import asyncio
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import threading
+from typing import List, Dict, Any, Optional, Iterator
+from datetime import datetime, timedelta, timezone
 from pymongo import MongoClient
 from bson import ObjectId
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from loguru import logger
 import certifi
 
@@ -18,6 +24,14 @@ from src.Agentic.agents.Orchestrator import build_orchestrator_graph, Orchestrat
 from src.Agentic.agents.MeetingSummaryAgent import MeetingSummaryAnalyst
 from src.Agentic.agents.ParticipantAnalystAgent import ParticipantSummaryAnalyst
 from src.Agentic.agents.ProjectSummaryAgent import ProjectSummaryAnalyst
+from src.Agentic.utils.transcript_store import (
+    load_transcript_text,
+    load_inline_transcript,
+    is_transcript_processed
+)
+from src.Agentic.utils.email_digest import email_digest
+from src.Agentic.utils.rate_limiter import llm_rate_limiter
+from src.backend.transcript_events import TranscriptChangeWatcher
 from langchain_groq import ChatGroq
 from dotenv import load_dotenv
 
@@ -42,8 +56,46 @@ scheduler: Optional[AsyncIOScheduler] = None
 workflow = None
 agents = {}
 mongo_uri = os.getenv("MONGO_URI")
+mongo_client: Optional[MongoClient] = None
+mongo_client_lock = threading.Lock()
 participant_db_path = os.getenv("PARTICIPANT_DB_PATH", "SampleData/participants_database.csv")
 
+# Worker pool: projects processed in parallel, meetings of a project in order
+scheduler_concurrency = max(1, int(os.getenv("SCHEDULER_CONCURRENCY", 3)))
+worker_pool_status: Dict[str, Any] = {
+    "running": False,
+    "concurrency": scheduler_concurrency,
+    "total": 0,
+    "completed": 0,
+    "succeeded": 0,
+    "failed": 0,
+    "deferred": 0,
+    "claimed_elsewhere": 0,
+    "queue_depth": 0,
+    "active_projects": 0,
+}
+
+# Lease-based claiming so several scheduler instances can share the backlog
+worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+lease_seconds = max(30, int(os.getenv("SCHEDULER_LEASE_SECONDS", 300)))
+heartbeat_seconds = lease_seconds / 3
+
+# A meeting that fails is retried after a backoff that doubles per attempt
+retry_backoff_seconds = max(1, int(os.getenv("SCHEDULER_RETRY_BACKOFF_SECONDS", 300)))
+retry_backoff_max_seconds = max(retry_backoff_seconds, int(os.getenv("SCHEDULER_RETRY_BACKOFF_MAX_SECONDS", 6 * 3600)))
+
+# Digest mode: one combined email per recipient per run (or per window)
+email_digest_mode = os.getenv("EMAIL_DIGEST_MODE", "false").lower() == "true"
+email_digest_window_minutes = int(os.getenv("EMAIL_DIGEST_WINDOW_MINUTES", 0))
+
+# Event-driven processing: react to new transcripts instead of waiting for the hour
+event_driven = os.getenv("SCHEDULER_EVENT_DRIVEN", "true").lower() == "true"
+change_watcher: Optional[TranscriptChangeWatcher] = None
+
+# Runs triggered while one is in progress are folded into a single follow-up run
+_active_run: Optional[asyncio.Task] = None
+_rerun_requested = False
+
 
 # ======================================================================
 # INITIALIZE ORCHESTRATOR
@@ -63,7 +115,8 @@ def initialize_orchestrator():
     llm = ChatGroq(
         model="openai/gpt-oss-20b",
         temperature=0.2,
-        api_key=api_key
+        api_key=api_key,
+        rate_limiter=llm_rate_limiter
     )
     
     # Initialize agents
@@ -72,7 +125,14 @@ def initialize_orchestrator():
     agents["global_agent"] = ProjectSummaryAnalyst(model=llm, tools=[])
     
     # Import tools
-    from src.Agentic.utils import save_summaries_to_mongo, fetch_project_data_from_mongo, send_project_emails, save_project_summary_to_mongo
+    from src.Agentic.utils import (
+        save_summaries_to_mongo,
+        fetch_project_data_from_mongo,
+        send_project_emails,
+        save_project_summary_to_mongo,
+        check_transcript_processed,
+        record_transcript_processed
+    )
     
     # Build orchestrator workflow
     workflow = build_orchestrator_graph(
@@ -83,59 +143,114 @@ def initialize_orchestrator():
         fetch_project_data_from_mongo,
         save_project_summary_to_mongo,
         send_project_emails,
+        check_transcript_processed,
+        record_transcript_processed,
     )
     
     logger.success("Orchestrator initialized successfully")
 
 
+# ======================================================================
+# MONGODB CLIENT
+# ======================================================================
+def get_mongo_client() -> MongoClient:
+    """Return the process-wide MongoClient, creating it on first use."""
+    global mongo_client
+    if mongo_client is None:
+        # Lease heartbeats and meeting loads call this from worker threads
+        with mongo_client_lock:
+            if mongo_client is None:
+                mongo_client = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())
+    return mongo_client
+
+
+def get_db():
+    return get_mongo_client()["OMNI_MEET_DB"]
+
+
 # ======================================================================
 # FIND UNPROCESSED MEETINGS
 # ======================================================================
-def find_unprocessed_meetings() -> List[Dict[str, Any]]:
+# Meeting fields the scheduler needs; transcript bodies are never projected
+MEETING_FIELDS = [
+    "meeting_name", "meeting_time", "duration", "participants",
+    "processed", "transcript_ref", "content_hash",
+    "processing_owner", "lease_expires_at", "attempts", "retry_after"
+]
+
+
+def retry_backoff(attempts: int) -> timedelta:
+    """Wait before retrying a meeting that has failed `attempts` times."""
+    seconds = retry_backoff_seconds * 2 ** min(max(attempts - 1, 0), 20)
+    return timedelta(seconds=min(seconds, retry_backoff_max_seconds))
+
+
+def ensure_scheduler_indexes(collection):
+    """Partial index covering only projects that still have unprocessed meetings."""
+    collection.create_index(
+        "meetings.processed",
+        name="unprocessed_meetings",
+        partialFilterExpression={"meetings.processed": False}
+    )
+
+
+def iter_unprocessed_meetings() -> Iterator[Dict[str, Any]]:
     """
-    Find all unprocessed meetings from Raw_Transcripts collection.
+    Stream unprocessed meetings from Raw_Transcripts with a cursor.
     
-    Returns list of dictionaries with:
+    Only projects with at least one `processed: False` meeting are matched
+    (served by the partial index), transcript bodies are projected away and
+    meetings are unwound server-side, so the work done here scales with the
+    backlog rather than with total history. Meetings that failed and are
+    still inside their retry backoff are left out.
+    
+    Yields dictionaries with:
     - document_id: MongoDB _id of the document
     - meeting_index: Index of the meeting in the meetings array
-    - meeting_data: The meeting object
+    - meeting_data: The meeting object (without transcript text)
     - project_key: Project key
     - project_name: Project name
     """
+    collection = get_db()["Raw_Transcripts"]
+    
+    ensure_scheduler_indexes(collection)
+    
+    projection = {"Project_key": 1, "Project_name": 1}
+    projection.update({f"meetings.{field}": 1 for field in MEETING_FIELDS})
+    
+    pipeline = [
+        {"$match": {"meetings.processed": False}},
+        {"$project": projection},
+        {"$unwind": {"path": "$meetings", "includeArrayIndex": "meeting_index"}},
+        {"$match": {
+            "meetings.processed": False,
+            "meetings.retry_after": {"$not": {"$gt": datetime.now(timezone.utc)}}
+        }},
+    ]
+    
+    with collection.aggregate(pipeline, batchSize=100) as cursor:
+        for row in cursor:
+            yield {
+                "document_id": row["_id"],
+                "meeting_index": row["meeting_index"],
+                "meeting_data": row["meetings"],
+                "project_key": row.get("Project_key", ""),
+                "project_name": row.get("Project_name", "")
+            }
+
+
+def find_unprocessed_meetings() -> List[Dict[str, Any]]:
+    """
+    Find all unprocessed meetings from Raw_Transcripts collection.
+    
+    Returns the (transcript-free) items yielded by iter_unprocessed_meetings().
+    """
     if not mongo_uri:
         logger.error("MONGO_URI not configured")
         return []
     
     try:
-        client = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())
-        db = client["OMNI_MEET_DB"]
-        collection = db["Raw_Transcripts"]
-        
-        # Find all documents
-        documents = list(collection.find({}))
-        
-        unprocessed_meetings = []
-        
-        for doc in documents:
-            document_id = doc.get("_id")
-            project_key = doc.get("Project_key", "")
-            project_name = doc.get("Project_name", "")
-            meetings = doc.get("meetings", [])
-            
-            # Check each meeting in the array
-            for idx, meeting in enumerate(meetings):
-                # Check if processed field exists and is False, or doesn't exist
-                processed = meeting.get("processed", False)
-                
-                if not processed:
-                    unprocessed_meetings.append({
-                        "document_id": document_id,
-                        "meeting_index": idx,
-                        "meeting_data": meeting,
-                        "project_key": project_key,
-                        "project_name": project_name
-                    })
-        
+        unprocessed_meetings = list(iter_unprocessed_meetings())
         logger.info(f"Found {len(unprocessed_meetings)} unprocessed meeting(s)")
         return unprocessed_meetings
     
@@ -147,47 +262,165 @@ def find_unprocessed_meetings() -> List[Dict[str, Any]]:
 # ======================================================================
 # MARK MEETING AS PROCESSED
 # ======================================================================
-def mark_meeting_as_processed(document_id: ObjectId, meeting_index: int):
+def mark_meeting_as_processed(document_id: ObjectId, meeting_index: int) -> bool:
     """
-    Mark a meeting as processed in MongoDB.
+    Mark a meeting this worker has claimed as processed in MongoDB.
+    
+    The update only applies while this worker still holds an unexpired lease
+    on the meeting, so a worker whose lease was lost cannot complete it a
+    second time.
     
     Args:
         document_id: MongoDB _id of the document
         meeting_index: Index of the meeting in the meetings array
+    
+    Returns:
+        True if the meeting was marked, False if the lease was lost
     """
     if not mongo_uri:
         logger.error("MONGO_URI not configured")
-        return
+        return False
     
-    try:
-        client = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())
-        db = client["OMNI_MEET_DB"]
-        collection = db["Raw_Transcripts"]
-        
-        # Update the specific meeting's processed field
-        collection.update_one(
-            {"_id": document_id},
-            {"$set": {f"meetings.{meeting_index}.processed": True}}
-        )
-        
-        logger.success(f"Marked meeting at index {meeting_index} as processed for document {document_id}")
+    # Update the specific meeting's processed field and drop its lease
+    result = _raw_transcripts().update_one(
+        _held_lease_filter(document_id, meeting_index),
+        {
+            "$set": {f"meetings.{meeting_index}.processed": True},
+            "$unset": {
+                f"meetings.{meeting_index}.processing_owner": "",
+                f"meetings.{meeting_index}.lease_expires_at": ""
+            }
+        }
+    )
+    if result.matched_count == 0:
+        logger.warning(f"Lost lease on meeting at index {meeting_index} before completion "
+                       f"(Document: {document_id}); leaving it to its current owner")
+        return False
+    
+    logger.success(f"Marked meeting at index {meeting_index} as processed for document {document_id}")
+    return True
+
+
+# ======================================================================
+# MEETING LEASES
+# ======================================================================
+def _raw_transcripts():
+    return get_db()["Raw_Transcripts"]
+
+
+def _held_lease_filter(document_id: ObjectId, meeting_index: int) -> Dict[str, Any]:
+    """Matches the meeting only while this worker holds an unexpired lease on it."""
+    prefix = f"meetings.{meeting_index}"
+    return {
+        "_id": document_id,
+        f"{prefix}.processing_owner": worker_id,
+        f"{prefix}.lease_expires_at": {"$gt": datetime.now(timezone.utc)}
+    }
+
+
+def claim_meeting(document_id: ObjectId, meeting_index: int, meeting_name: str) -> bool:
+    """
+    Atomically claim a meeting for this worker.
+    
+    Succeeds only if the meeting is still unprocessed, has no live lease
+    (never leased, released, or expired) and is not waiting out a retry
+    backoff, so exactly one instance wins.
+    """
+    prefix = f"meetings.{meeting_index}"
+    now = datetime.now(timezone.utc)
+    
+    claimed = _raw_transcripts().find_one_and_update(
+        {
+            "_id": document_id,
+            f"{prefix}.meeting_name": meeting_name,
+            f"{prefix}.processed": False,
+            f"{prefix}.lease_expires_at": {"$not": {"$gt": now}},
+            f"{prefix}.retry_after": {"$not": {"$gt": now}}
+        },
+        {"$set": {
+            f"{prefix}.processing_owner": worker_id,
+            f"{prefix}.lease_expires_at": now + timedelta(seconds=lease_seconds),
+            f"{prefix}.processing_started_at": now
+        }},
+        projection={"_id": 1}
+    )
+    return claimed is not None
+
+
+def renew_lease(document_id: ObjectId, meeting_index: int) -> bool:
+    """Extend this worker's lease; False if it was lost to another worker."""
+    prefix = f"meetings.{meeting_index}"
+    result = _raw_transcripts().update_one(
+        {"_id": document_id, f"{prefix}.processing_owner": worker_id},
+        {"$set": {
+            f"{prefix}.lease_expires_at": datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        }}
+    )
+    return result.matched_count == 1
+
+
+def release_lease(document_id: ObjectId, meeting_index: int, attempts: Optional[int] = None):
+    """
+    Give a claimed meeting back so a later run (on any instance) retries it.
     
+    With `attempts` (the meeting's failure count including this one), the
+    failure is recorded and the retry is held off by retry_backoff(), so a
+    meeting that keeps failing is not re-run on every trigger.
+    """
+    prefix = f"meetings.{meeting_index}"
+    update: Dict[str, Any] = {
+        "$unset": {f"{prefix}.processing_owner": "", f"{prefix}.lease_expires_at": ""}
+    }
+    if attempts is not None:
+        now = datetime.now(timezone.utc)
+        update["$set"] = {
+            f"{prefix}.attempts": attempts,
+            f"{prefix}.last_failed_at": now,
+            f"{prefix}.retry_after": now + retry_backoff(attempts)
+        }
+    try:
+        _raw_transcripts().update_one(_held_lease_filter(document_id, meeting_index), update)
     except Exception as e:
-        logger.error(f"Error marking meeting as processed: {e}")
+        logger.error(f"Error releasing lease on meeting at index {meeting_index}: {e}")
+
+
+async def _heartbeat(document_id: ObjectId, meeting_index: int, run: asyncio.Task) -> bool:
+    """
+    Keep a claimed meeting's lease alive while the orchestrator runs.
+    
+    If the lease is lost to another worker, the run is cancelled so this
+    worker stops processing (and emailing) a meeting it no longer owns.
+    
+    Returns:
+        True once the lease has been lost and the run cancelled
+    """
+    while True:
+        await asyncio.sleep(heartbeat_seconds)
+        try:
+            renewed = await asyncio.to_thread(renew_lease, document_id, meeting_index)
+        except Exception as e:
+            logger.error(f"Lease heartbeat failed: {e}")
+            continue
+        if not renewed:
+            logger.warning(f"Lost lease on meeting at index {meeting_index} (Document: {document_id}); "
+                           f"cancelling its run")
+            run.cancel()
+            return True
 
 
 # ======================================================================
 # PROCESS A SINGLE MEETING
 # ======================================================================
-async def process_meeting(meeting_info: Dict[str, Any]) -> bool:
+async def process_meeting(meeting_info: Dict[str, Any]) -> Optional[bool]:
     """
-    Process a single meeting through the orchestrator workflow.
+    Claim a single meeting and process it through the orchestrator workflow.
     
     Args:
         meeting_info: Dictionary containing meeting information from find_unprocessed_meetings()
     
     Returns:
-        True if processing was successful, False otherwise
+        True if processing was successful, False otherwise, None if another
+        worker holds (or took over) the meeting's lease
     """
     if workflow is None:
         logger.error("Workflow not initialized")
@@ -199,17 +432,78 @@ async def process_meeting(meeting_info: Dict[str, Any]) -> bool:
     project_key = meeting_info["project_key"]
     project_name = meeting_info["project_name"]
     
+    try:
+        claimed = await asyncio.to_thread(
+            claim_meeting, document_id, meeting_index, meeting.get("meeting_name", "")
+        )
+    except Exception as e:
+        logger.error(f"Error claiming meeting at index {meeting_index} (Document: {document_id}): {e}")
+        return False
+    
+    if not claimed:
+        logger.info(f"Meeting '{meeting.get('meeting_name')}' is being processed by another worker. Skipping.")
+        return None
+    
+    run = asyncio.create_task(
+        _run_claimed_meeting(document_id, meeting_index, meeting, project_key, project_name)
+    )
+    heartbeat = asyncio.create_task(_heartbeat(document_id, meeting_index, run))
+    success = None
+    try:
+        success = await run
+        return success
+    except asyncio.CancelledError:
+        if heartbeat.done() and not heartbeat.cancelled() and heartbeat.result():
+            # Cancelled by the heartbeat: the meeting now belongs to another worker
+            return None
+        raise
+    finally:
+        heartbeat.cancel()
+        if success is False:
+            # A failed run backs off before the next attempt
+            attempts = meeting.get("attempts", 0) + 1
+            logger.warning(f"Meeting '{meeting.get('meeting_name')}' failed (attempt {attempts}); "
+                           f"retrying in {retry_backoff(attempts)}")
+            await asyncio.to_thread(release_lease, document_id, meeting_index, attempts)
+        elif not success:
+            # Cancelled, or the lease was lost: hand it back without counting a failure
+            await asyncio.to_thread(release_lease, document_id, meeting_index)
+
+
+async def _run_claimed_meeting(
+    document_id: ObjectId,
+    meeting_index: int,
+    meeting: Dict[str, Any],
+    project_key: str,
+    project_name: str
+) -> Optional[bool]:
+    """
+    Run the orchestrator for a meeting this worker has claimed.
+    
+    Returns:
+        True on success, False on failure, None if the lease was lost before
+        the meeting could be marked processed
+    """
     try:
         logger.info(f"Processing meeting: {meeting.get('meeting_name', 'Unknown')} "
                    f"(Document: {document_id}, Index: {meeting_index})")
         
-        # Extract transcript text
-        transcript_text = ""
-        if "Transcript" in meeting and meeting["Transcript"]:
-            if isinstance(meeting["Transcript"], list):
-                transcript_text = meeting["Transcript"][0] if meeting["Transcript"] else ""
-            else:
-                transcript_text = str(meeting["Transcript"])
+        db = get_db()
+        
+        # Skip identical transcripts before touching the text or any LLM
+        content_hash = meeting.get("content_hash")
+        if content_hash and is_transcript_processed(db, content_hash):
+            logger.info(f"Identical transcript already processed for meeting "
+                       f"'{meeting.get('meeting_name')}'. Skipping.")
+            if not await asyncio.to_thread(mark_meeting_as_processed, document_id, meeting_index):
+                return None
+            return True
+        
+        # Load (and decompress) transcript text only now that it is needed
+        transcript_text = load_transcript_text(db, meeting)
+        if not transcript_text and not meeting.get("transcript_ref"):
+            # Legacy inline transcript: fetch just this meeting's body
+            transcript_text = load_inline_transcript(db, document_id, meeting_index)
         
         if not transcript_text:
             logger.warning(f"No transcript text found for meeting at index {meeting_index}")
@@ -222,15 +516,24 @@ async def process_meeting(meeting_info: Dict[str, Any]) -> bool:
             project_name=project_name,
             meeting_name=meeting.get("meeting_name", ""),
             participants=meeting.get("participants", []),
-            participant_db_path=participant_db_path
+            participant_db_path=participant_db_path,
+            content_hash=content_hash,
+            email_mode="digest" if email_digest_mode else "immediate"
         )
         
         # Run orchestrator workflow
         logger.info(f"Running orchestrator workflow for meeting: {meeting.get('meeting_name')}")
         final_state = await workflow.ainvoke(initial_state)
         
-        # Mark as processed only if workflow completed successfully
-        mark_meeting_as_processed(document_id, meeting_index)
+        # Mark as processed only if workflow completed successfully, and only
+        # while this worker still owns the meeting
+        if not await asyncio.to_thread(mark_meeting_as_processed, document_id, meeting_index):
+            return None
+        
+        # Queue rendered sections for the digest instead of per-meeting emails
+        email_result = final_state.get("email_result") or {}
+        if email_result.get("digest_items"):
+            email_digest.add(email_result["digest_items"])
         
         logger.success(f"Successfully processed meeting: {meeting.get('meeting_name')}")
         return True
@@ -240,12 +543,109 @@ async def process_meeting(meeting_info: Dict[str, Any]) -> bool:
         return False
 
 
+# ======================================================================
+# WORKER POOL
+# ======================================================================
+def group_meetings_by_project(unprocessed: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Group backlog items by project document, each group in meeting_time order."""
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for meeting_info in unprocessed:
+        groups.setdefault(meeting_info["document_id"], []).append(meeting_info)
+    
+    for group in groups.values():
+        group.sort(key=lambda m: (m["meeting_data"].get("meeting_time") or "", m["meeting_index"]))
+    
+    return list(groups.values())
+
+
+async def run_worker_pool(unprocessed: List[Dict[str, Any]]):
+    """
+    Process the backlog with up to `scheduler_concurrency` workers.
+    
+    Each worker takes a whole project and runs its meetings sequentially, so
+    per-project summaries see meetings in order while different projects run
+    in parallel. LLM calls from all workers share `llm_rate_limiter`. If a
+    meeting fails, the project's later meetings are deferred to the next run;
+    if another scheduler instance holds its lease, the project is left to it.
+    """
+    groups = group_meetings_by_project(unprocessed)
+    queue: asyncio.Queue = asyncio.Queue()
+    for group in groups:
+        queue.put_nowait(group)
+    
+    worker_pool_status.update({
+        "running": True,
+        "total": len(unprocessed),
+        "completed": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "deferred": 0,
+        "claimed_elsewhere": 0,
+        "queue_depth": queue.qsize(),
+        "active_projects": 0,
+    })
+    
+    async def worker(slot: int):
+        while True:
+            try:
+                group = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            worker_pool_status["queue_depth"] = queue.qsize()
+            worker_pool_status["active_projects"] += 1
+            try:
+                for position, meeting_info in enumerate(group):
+                    success = await process_meeting(meeting_info)
+                    
+                    if success is None:
+                        # Another instance holds this project's next meeting; leave the project to it
+                        worker_pool_status["claimed_elsewhere"] += len(group) - position
+                        break
+                    
+                    worker_pool_status["completed"] += 1
+                    worker_pool_status["succeeded" if success else "failed"] += 1
+                    logger.info(f"[worker {slot}] Progress: {worker_pool_status['completed']}/"
+                               f"{worker_pool_status['total']} meeting(s), "
+                               f"{worker_pool_status['queue_depth']} project(s) queued, "
+                               f"{worker_pool_status['active_projects']} in progress")
+                    
+                    if not success:
+                        remaining = len(group) - position - 1
+                        if remaining:
+                            worker_pool_status["deferred"] += remaining
+                            logger.warning(f"[worker {slot}] Deferring {remaining} later meeting(s) "
+                                          f"of project '{meeting_info['project_name']}' to keep order")
+                        break
+            finally:
+                worker_pool_status["active_projects"] -= 1
+    
+    workers = min(scheduler_concurrency, len(groups))
+    logger.info(f"Starting {workers} worker(s) for {len(groups)} project(s)")
+    try:
+        await asyncio.gather(*(worker(i + 1) for i in range(workers)))
+    finally:
+        worker_pool_status["running"] = False
+        worker_pool_status["queue_depth"] = 0
+
+
+def get_scheduler_status() -> Dict[str, Any]:
+    """Snapshot of the worker pool's progress and queue depth."""
+    return {
+        "scheduler_running": scheduler is not None,
+        "trigger_mode": change_watcher.mode if change_watcher else "cron",
+        "worker_id": worker_id,
+        **worker_pool_status
+    }
+
+
 # ======================================================================
 # SCHEDULED JOB: PROCESS ALL UNPROCESSED MEETINGS
 # ======================================================================
 async def process_unprocessed_meetings():
     """
-    Scheduled job that runs every hour to process all unprocessed meetings.
+    Job that processes all unprocessed meetings (triggered by new transcripts,
+    polling or the hourly safety-net check).
     
     This function will process ALL unprocessed meetings it finds, regardless of
     when they were added. This means if the system was offline, it will catch up
@@ -255,8 +655,8 @@ async def process_unprocessed_meetings():
     logger.info(f"Scheduled job started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("=" * 60)
     
-    # Find unprocessed meetings
-    unprocessed = find_unprocessed_meetings()
+    # Find unprocessed meetings (off the event loop)
+    unprocessed = await asyncio.to_thread(find_unprocessed_meetings)
     
     if not unprocessed:
         logger.info("No unprocessed meetings found. Skipping.")
@@ -265,28 +665,74 @@ async def process_unprocessed_meetings():
     logger.info(f"Processing {len(unprocessed)} unprocessed meeting(s)...")
     logger.info("Note: This includes any meetings that were missed while the system was offline.")
     
-    # Process each meeting
-    success_count = 0
-    failure_count = 0
+    # Process projects in parallel, each project's meetings in order
+    await run_worker_pool(unprocessed)
+    success_count = worker_pool_status["succeeded"]
+    failure_count = worker_pool_status["failed"]
     
-    for meeting_info in unprocessed:
-        success = await process_meeting(meeting_info)
-        if success:
-            success_count += 1
-        else:
-            failure_count += 1
+    # Digest per run: send one combined email per recipient now
+    if email_digest_mode and email_digest_window_minutes <= 0:
+        await flush_email_digest()
     
     logger.info("=" * 60)
-    logger.info(f"Job completed: {success_count} succeeded, {failure_count} failed")
+    logger.info(f"Job completed: {success_count} succeeded, {failure_count} failed, "
+               f"{worker_pool_status['deferred']} deferred, "
+               f"{worker_pool_status['claimed_elsewhere']} claimed by other workers")
     logger.info("=" * 60)
 
 
+async def trigger_processing():
+    """
+    Run process_unprocessed_meetings, coalescing concurrent triggers.
+    
+    Change stream events, polling, the hourly cron and manual checks all come
+    through here. If a run is already in progress the request is recorded and
+    one more run starts when it finishes, so nothing is missed and runs never
+    overlap. The run is kept as a task so stop_scheduler() can cancel it.
+    """
+    global _rerun_requested, _active_run
+    
+    if _active_run is not None and not _active_run.done():
+        _rerun_requested = True
+        logger.info("Processing already running; queued a follow-up run")
+        return
+    
+    _active_run = asyncio.create_task(_process_until_caught_up())
+    await _active_run
+
+
+async def _process_until_caught_up():
+    global _rerun_requested
+    
+    while True:
+        _rerun_requested = False
+        await process_unprocessed_meetings()
+        if not _rerun_requested:
+            break
+
+
+# ======================================================================
+# EMAIL DIGEST FLUSH
+# ======================================================================
+async def flush_email_digest():
+    """Send all queued digest sections, one email per recipient."""
+    if not len(email_digest):
+        return
+    
+    try:
+        result = await asyncio.to_thread(email_digest.flush)
+        logger.success(f"Email digest sent to {len(result['delivered'])} recipient(s), "
+                      f"{len(result['failed'])} failed")
+    except Exception as e:
+        logger.error(f"Error sending email digest: {e}")
+
+
 # ======================================================================
 # SCHEDULER SETUP
 # ======================================================================
 def start_scheduler():
     """Start the background scheduler"""
-    global scheduler
+    global scheduler, change_watcher
     
     if scheduler is not None:
         logger.warning("Scheduler is already running")
@@ -300,32 +746,74 @@ def start_scheduler():
     # Create scheduler
     scheduler = AsyncIOScheduler()
     
-    # Schedule job to run every hour
+    # Hourly safety net (catches anything the event trigger missed)
     scheduler.add_job(
-        process_unprocessed_meetings,
+        trigger_processing,
         trigger=CronTrigger(minute=0),  # Run at the start of every hour
         id="process_meetings",
         name="Process unprocessed meetings",
         replace_existing=True
     )
     
+    # Flush digests on a fixed window if configured
+    if email_digest_mode and email_digest_window_minutes > 0:
+        scheduler.add_job(
+            flush_email_digest,
+            trigger=IntervalTrigger(minutes=email_digest_window_minutes),
+            id="flush_email_digest",
+            name="Send batched email digests",
+            replace_existing=True
+        )
+        logger.info(f"Email digest mode: flushing every {email_digest_window_minutes} minute(s)")
+    
     # Start scheduler
     scheduler.start()
-    logger.success("Background scheduler started. Will check for new transcripts every hour.")
+    
+    # React to new transcripts within seconds
+    if event_driven and mongo_uri:
+        change_watcher = TranscriptChangeWatcher(mongo_uri, trigger_processing)
+        change_watcher.start()
+        logger.success("Background scheduler started. New transcripts are processed as they arrive "
+                      "(hourly check kept as a safety net).")
+    else:
+        logger.success("Background scheduler started. Will check for new transcripts every hour.")
     logger.info("IMPORTANT: Scheduler runs in-process. If the system goes offline, it will catch up")
-    logger.info("on all unprocessed meetings when it comes back online (on the next hourly check).")
+    logger.info("on all unprocessed meetings when it comes back online.")
 
 
-def stop_scheduler():
-    """Stop the background scheduler"""
-    global scheduler
+async def stop_scheduler():
+    """
+    Stop the background scheduler.
+    
+    A processing run in progress is cancelled and awaited, so after a
+    demotion this instance does not keep working alongside the new leader
+    (the leases of meetings it had claimed are released as the run unwinds).
+    """
+    global scheduler, change_watcher, _active_run
     
     if scheduler is None:
         return
     
     logger.info("Stopping background scheduler...")
-    scheduler.shutdown()
+    if change_watcher is not None:
+        change_watcher.stop()
+        change_watcher = None
+    scheduler.shutdown(wait=False)
     scheduler = None
+    
+    if _active_run is not None and not _active_run.done():
+        logger.info("Cancelling the processing run in progress")
+        _active_run.cancel()
+        try:
+            await _active_run
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Processing run failed while stopping: {e}")
+    _active_run = None
+    
+    # Don't drop sections still waiting for the next digest window
+    await flush_email_digest()
     logger.success("Background scheduler stopped")
 
 
@@ -335,7 +823,7 @@ def stop_scheduler():
 async def run_manual_check():
     """Manually trigger processing of unprocessed meetings (for testing)"""
     logger.info("Manual check triggered")
-    await process_unprocessed_meetings()
+    await trigger_processing()
 
 
 if __name__ == "__main__":
@@ -343,10 +831,11 @@ if __name__ == "__main__":
     logger.info("Starting scheduler as standalone service...")
     start_scheduler()
     
+    loop = asyncio.get_event_loop()
     try:
         # Keep the script running
-        asyncio.get_event_loop().run_forever()
+        loop.run_forever()
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-        stop_scheduler()
+        loop.run_until_complete(stop_scheduler())
 
@@ -0,0 +1,207 @@
+"""
+Event-driven trigger for the meeting scheduler.
+
+Watches Raw_Transcripts with a MongoDB change stream and asks the scheduler
+to run as soon as a meeting is added, instead of waiting for the hourly cron.
+The stream's resume token is persisted in the Scheduler_state collection, so a
+restart picks up where the last process stopped (and a catch-up run covers
+anything older than the oplog).
+
+Change streams need a replica set or Atlas. On a standalone mongod the watcher
+falls back to polling every SCHEDULER_POLL_SECONDS for meetings that are ready
+to run: unprocessed, not leased by a live worker and not waiting out a retry
+backoff after a failure (an indexed lookup; a run is triggered only when one
+is found). A meeting that keeps failing is therefore retried on its backoff
+schedule, not on every poll.
+"""
+import os
+import re
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from pymongo import MongoClient
+from pymongo.errors import OperationFailure, PyMongoError
+from loguru import logger
+import certifi
+
+DB_NAME = "OMNI_MEET_DB"
+RAW_COLLECTION = "Raw_Transcripts"
+STATE_COLLECTION = "Scheduler_state"
+RESUME_TOKEN_ID = "raw_transcripts_change_stream"
+
+poll_interval_seconds = max(1, int(os.getenv("SCHEDULER_POLL_SECONDS", 30)))
+debounce_seconds = float(os.getenv("SCHEDULER_EVENT_DEBOUNCE_SECONDS", 2))
+reconnect_seconds = 5
+
+# Mongo error codes: change streams unsupported (standalone), resume point gone
+CHANGE_STREAMS_UNSUPPORTED = {40573}
+CHANGE_STREAM_HISTORY_LOST = {286, 280}
+
+# A $push to meetings shows up as "meetings.N" (or "meetings" on a rewrite);
+# "meetings.N.processed" and other per-meeting bookkeeping must not retrigger
+MEETING_FIELD = re.compile(r"^meetings(\.\d+)?$")
+
+
+def ready_meeting_query(now: datetime) -> Dict[str, Any]:
+    """Projects with a meeting that a scheduler run would claim right now."""
+    return {
+        # Keeps the lookup on the scheduler's partial index
+        "meetings.processed": False,
+        "meetings": {"$elemMatch": {
+            "processed": False,
+            "lease_expires_at": {"$not": {"$gt": now}},
+            "retry_after": {"$not": {"$gt": now}}
+        }}
+    }
+
+
+def is_new_meeting_event(change: Dict[str, Any]) -> bool:
+    """True if a change stream event added (or replaced) meetings."""
+    operation = change.get("operationType")
+    if operation in ("insert", "replace"):
+        return True
+    if operation == "update":
+        updated = change.get("updateDescription", {}).get("updatedFields", {})
+        return any(MEETING_FIELD.match(field) for field in updated)
+    return False
+
+
+class TranscriptChangeWatcher:
+    """
+    Runs `on_change` when new meetings arrive in Raw_Transcripts.
+
+    Bursts of events (several transcripts uploaded together) are debounced
+    into a single trigger; the scheduler itself coalesces overlapping runs.
+    """
+
+    def __init__(self, mongo_uri: str, on_change: Callable[[], Awaitable[None]]):
+        self.mongo_uri = mongo_uri
+        self.on_change = on_change
+        self.mode: Optional[str] = None  # "change_stream" or "polling"
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    def stop(self):
+        self._stopping = True
+        for task in (self._pending, self._task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._task = None
+        self._pending = None
+
+    def _client(self) -> MongoClient:
+        return MongoClient(self.mongo_uri, tls=True, tlsCAFile=certifi.where())
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await self._watch()
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code in CHANGE_STREAMS_UNSUPPORTED or "replica set" in str(e).lower():
+                    logger.warning(f"Change streams unavailable ({e}); "
+                                   f"polling every {poll_interval_seconds}s instead")
+                    await self._poll()
+                    return
+                logger.error(f"Change stream failed: {e}. Reconnecting in {reconnect_seconds}s")
+            except PyMongoError as e:
+                logger.error(f"Change stream interrupted: {e}. Reconnecting in {reconnect_seconds}s")
+            await asyncio.sleep(reconnect_seconds)
+
+    # ---------------------------------------------------------
+    # Change stream mode
+    # ---------------------------------------------------------
+    async def _watch(self):
+        client = self._client()
+        db = client[DB_NAME]
+        collection = db[RAW_COLLECTION]
+        state = db[STATE_COLLECTION]
+
+        saved = await asyncio.to_thread(state.find_one, {"_id": RESUME_TOKEN_ID})
+        resume_token = saved.get("resume_token") if saved else None
+
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}}]
+        try:
+            stream = await asyncio.to_thread(
+                collection.watch, pipeline, resume_after=resume_token, max_await_time_ms=1000
+            )
+        except OperationFailure as e:
+            if resume_token is None or e.code not in CHANGE_STREAM_HISTORY_LOST:
+                raise
+            # Token fell off the oplog; the catch-up run below covers the gap
+            logger.warning("Stored resume token expired; restarting change stream from now")
+            stream = await asyncio.to_thread(collection.watch, pipeline, max_await_time_ms=1000)
+
+        self.mode = "change_stream"
+        logger.success(f"Watching {RAW_COLLECTION} for new transcripts"
+                       f"{' (resumed)' if resume_token else ''}")
+        self._schedule_trigger()  # catch up on anything missed while down
+
+        try:
+            while not self._stopping:
+                change = await asyncio.to_thread(stream.try_next)
+                if change is None:
+                    continue
+                if is_new_meeting_event(change):
+                    logger.info(f"New transcript event ({change['operationType']}) "
+                                f"for document {change.get('documentKey', {}).get('_id')}")
+                    self._schedule_trigger()
+                await asyncio.to_thread(
+                    state.update_one,
+                    {"_id": RESUME_TOKEN_ID},
+                    {"$set": {"resume_token": stream.resume_token}},
+                    upsert=True
+                )
+        finally:
+            await asyncio.to_thread(stream.close)
+            client.close()
+
+    def _schedule_trigger(self):
+        """Debounce: restart the countdown on every event, fire once it goes quiet."""
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+        self._pending = asyncio.get_event_loop().create_task(self._fire_after_debounce())
+
+    async def _fire_after_debounce(self):
+        await asyncio.sleep(debounce_seconds)
+        # Past the countdown: later events start a new one instead of cancelling this run
+        self._pending = None
+        try:
+            await self.on_change()
+        except Exception as e:
+            logger.error(f"Event-triggered processing failed: {e}")
+
+    # ---------------------------------------------------------
+    # Polling fallback
+    # ---------------------------------------------------------
+    async def _poll(self):
+        self.mode = "polling"
+        collection = self._client()[DB_NAME][RAW_COLLECTION]
+
+        # Served by the scheduler's partial index on unprocessed meetings, so each
+        # poll touches only the backlog, never the whole collection. Meetings
+        # backing off after a failure or leased elsewhere don't count as work
+        while not self._stopping:
+            try:
+                pending = await asyncio.to_thread(
+                    collection.find_one, ready_meeting_query(datetime.now(timezone.utc)), {"_id": 1}
+                )
+                if pending:
+                    logger.info("Unprocessed meeting(s) detected by polling")
+                    await self.on_change()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Polling for new meetings failed: {e}")
+            await asyncio.sleep(poll_interval_seconds)
@@ -0,0 +1,243 @@
+"""
+Bounded, version-checked caches for per-project chatbot state.
+
+Entries are evicted least-recently-used once either the entry count or the
+estimated memory footprint exceeds its limit, and expire after a TTL. Each
+entry is stored with the project's `content_version` (a counter on the
+Raw_Transcripts document, incremented whenever meetings, transcript chunks or
+summary points are written), and a lookup with a newer version is treated as
+a miss. Because the version lives in MongoDB, every worker process sees the
+same invalidations without sharing the cached objects themselves.
+
+Configuration (environment):
+    CHAT_CACHE_MAX_ENTRIES   projects kept per process (default 32)
+    CHAT_CACHE_MAX_MB        estimated memory budget (default 512)
+    CHAT_CACHE_TTL_SECONDS   maximum entry age (default 3600)
+
+SemanticAnswerCache keeps previous answers per project, keyed by the
+question's vector, and returns one when a new question is close enough
+(cosine similarity) at the same content version.
+
+    CHAT_ANSWER_CACHE_SIZE       answers kept per project (default 200)
+    CHAT_ANSWER_CACHE_THRESHOLD  minimum similarity for a hit (default 0.92)
+    CHAT_ANSWER_CACHE_PROJECTS   projects kept per process (default 64)
+"""
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class BoundedTTLCache:
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        sizeof: Callable[[Any], int]
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof
+
+        # key -> (value, version, stored_at, size)
+        self._entries: "OrderedDict[str, Tuple[Any, Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "expirations": 0}
+
+    def _drop(self, key: str):
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str, version: Any = None) -> Optional[Any]:
+        """Return the cached value if present, fresh and at `version`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, cached_version, stored_at, _ = entry
+            if cached_version != version:
+                self._drop(key)
+                self._stats["invalidations"] += 1
+                self._stats["misses"] += 1
+                return None
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                self._drop(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any, version: Any = None):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, version, time.monotonic(), size)
+            self._bytes += size
+
+            # Evict least recently used, but never the entry just added
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+                self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+def cache_settings_from_env() -> Dict[str, Any]:
+    return {
+        "max_entries": max(1, int(os.getenv("CHAT_CACHE_MAX_ENTRIES", 32))),
+        "max_bytes": int(float(os.getenv("CHAT_CACHE_MAX_MB", 512)) * 1024 * 1024),
+        "ttl_seconds": float(os.getenv("CHAT_CACHE_TTL_SECONDS", 3600)),
+    }
+
+
+class SemanticAnswerCache:
+    def __init__(
+        self,
+        max_per_project: int,
+        threshold: float,
+        ttl_seconds: float,
+        max_projects: int
+    ):
+        self.max_per_project = max_per_project
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_projects = max_projects
+
+        # project_id -> {"version", "vectors" (n x dim, unit rows), "answers", "stored_at"}
+        self._projects: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "stores": 0}
+
+    def _project(self, project_id: str, version: Any) -> Optional[Dict[str, Any]]:
+        project = self._projects.get(project_id)
+        if project is not None and project["version"] != version:
+            del self._projects[project_id]
+            self._stats["invalidations"] += 1
+            return None
+        return project
+
+    def get(self, project_id: str, version: Any, vector: Optional[np.ndarray]) -> Optional[Dict[str, Any]]:
+        """
+        Most similar cached answer for this project and content version, if
+        its similarity to `vector` reaches the threshold. The returned dict
+        has the stored fields plus `similarity`.
+        """
+        if vector is None:
+            return None
+
+        with self._lock:
+            project = self._project(project_id, version)
+            if project is None or not project["answers"]:
+                self._stats["misses"] += 1
+                return None
+
+            similarities = project["vectors"] @ vector
+            # Expired answers never match
+            age = time.monotonic() - project["stored_at"]
+            similarities[age > self.ttl_seconds] = -1.0
+
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                self._stats["misses"] += 1
+                return None
+
+            self._projects.move_to_end(project_id)
+            self._stats["hits"] += 1
+            return {**project["answers"][best], "similarity": round(similarity, 4)}
+
+    def put(self, project_id: str, version: Any, vector: Optional[np.ndarray], answer: Dict[str, Any]):
+        if vector is None:
+            return
+
+        with self._lock:
+            project = self._project(project_id, version)
+            if project is None:
+                project = {
+                    "version": version,
+                    "vectors": np.zeros((0, vector.shape[0]), dtype=np.float32),
+                    "answers": [],
+                    "stored_at": np.zeros(0)
+                }
+                self._projects[project_id] = project
+            self._projects.move_to_end(project_id)
+
+            # Oldest answers go first once the project is full
+            drop = max(0, len(project["answers"]) + 1 - self.max_per_project)
+            project["vectors"] = np.vstack([project["vectors"][drop:], vector[None, :].astype(np.float32)])
+            project["answers"] = project["answers"][drop:] + [answer]
+            project["stored_at"] = np.append(project["stored_at"][drop:], time.monotonic())
+            self._stats["stores"] += 1
+
+            while len(self._projects) > self.max_projects:
+                self._projects.popitem(last=False)
+
+    def invalidate(self, project_id: str):
+        with self._lock:
+            if self._projects.pop(project_id, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "projects": len(self._projects),
+                "answers": sum(len(p["answers"]) for p in self._projects.values()),
+                "threshold": self.threshold,
+            }
+
+
+def answer_cache_settings_from_env() -> Dict[str, Any]:
+    return {
+        "max_per_project": max(1, int(os.getenv("CHAT_ANSWER_CACHE_SIZE", 200))),
+        "threshold": float(os.getenv("CHAT_ANSWER_CACHE_THRESHOLD", 0.92)),
+        "ttl_seconds": float(os.getenv("CHAT_CACHE_TTL_SECONDS", 3600)),
+        "max_projects": max(1, int(os.getenv("CHAT_ANSWER_CACHE_PROJECTS", 64))),
+    }
@@ -0,0 +1,196 @@
+"""
+Server-side conversational memory for chat sessions.
+
+Each session (per project) is a Chat_sessions document holding the most
+recent turns verbatim and a rolling summary of older ones. The history
+block added to the prompt is the summary plus the last CHAT_MEMORY_TURNS
+turns, clipped to a budget of CHAT_MEMORY_TOKENS, so prompt size stays
+constant however long the conversation runs. Once a session holds
+CONDENSE_AT_TURNS turns (twice CHAT_MEMORY_TURNS), all but the last
+CHAT_MEMORY_TURNS are folded into the summary by the LLM in one call (see
+condense_session), off the request path.
+
+Sessions live in MongoDB so any worker can serve the next turn, and expire
+CHAT_SESSION_TTL_SECONDS after their last use.
+
+Configuration (environment):
+    CHAT_MEMORY_TURNS         turns kept verbatim (default 4)
+    CHAT_MEMORY_TOKENS        token budget of the history block (default 1000)
+    CHAT_SESSION_TTL_SECONDS  idle time before a session expires (default 7 days)
+"""
+import os
+import uuid
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from pymongo import ReturnDocument
+
+
+SESSION_COLLECTION = "Chat_sessions"
+
+MEMORY_TURNS = max(1, int(os.getenv("CHAT_MEMORY_TURNS", 4)))
+MEMORY_TOKENS = int(os.getenv("CHAT_MEMORY_TOKENS", 1000))
+SUMMARY_TOKENS = MEMORY_TOKENS // 3          # share of the budget for the rolling summary
+CONDENSE_AT_TURNS = 2 * MEMORY_TURNS         # condense in batches, not on every turn
+SESSION_TTL_SECONDS = int(os.getenv("CHAT_SESSION_TTL_SECONDS", 7 * 24 * 3600))
+
+CHARS_PER_TOKEN = 4  # rough estimate; no tokenizer dependency
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _clip(text: str, tokens: int) -> str:
+    limit = tokens * CHARS_PER_TOKEN
+    return text if len(text) <= limit else text[:limit].rstrip() + " ..."
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _session_key(session_id: str, project_id: str) -> str:
+    # Memory is per project, so switching projects in one session starts fresh
+    return f"{session_id}:{project_id}"
+
+
+def ensure_session_indexes(db):
+    db[SESSION_COLLECTION].create_index("updated_at", expireAfterSeconds=SESSION_TTL_SECONDS)
+
+
+# ======================================================================
+# LOADING AND RENDERING
+# ======================================================================
+def empty_session() -> Dict[str, Any]:
+    return {"summary": "", "turns": []}
+
+
+def load_session(db, session_id: str, project_id: str) -> Dict[str, Any]:
+    """The session's summary and verbatim turns (empty if it is new)."""
+    doc = db[SESSION_COLLECTION].find_one(
+        {"_id": _session_key(session_id, project_id)},
+        {"_id": 0, "summary": 1, "turns": 1}
+    )
+    return {"summary": (doc or {}).get("summary", ""), "turns": (doc or {}).get("turns", [])}
+
+
+def session_from_history(chat_history: Optional[List[Dict[str, str]]]) -> Dict[str, Any]:
+    """
+    Session built from a client-sent chat_history ([{role, content}, ...]),
+    for clients that do not use session ids. Only user/assistant pairs are
+    kept; anything before the first user message (greetings) is dropped.
+    """
+    turns = []
+    question = None
+    for message in chat_history or []:
+        role, content = message.get("role"), message.get("content", "")
+        if role == "user":
+            question = content
+        elif role == "assistant" and question is not None:
+            turns.append({"question": question, "answer": content})
+            question = None
+    return {"summary": "", "turns": turns[-MEMORY_TURNS:]}
+
+
+def render_history(session: Dict[str, Any]) -> str:
+    """
+    History block for the prompt: the rolling summary, then as many of the
+    last MEMORY_TURNS turns as fit the token budget (newest kept first).
+    Empty string for a new session.
+    """
+    summary = _clip(session.get("summary", ""), SUMMARY_TOKENS)
+    turns = session.get("turns", [])[-MEMORY_TURNS:]
+    if not summary and not turns:
+        return ""
+
+    budget = MEMORY_TOKENS - (estimate_tokens(summary) if summary else 0)
+    per_turn = max(1, budget // MEMORY_TURNS)
+    rendered = []
+    for turn in reversed(turns):
+        text = _clip(f"User: {turn['question']}\nAssistant: {turn['answer']}", per_turn)
+        budget -= estimate_tokens(text)
+        if budget < 0:
+            break
+        rendered.append(text)
+
+    parts = ["Conversation so far:"]
+    if summary:
+        parts.append(f"(Summary of earlier conversation) {summary}")
+    parts.extend(reversed(rendered))
+    return "\n".join(parts) + "\n"
+
+
+def last_question(session: Dict[str, Any]) -> Optional[str]:
+    turns = session.get("turns", [])
+    return turns[-1]["question"] if turns else None
+
+
+# ======================================================================
+# RECORDING AND CONDENSING
+# ======================================================================
+def record_turn(db, session_id: str, project_id: str, question: str, answer: str) -> int:
+    """
+    Append a turn to the session (creating it if needed).
+
+    Returns:
+        Number of verbatim turns now stored
+    """
+    now = datetime.now(timezone.utc)
+    doc = db[SESSION_COLLECTION].find_one_and_update(
+        {"_id": _session_key(session_id, project_id)},
+        {
+            "$setOnInsert": {
+                "session_id": session_id,
+                "project_id": project_id,
+                "summary": "",
+                "summary_version": 0,
+                "created_at": now
+            },
+            "$set": {"updated_at": now},
+            "$push": {"turns": {"id": uuid.uuid4().hex, "question": question, "answer": answer}}
+        },
+        projection={"turns.id": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return len(doc.get("turns", []))
+
+
+async def condense_session(db, session_id: str, project_id: str, chain: Any) -> bool:
+    """
+    Fold the turns older than the last MEMORY_TURNS into the rolling summary.
+
+    `chain` takes {summary, turns, max_words} and returns the new summary.
+    The update only applies if no other worker condensed the session in the
+    meantime; turns added during the LLM call are kept.
+
+    Returns:
+        True if the summary was updated
+    """
+    key = _session_key(session_id, project_id)
+    doc = await asyncio.to_thread(db[SESSION_COLLECTION].find_one, {"_id": key})
+    if not doc or len(doc.get("turns", [])) <= MEMORY_TURNS:
+        return False
+
+    folded = doc["turns"][:-MEMORY_TURNS]
+    summary = await chain.ainvoke({
+        "summary": doc.get("summary") or "(none)",
+        "turns": "\n".join(f"User: {t['question']}\nAssistant: {t['answer']}" for t in folded),
+        "max_words": SUMMARY_TOKENS * 3 // 4
+    })
+
+    result = await asyncio.to_thread(
+        db[SESSION_COLLECTION].update_one,
+        {"_id": key, "summary_version": doc.get("summary_version", 0)},
+        {
+            "$set": {"summary": _clip(summary.strip(), SUMMARY_TOKENS)},
+            "$inc": {"summary_version": 1},
+            "$pull": {"turns": {"id": {"$in": [t["id"] for t in folded]}}}
+        }
+    )
+    if result.modified_count:
+        logger.info(f"Condensed {len(folded)} turn(s) of chat session {session_id}")
+    return bool(result.modified_count)
@@ -1,9 +1,14 @@
 """
-OrbitMeetAI Chatbot - Simple document-based chatbot using MongoDB Raw Transcripts.
-Fetches full transcripts from MongoDB and uses LLM for question answering.
+OrbitMeetAI Chatbot - Retrieval-based chatbot over MongoDB Raw Transcripts.
+Answers first from a small context of meeting summaries and participant
+insights, and escalates to the transcript chunks most relevant to the
+question (see retrieval.py) when the summaries are not enough.
 """
 import os
-from typing import List, Dict, Any, Optional
+import re
+import asyncio
+import threading
+from typing import List, Dict, Any, Optional, AsyncIterator
 from pymongo import MongoClient
 from bson import ObjectId
 from bson.errors import InvalidId
@@ -14,6 +19,36 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from loguru import logger
 
+from src.chatbot.retrieval import (
+    ProjectIndex,
+    format_context,
+    question_vector,
+    DEFAULT_TOP_K,
+    KIND_SUMMARY,
+    KIND_TRANSCRIPT,
+    KIND_PARTICIPANT,
+    KIND_PROJECT_SUMMARY
+)
+from src.chatbot.project_names import ProjectNameIndex
+from src.chatbot.memory import (
+    CONDENSE_AT_TURNS,
+    empty_session,
+    load_session,
+    session_from_history,
+    render_history,
+    last_question,
+    record_turn,
+    condense_session,
+    new_session_id,
+    ensure_session_indexes
+)
+from src.chatbot.cache import (
+    BoundedTTLCache,
+    SemanticAnswerCache,
+    cache_settings_from_env,
+    answer_cache_settings_from_env
+)
+
 load_dotenv()
 
 # ======================================================================
@@ -32,111 +67,99 @@ logger.add(
 # GLOBAL STATE
 # ======================================================================
 mongo_uri = os.getenv("MONGO_URI")
-chatbot_instances: Dict[str, Any] = {}  # Cache chatbot chains by project_id
+chatbot_chain: Optional[Any] = None  # One chain shared by every project
+summary_chain: Optional[Any] = None  # First-tier chain (summaries only)
+condense_chain: Optional[Any] = None  # Folds old chat turns into a session summary
+cross_project_chain: Optional[Any] = None  # Answers over snippets from several projects
+session_indexes_ready = False
+background_tasks: set = set()  # Session condensing runs after the answer is sent
 
+# Answer from summaries first and fall back to transcript chunks only when
+# the model reports the summaries are not enough
+tiered_chat = os.getenv("CHAT_TIERED", "true").lower() in ("1", "true", "yes")
+SUMMARY_TOP_K = int(os.getenv("CHAT_SUMMARY_TOP_K", 8))
+SUMMARY_MEETINGS = 3  # meetings whose participant insights join the summary context
 
-# ======================================================================
-# FETCH FULL TRANSCRIPT TEXT FROM MONGODB
-# ======================================================================
-def fetch_project_transcript_text(project_id: str) -> str:
-    """
-    Fetch full transcript text for a given project_id from MongoDB Raw_Transcripts collection.
-    Combines all meeting transcripts into a single text string.
-    
-    Args:
-        project_id: MongoDB ObjectId as string
-        
-    Returns:
-        Combined transcript text from all meetings
-    """
+# Cross-project chat: snippets per project, snippets overall, context budget
+CROSS_PROJECT_PER_PROJECT_K = int(os.getenv("CHAT_CROSS_PROJECT_PER_PROJECT_K", 5))
+CROSS_PROJECT_TOP_K = int(os.getenv("CHAT_CROSS_PROJECT_TOP_K", 12))
+CROSS_PROJECT_CONTEXT_CHARS = int(os.getenv("CHAT_CROSS_PROJECT_CONTEXT_CHARS", 12000))
+FANOUT_CONCURRENCY = int(os.getenv("CHAT_FANOUT_CONCURRENCY", 8))
+
+TIER_SUMMARY = "summary"
+TIER_TRANSCRIPT = "transcript"
+INSUFFICIENT_CONTEXT = "INSUFFICIENT_CONTEXT"
+HOLD_BACK_CHARS = 80  # streamed summary-tier output checked before release
+
+# Answers that admit the context did not cover the question
+NOT_ANSWERED = re.compile(
+    r"i don'?t know|i do not know|(?:not|isn'?t|aren'?t) (?:mentioned|provided|covered|included|available|specified)"
+    r"|(?:do(?:es)? not|don'?t|doesn'?t) (?:contain|include|mention|provide|specify)"
+    r"|(?:not|insufficient) (?:enough )?information|cannot (?:determine|answer)",
+    re.IGNORECASE
+)
+
+# Retrieval indexes by project_id, bounded by count and estimated size and
+# invalidated when the project's content_version changes
+chatbot_instances = BoundedTTLCache(sizeof=lambda index: index.nbytes, **cache_settings_from_env())
+
+# Previous answers by project_id, matched on question similarity at the
+# same content_version
+answer_cache = SemanticAnswerCache(**answer_cache_settings_from_env())
+
+mongo_client: Optional[MongoClient] = None  # Shared, pooled client (created on first use)
+mongo_client_lock = threading.Lock()
+
+
+def get_mongo_client() -> MongoClient:
+    """Return the process-wide MongoClient, creating it on first use."""
+    global mongo_client
     if not mongo_uri:
         raise ValueError("MONGO_URI not configured")
-    
-    try:
-        # Validate ObjectId
-        try:
-            object_id = ObjectId(project_id)
-        except InvalidId:
-            raise ValueError(f"Invalid ObjectId format: {project_id}")
-        
-        # Connect to MongoDB
-        client = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())
-        db = client["OMNI_MEET_DB"]
-        collection = db["Raw_Transcripts"]
-        
-        # Fetch document
-        doc = collection.find_one({"_id": object_id})
-        
-        if not doc:
-            raise ValueError(f"Project with id '{project_id}' not found")
-        
-        project_name = doc.get("Project_name", "Unknown Project")
-        meetings = doc.get("meetings", [])
-        
-        # Combine all transcripts into a single text
-        transcript_parts = []
-        transcript_parts.append(f"Project: {project_name}\n")
-        transcript_parts.append("=" * 80 + "\n\n")
-        
-        for meeting in meetings:
-            meeting_name = meeting.get("meeting_name", "Unknown Meeting")
-            meeting_time = meeting.get("meeting_time", "")
-            participants = meeting.get("participants", [])
-            transcript_list = meeting.get("Transcript", [])
-            
-            # Get transcript text (first element if list, or the value itself)
-            transcript_text = ""
-            if transcript_list:
-                if isinstance(transcript_list, list):
-                    transcript_text = transcript_list[0] if transcript_list else ""
-                else:
-                    transcript_text = str(transcript_list)
-            
-            if transcript_text:
-                transcript_parts.append(f"Meeting: {meeting_name}\n")
-                transcript_parts.append(f"Time: {meeting_time}\n")
-                transcript_parts.append(f"Participants: {', '.join(participants) if participants else 'N/A'}\n")
-                transcript_parts.append("-" * 80 + "\n")
-                transcript_parts.append(f"Transcript:\n{transcript_text}\n")
-                transcript_parts.append("=" * 80 + "\n\n")
-        
-        full_text = "".join(transcript_parts)
-        logger.info(f"Fetched transcript text for project '{project_name}' ({len(full_text)} characters)")
-        return full_text
-    
-    except Exception as e:
-        logger.error(f"Error fetching transcript text: {e}")
-        raise
+    if mongo_client is None:
+        # Cross-project retrieval calls this from worker threads
+        with mongo_client_lock:
+            if mongo_client is None:
+                mongo_client = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())
+    return mongo_client
+
+
+# Normalised project names -> project ids, for resolving chat requests
+project_names = ProjectNameIndex(lambda: get_mongo_client()["OMNI_MEET_DB"]["Raw_Transcripts"])
 
 
 # ======================================================================
 # BUILD SIMPLE CHATBOT CHAIN
 # ======================================================================
-def build_chatbot_chain() -> Any:
-    """
-    Build a simple chatbot chain using prompt | llm | StrOutputParser.
-    Similar to the example provided - no RAG, just direct document context.
-    
-    Returns:
-        LangChain chain (prompt | llm | StrOutputParser)
-    """
-    # Initialize LLM
+def build_chat_llm() -> ChatGroq:
+    """Chat model shared by both answering tiers."""
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY not found in environment variables")
     
-    llm = ChatGroq(
+    return ChatGroq(
         model="openai/gpt-oss-20b",
         temperature=0.3,
         api_key=api_key
     )
+
+
+def build_chatbot_chain(llm: Optional[ChatGroq] = None) -> Any:
+    """
+    Build a simple chatbot chain using prompt | llm | StrOutputParser.
+    The {document} slot receives the retrieved transcript chunks and the
+    {history} slot the session's conversation memory (empty for a new chat).
     
+    Returns:
+        LangChain chain (prompt | llm | StrOutputParser)
+    """
     # Create prompt template
     prompt = ChatPromptTemplate.from_template("""
 You are a helpful AI assistant for meeting analysis. You must answer ONLY from the document content given below.
 
 If you are not sure what to answer, then apologize and ask for clarification. Say "I don't know based on the document."
 
+{history}
 Document:
 {document}
 
@@ -145,95 +168,481 @@ User Question:
 """)
     
     # Create simple chain: prompt | llm | StrOutputParser
-    chain = prompt | llm | StrOutputParser()
+    chain = prompt | (llm or build_chat_llm()) | StrOutputParser()
     
     return chain
 
 
+def build_summary_chain(llm: Optional[ChatGroq] = None) -> Any:
+    """
+    Build the first-tier chain, which answers from summaries only and replies
+    with INSUFFICIENT_CONTEXT when they are not enough.
+    
+    Returns:
+        LangChain chain (prompt | llm | StrOutputParser)
+    """
+    prompt = ChatPromptTemplate.from_template(f"""
+You are a helpful AI assistant for meeting analysis. Answer ONLY from the meeting summaries and participant insights given below.
+
+If they do not contain enough information to answer the question fully and accurately, reply with exactly {INSUFFICIENT_CONTEXT} and nothing else.
+
+{{history}}
+Summaries:
+{{document}}
+
+User Question:
+{{question}}
+""")
+    
+    return prompt | (llm or build_chat_llm()) | StrOutputParser()
+
+
+def build_condense_chain(llm: Optional[ChatGroq] = None) -> Any:
+    """
+    Build the chain that folds older chat turns into a session's rolling
+    summary (see memory.condense_session).
+    
+    Returns:
+        LangChain chain (prompt | llm | StrOutputParser)
+    """
+    prompt = ChatPromptTemplate.from_template("""
+Update the running summary of a conversation about a project's meetings with the new turns below.
+Keep the names, decisions, facts and open questions the user may refer back to. Use at most {max_words} words.
+
+Current summary:
+{summary}
+
+New turns:
+{turns}
 
+Updated summary:
+""")
+    
+    return prompt | (llm or build_chat_llm()) | StrOutputParser()
+
+
+def build_cross_project_chain(llm: Optional[ChatGroq] = None) -> Any:
+    """
+    Build the chain for questions across several projects. Each snippet in
+    {document} is labelled with its project and meeting for citation.
+    
+    Returns:
+        LangChain chain (prompt | llm | StrOutputParser)
+    """
+    prompt = ChatPromptTemplate.from_template("""
+You are a helpful AI assistant for meeting analysis across several projects. You must answer ONLY from the snippets given below.
+
+Each snippet is labelled with its project and meeting. When you use a snippet, cite it as [Project / Meeting].
+Group the answer by project where that helps. If the snippets do not answer the question, say "I don't know based on the documents."
+
+Snippets:
+{document}
+
+User Question:
+{question}
+""")
+    
+    return prompt | (llm or build_chat_llm()) | StrOutputParser()
+
+
+def get_chatbot_chain() -> Any:
+    """
+    Return the shared chatbot chain, building it on first use. The chain holds
+    no project state (the context is passed per call), so one is enough.
+    """
+    global chatbot_chain
+    if chatbot_chain is None:
+        chatbot_chain = build_chatbot_chain()
+    return chatbot_chain
+
+
+def get_summary_chain() -> Any:
+    """Return the shared summary-tier chain, building it on first use."""
+    global summary_chain
+    if summary_chain is None:
+        summary_chain = build_summary_chain()
+    return summary_chain
+
+
+def get_cross_project_chain() -> Any:
+    """Return the shared cross-project chain, building it on first use."""
+    global cross_project_chain
+    if cross_project_chain is None:
+        cross_project_chain = build_cross_project_chain()
+    return cross_project_chain
+
+
+def get_condense_chain() -> Any:
+    """Return the shared session-condensing chain, building it on first use."""
+    global condense_chain
+    if condense_chain is None:
+        condense_chain = build_condense_chain()
+    return condense_chain
+
+
+# ======================================================================
+# PROJECT CONTENT VERSION
+# ======================================================================
+def get_project_content_version(project_id: str) -> int:
+    """
+    Read the project's content_version, which is incremented whenever its
+    meetings, transcript chunks or summary points change.
+    
+    Args:
+        project_id: MongoDB ObjectId as string
+        
+    Returns:
+        Current content version (0 for projects written before versioning)
+    """
+    if not mongo_uri:
+        raise ValueError("MONGO_URI not configured")
+    
+    try:
+        object_id = ObjectId(project_id)
+    except InvalidId:
+        raise ValueError(f"Invalid ObjectId format: {project_id}")
+    
+    doc = get_mongo_client()["OMNI_MEET_DB"]["Raw_Transcripts"].find_one(
+        {"_id": object_id},
+        {"content_version": 1}
+    )
+    if not doc:
+        raise ValueError(f"Project with id '{project_id}' not found")
+    
+    return doc.get("content_version", 0)
+
+
+# ======================================================================
+# LOAD RETRIEVAL INDEX
+# ======================================================================
+def load_project_index(project_id: str) -> ProjectIndex:
+    """
+    Load a project's transcript chunks into a retrieval index, indexing any
+    records saved before write-time indexing on the project's first load.
+    
+    Args:
+        project_id: MongoDB ObjectId as string
+        
+    Returns:
+        ProjectIndex for the project
+    """
+    if not mongo_uri:
+        raise ValueError("MONGO_URI not configured")
+    
+    try:
+        object_id = ObjectId(project_id)
+    except InvalidId:
+        raise ValueError(f"Invalid ObjectId format: {project_id}")
+    
+    db = get_mongo_client()["OMNI_MEET_DB"]
+    
+    # Meeting metadata only; transcript bodies are read just for backfill
+    doc = db["Raw_Transcripts"].find_one({"_id": object_id}, {"meetings.Transcript": 0})
+    if not doc:
+        raise ValueError(f"Project with id '{project_id}' not found")
+    
+    return ProjectIndex.load(db, doc)
 
 
 # ======================================================================
 # INITIALIZE CHATBOT
 # ======================================================================
-def initialize_chatbot(project_id: str, force_refresh: bool = False):
+def initialize_chatbot(project_id: str, force_refresh: bool = False, version: Optional[int] = None):
     """
     Initialize or retrieve a chatbot chain for a given project.
-    Fetches transcript text and builds a simple chain (no RAG).
+    Loads the project's retrieval index, reusing the cached one while the
+    project's content_version is unchanged.
     
     Args:
         project_id: MongoDB ObjectId as string
-        force_refresh: If True, refetch transcript even if cached
+        force_refresh: If True, reload the index even if cached
+        version: The project's content_version, if the caller already read it
         
     Returns:
-        Dictionary with 'chain' and 'document_text'
+        Dictionary with 'chain' and 'index'
     """
-    # Check cache
-    if project_id in chatbot_instances and not force_refresh:
+    if version is None:
+        version = get_project_content_version(project_id)
+    
+    # Check cache (misses on eviction, expiry or a newer content version)
+    index = None if force_refresh else chatbot_instances.get(project_id, version)
+    if index is not None:
         logger.info(f"Using cached chatbot for project {project_id}")
-        return chatbot_instances[project_id]
+        return {"chain": get_chatbot_chain(), "index": index}
     
-    logger.info(f"Initializing chatbot for project {project_id}")
+    logger.info(f"Initializing chatbot for project {project_id} (content version {version})")
     
-    # Fetch full transcript text from MongoDB
-    document_text = fetch_project_transcript_text(project_id)
+    # Load transcript chunks + vectors from MongoDB
+    index = load_project_index(project_id)
     
-    if not document_text or len(document_text.strip()) == 0:
+    if not len(index):
         raise ValueError(f"No transcript text found for project {project_id}")
     
-    # Build simple chain
-    chain = build_chatbot_chain()
+    chatbot_instances.put(project_id, index, version)
     
-    # Cache the instance (chain + document text)
-    chatbot_instances[project_id] = {
-        "chain": chain,
-        "document_text": document_text
+    logger.success(f"Chatbot initialized for project {project_id}")
+    return {"chain": get_chatbot_chain(), "index": index}
+
+
+# ======================================================================
+# SUMMARY CONTEXT (FIRST TIER)
+# ======================================================================
+def build_summary_context(index: ProjectIndex, question: str) -> Optional[Dict[str, Any]]:
+    """
+    First-tier context: the global project summary, the summary points most
+    relevant to the question, and participant insights for their meetings.
+    All three are entries of the retrieval index, written (with their
+    vectors) when the summaries are saved, so nothing is read per question.
+    
+    Args:
+        index: The project's retrieval index
+        question: User's question
+        
+    Returns:
+        Dictionary with 'document' and 'sources', or None if the project
+        has no summaries yet
+    """
+    points = index.search(question, k=SUMMARY_TOP_K, kind=KIND_SUMMARY)
+    if not points:
+        # Nothing matched ("summarize the project"): most recent points
+        points = index.of_kind(KIND_SUMMARY)[-SUMMARY_TOP_K:]
+    
+    project_summary = index.of_kind(KIND_PROJECT_SUMMARY)
+    if not points and not project_summary:
+        return None
+    
+    wanted = list(dict.fromkeys(point["meeting_name"] for point in points))[:SUMMARY_MEETINGS]
+    insights = [entry for entry in index.of_kind(KIND_PARTICIPANT) if entry["meeting_name"] in wanted]
+    
+    parts = []
+    if project_summary:
+        parts.append(format_context(project_summary))
+    if points:
+        parts.append(format_context(points))
+    if insights:
+        parts.append(format_context(insights))
+    
+    return {
+        "document": ("=" * 80 + "\n").join(parts),
+        "sources": list(dict.fromkeys(point["meeting_name"] for point in points))
     }
+
+
+def needs_escalation(answer: str) -> bool:
+    """True if a first-tier answer reports the summaries were not enough."""
+    return not answer.strip() or INSUFFICIENT_CONTEXT in answer or bool(NOT_ANSWERED.search(answer))
+
+
+# ======================================================================
+# PREPARE CHAT (ANSWER CACHE + RETRIEVAL)
+# ======================================================================
+def prepare_chat(project_id: str, question: str, session: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Everything needed to answer a question short of the LLM calls: a cached
+    answer when a near-identical question was already answered, otherwise
+    the answering tiers to try in order.
     
-    logger.success(f"Chatbot initialized for project {project_id}")
-    return chatbot_instances[project_id]
+    Each tier has 'name', 'chain', 'inputs' and 'sources'. With tiered chat
+    enabled and summaries available, the summary tier comes first and the
+    transcript tier (retrieved transcript chunks) is the fallback.
+    
+    Args:
+        project_id: MongoDB ObjectId as string
+        question: User's question
+        session: Conversation memory (summary + recent turns), if any
+        
+    Returns:
+        Dictionary with 'cached' (answer dict or None), and for cache misses
+        'tiers', 'version' and 'vector'
+    """
+    session = session or empty_session()
+    history = render_history(session)
+    
+    # Near-identical question already answered at this content version?
+    # Follow-ups depend on the conversation, so only fresh chats use the cache
+    version = get_project_content_version(project_id)
+    vector = question_vector(question) if not history else None
+    
+    cached = answer_cache.get(project_id, version, vector)
+    if cached is not None:
+        logger.info(f"Answer cache hit for question: '{question[:50]}...' (similarity {cached['similarity']})")
+        return {"cached": cached}
+    
+    # Follow-ups ("what about her tasks?") are retrieved together with the
+    # previous question so pronouns still find the right meetings
+    previous = last_question(session)
+    query = f"{previous} {question}" if previous else question
+    
+    # Initialize chatbot (gets chain + retrieval index)
+    chatbot_data = initialize_chatbot(project_id, version=version)
+    index = chatbot_data["index"]
+    tiers = []
+    
+    if tiered_chat:
+        summary_context = build_summary_context(index, query)
+        if summary_context is not None:
+            tiers.append({
+                "name": TIER_SUMMARY,
+                "chain": get_summary_chain(),
+                "inputs": {"document": summary_context["document"], "question": question, "history": history},
+                "sources": summary_context["sources"]
+            })
+    
+    # Retrieve relevant chunks; for questions with no matching terms
+    # ("summarize the project") fall back to the most recent chunks
+    chunks = index.search(query, k=DEFAULT_TOP_K, kind=KIND_TRANSCRIPT)
+    if not chunks:
+        chunks = index.of_kind(KIND_TRANSCRIPT)[-DEFAULT_TOP_K:] or index.chunks[-DEFAULT_TOP_K:]
+    
+    tiers.append({
+        "name": TIER_TRANSCRIPT,
+        "chain": chatbot_data["chain"],
+        "inputs": {"document": format_context(chunks), "question": question, "history": history},
+        # Source meetings of the retrieved chunks, best match first
+        "sources": list(dict.fromkeys(chunk["meeting_name"] for chunk in chunks))
+    })
+    
+    logger.info(
+        "Chat context sizes: "
+        + ", ".join(f"{tier['name']}={len(tier['inputs']['document'])} chars" for tier in tiers)
+        + f", history={len(history)} chars"
+    )
+    
+    return {"cached": None, "tiers": tiers, "version": version, "vector": vector}
+
+
+def _cache_answer(project_id: str, prepared: Dict[str, Any], tier: Dict[str, Any], answer: str):
+    answer_cache.put(
+        project_id,
+        prepared["version"],
+        prepared["vector"],
+        {"answer": answer, "sources": tier["sources"], "tier": tier["name"]}
+    )
+
+
+# ======================================================================
+# SESSION MEMORY
+# ======================================================================
+def open_session(
+    project_id: str,
+    session_id: Optional[str] = None,
+    chat_history: Optional[List] = None
+) -> Dict[str, Any]:
+    """
+    Conversation memory for a chat request: the stored session when a
+    session_id is given, otherwise one built from a client-sent chat_history
+    (older clients). Memory is optional; if it cannot be read the question
+    is answered without it.
+    
+    Returns:
+        Session dict (summary + turns)
+    """
+    if not session_id:
+        return session_from_history(chat_history)
+    try:
+        return load_session(get_mongo_client()["OMNI_MEET_DB"], session_id, project_id)
+    except Exception as e:
+        logger.warning(f"Could not load chat session {session_id}: {e}")
+        return empty_session()
+
+
+def _record_turn(session_id: str, project_id: str, question: str, answer: str) -> int:
+    global session_indexes_ready
+    db = get_mongo_client()["OMNI_MEET_DB"]
+    if not session_indexes_ready:
+        ensure_session_indexes(db)
+        session_indexes_ready = True
+    return record_turn(db, session_id, project_id, question, answer)
+
+
+async def remember_turn(session_id: str, project_id: str, question: str, answer: str):
+    """
+    Store a finished turn (off the event loop) and, once the session holds
+    CONDENSE_AT_TURNS turns, fold all but the last MEMORY_TURNS into its
+    summary in the background, so each LLM call condenses a batch of turns.
+    """
+    try:
+        turns = await asyncio.to_thread(_record_turn, session_id, project_id, question, answer)
+        if turns >= CONDENSE_AT_TURNS:
+            db = get_mongo_client()["OMNI_MEET_DB"]
+            task = asyncio.create_task(condense_session(db, session_id, project_id, get_condense_chain()))
+            background_tasks.add(task)
+            task.add_done_callback(_condense_done)
+    except Exception as e:
+        logger.warning(f"Could not record chat session {session_id}: {e}")
+
+
+def _condense_done(task: asyncio.Task):
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Could not condense chat session: {task.exception()}")
 
 
 # ======================================================================
 # CHAT FUNCTION
 # ======================================================================
-async def chat_with_project(project_id: str, question: str, chat_history: Optional[List] = None) -> Dict[str, Any]:
+async def chat_with_project(
+    project_id: str,
+    question: str,
+    chat_history: Optional[List] = None,
+    session_id: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    Chat with the project chatbot using simple document-based approach (no RAG).
+    Chat with the project chatbot. Tries the summary tier first and escalates
+    to the transcript chunks most relevant to the question when the summary
+    answer reports insufficient context. The session's conversation memory
+    is part of the prompt, and the turn is added to it afterwards.
     
     Args:
         project_id: MongoDB ObjectId as string
         question: User's question
-        chat_history: Optional list of previous messages for context (not used in simple approach)
+        chat_history: Previous messages, used only when no session_id is given
+        session_id: Server-side conversation to continue (a new one is
+            started if omitted)
         
     Returns:
-        Dictionary with answer and metadata
+        Dictionary with answer and metadata, including the session_id
     """
     try:
-        # Initialize chatbot (gets chain + document text)
-        chatbot_data = initialize_chatbot(project_id)
-        chain = chatbot_data["chain"]
-        document_text = chatbot_data["document_text"]
+        # Session load, index load (and first-load backfill) and retrieval are
+        # blocking Mongo I/O and numpy work; keep them off the event loop
+        session = await asyncio.to_thread(open_session, project_id, session_id, chat_history)
+        session_id = session_id or new_session_id()
         
-        # Invoke chain with document and question
-        answer = await chain.ainvoke({
-            "document": document_text,
-            "question": question
-        })
+        prepared = await asyncio.to_thread(prepare_chat, project_id, question, session)
         
-        logger.info(f"Generated answer for question: '{question[:50]}...'")
+        if prepared["cached"] is not None:
+            await remember_turn(session_id, project_id, question, prepared["cached"]["answer"])
+            return {
+                "answer": prepared["cached"]["answer"],
+                "sources": prepared["cached"]["sources"],
+                "project_id": project_id,
+                "cached": True,
+                "tier": prepared["cached"].get("tier"),
+                "session_id": session_id
+            }
         
-        # Extract meeting names from document text for sources
-        sources = []
-        if "Meeting:" in document_text:
-            import re
-            meeting_matches = re.findall(r"Meeting: ([^\n]+)", document_text)
-            sources = list(set(meeting_matches))
+        tiers = prepared["tiers"]
+        for i, tier in enumerate(tiers):
+            # Invoke chain with this tier's context and question
+            answer = await tier["chain"].ainvoke(tier["inputs"])
+            
+            if i == len(tiers) - 1 or not needs_escalation(answer):
+                break
+            logger.info(f"{tier['name'].capitalize()} tier could not answer '{question[:50]}...', escalating")
+        
+        logger.info(f"Generated answer for question: '{question[:50]}...' from the {tier['name']} tier")
+        
+        _cache_answer(project_id, prepared, tier, answer)
+        await remember_turn(session_id, project_id, question, answer)
         
         return {
             "answer": answer,
-            "sources": sources,
-            "project_id": project_id
+            "sources": tier["sources"],
+            "project_id": project_id,
+            "cached": False,
+            "tier": tier["name"],
+            "session_id": session_id
         }
     
     except Exception as e:
@@ -242,37 +651,291 @@ async def chat_with_project(project_id: str, question: str, chat_history: Option
 
 
 # ======================================================================
-# FIND PROJECT BY NAME
+# STREAMING CHAT FUNCTION
 # ======================================================================
-def find_project_by_name(project_name: str) -> Optional[str]:
+async def stream_chat_with_project(
+    project_id: str,
+    question: str,
+    chat_history: Optional[List] = None,
+    session_id: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Find project_id (ObjectId) by project name.
+    Streaming variant of chat_with_project. Yields events in order:
+    
+        {"type": "sources", "sources": [...], "project_id": ..., "cached": bool, "tier": ..., "session_id": ...}
+        {"type": "token", "content": "..."}      (one or more)
+        {"type": "done", "cached": bool, "tier": ...}
+    
+    Sources go out before the first token. The first HOLD_BACK_CHARS of a
+    tier that may still escalate are held back and checked for the
+    INSUFFICIENT_CONTEXT reply or a refusal; a summary-tier answer that only
+    gives up later on is sent as is rather than escalated. Cached
+    answers are sent as a single token event. The full answer is stored in
+    the answer cache only if the stream completes.
     
     Args:
-        project_name: Project name to search for
+        project_id: MongoDB ObjectId as string
+        question: User's question
+        chat_history: Previous messages, used only when no session_id is given
+        session_id: Server-side conversation to continue (a new one is
+            started if omitted)
+    """
+    # Blocking Mongo I/O and index work, off the event loop (as in chat_with_project)
+    session = await asyncio.to_thread(open_session, project_id, session_id, chat_history)
+    session_id = session_id or new_session_id()
+    
+    prepared = await asyncio.to_thread(prepare_chat, project_id, question, session)
+    
+    if prepared["cached"] is not None:
+        cached = prepared["cached"]
+        yield {
+            "type": "sources",
+            "sources": cached["sources"],
+            "project_id": project_id,
+            "cached": True,
+            "tier": cached.get("tier"),
+            "session_id": session_id
+        }
+        await remember_turn(session_id, project_id, question, cached["answer"])
+        yield {"type": "token", "content": cached["answer"]}
+        yield {"type": "done", "cached": True, "tier": cached.get("tier")}
+        return
+    
+    tiers = prepared["tiers"]
+    for i, tier in enumerate(tiers):
+        tokens = tier["chain"].astream(tier["inputs"])
+        buffer = ""
         
-    Returns:
-        Project ID (ObjectId as string) or None if not found
+        if i < len(tiers) - 1:
+            # Hold the opening of the answer back until it is clearly not the
+            # sentinel or a refusal
+            escalate = None
+            async for token in tokens:
+                buffer += token
+                if buffer.lstrip().startswith(INSUFFICIENT_CONTEXT):
+                    escalate = True
+                    break
+                if len(buffer) >= HOLD_BACK_CHARS:
+                    escalate = needs_escalation(buffer)
+                    break
+            if escalate is None:
+                # Stream ended within the held-back opening (short answer)
+                escalate = needs_escalation(buffer)
+            if escalate:
+                await tokens.aclose()
+                logger.info(f"{tier['name'].capitalize()} tier could not answer '{question[:50]}...', escalating")
+                continue
+        
+        yield {
+            "type": "sources",
+            "sources": tier["sources"],
+            "project_id": project_id,
+            "cached": False,
+            "tier": tier["name"],
+            "session_id": session_id
+        }
+        
+        parts = [buffer] if buffer else []
+        if buffer:
+            yield {"type": "token", "content": buffer}
+        async for token in tokens:
+            if token:
+                parts.append(token)
+                yield {"type": "token", "content": token}
+        
+        answer = "".join(parts)
+        logger.info(f"Streamed answer for question: '{question[:50]}...' from the {tier['name']} tier")
+        
+        _cache_answer(project_id, prepared, tier, answer)
+        await remember_turn(session_id, project_id, question, answer)
+        
+        yield {"type": "done", "cached": False, "tier": tier["name"]}
+        return
+
+
+# ======================================================================
+# CROSS-PROJECT CHAT
+# ======================================================================
+def search_project(project: Dict[str, str], question: str, k: int) -> List[Dict[str, Any]]:
     """
-    if not mongo_uri:
-        raise ValueError("MONGO_URI not configured")
+    Top-k transcript chunks and summary points of one project, labelled with
+    the project. Uses the cached retrieval index (chunk vectors only, never
+    the full transcript text).
+    """
+    try:
+        index = initialize_chatbot(project["project_id"])["index"]
+    except ValueError as e:
+        # Project without transcripts yet, or deleted since the name index loaded
+        logger.warning(f"Skipping project '{project['project_name']}' in cross-project chat: {e}")
+        return []
+    
+    return [
+        {**hit, "project_id": project["project_id"], "project_name": project["project_name"]}
+        for hit in index.search(question, k=k)
+        if hit["similarity"] > 0
+    ]
+
+
+def merge_project_hits(
+    hits: List[List[Dict[str, Any]]],
+    k: int = CROSS_PROJECT_TOP_K,
+    budget_chars: int = CROSS_PROJECT_CONTEXT_CHARS
+) -> List[Dict[str, Any]]:
+    """
+    Global top-k over every project's hits by cosine similarity (rank-based
+    fusion scores are not comparable across projects), stopping at the
+    context budget.
+    """
+    ranked = sorted(
+        (hit for project_hits in hits for hit in project_hits),
+        key=lambda hit: (hit["similarity"], hit["score"]),
+        reverse=True
+    )
+    
+    selected = []
+    used = 0
+    for hit in ranked:
+        if len(selected) >= k:
+            break
+        if used + len(hit["text"]) > budget_chars and selected:
+            continue  # a shorter snippet further down may still fit
+        selected.append(hit)
+        used += len(hit["text"])
+    return selected
+
+
+def format_cross_project_context(hits: List[Dict[str, Any]]) -> str:
+    """Render merged snippets with project + meeting labels for citation."""
+    parts = []
+    for hit in hits:
+        header = f"[{hit['project_name']} / {hit['meeting_name']}]"
+        if hit.get("meeting_time"):
+            header += f" ({hit['meeting_time']})"
+        if hit.get("kind") == KIND_SUMMARY:
+            header += " summary point"
+        parts.append(f"{header}\n{'-' * 80}\n{hit['text']}\n")
+    return ("=" * 80 + "\n").join(parts)
+
+
+async def chat_across_projects(question: str, project_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Answer a question over several projects at once.
+    
+    Retrieval runs concurrently, one worker thread per project (at most
+    FANOUT_CONCURRENCY at a time), against each project's cached retrieval
+    index. The hits are merged into one global top-k under a single context
+    budget, and every snippet is cited by project and meeting.
     
+    Args:
+        question: User's question
+        project_ids: Projects to search (ObjectIds as strings); all projects
+            if omitted
+        
+    Returns:
+        Dictionary with answer, sources ([{project_id, project_name,
+        meeting_name}]) and the projects searched
+    """
     try:
-        client = MongoClient(mongo_uri, tls=True, tlsCAFile=certifi.where())
-        db = client["OMNI_MEET_DB"]
-        collection = db["Raw_Transcripts"]
+        known = {project["project_id"]: project for project in project_names.projects()}
+        if project_ids:
+            missing = [pid for pid in project_ids if pid not in known]
+            if missing:
+                # Possibly created since the name index was loaded
+                project_names.reload()
+                known = {project["project_id"]: project for project in project_names.projects()}
+                missing = [pid for pid in project_ids if pid not in known]
+            if missing:
+                raise ValueError(f"Unknown project id(s): {', '.join(missing)}")
+            projects = [known[pid] for pid in dict.fromkeys(project_ids)]
+        else:
+            projects = list(known.values())
+        
+        if not projects:
+            raise ValueError("No projects found")
+        
+        semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
         
-        # Search for project by name (case-insensitive)
-        doc = collection.find_one(
-            {"Project_name": {"$regex": project_name, "$options": "i"}}
+        async def search(project: Dict[str, str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(search_project, project, question, CROSS_PROJECT_PER_PROJECT_K)
+        
+        hits = await asyncio.gather(*(search(project) for project in projects))
+        selected = merge_project_hits(hits)
+        
+        logger.info(
+            f"Cross-project retrieval over {len(projects)} project(s): "
+            f"{sum(len(h) for h in hits)} hit(s), {len(selected)} selected"
         )
         
-        if doc:
-            return str(doc["_id"])
+        if not selected:
+            return {
+                "answer": "I couldn't find anything about that in the selected projects' meetings.",
+                "sources": [],
+                "project_ids": [project["project_id"] for project in projects]
+            }
         
-        return None
+        answer = await get_cross_project_chain().ainvoke({
+            "document": format_cross_project_context(selected),
+            "question": question
+        })
+        
+        # Cited (project, meeting) pairs, best match first
+        sources: Dict[tuple, Dict[str, str]] = {}
+        for hit in selected:
+            sources.setdefault((hit["project_id"], hit["meeting_name"]), {
+                "project_id": hit["project_id"],
+                "project_name": hit["project_name"],
+                "meeting_name": hit["meeting_name"]
+            })
+        
+        return {
+            "answer": answer,
+            "sources": list(sources.values()),
+            "project_ids": [project["project_id"] for project in projects]
+        }
+    
+    except Exception as e:
+        logger.error(f"Error in cross-project chat: {e}", exc_info=True)
+        raise
+
+
+# ======================================================================
+# FIND PROJECT BY NAME
+# ======================================================================
+def find_project_by_name(project_name: str) -> Optional[str]:
+    """
+    Find project_id (ObjectId) by project name, using the in-memory project
+    name index (exact normalised name, unique word prefix, then fuzzy match).
+    
+    Args:
+        project_name: Project name to search for
+        
+    Returns:
+        Project ID (ObjectId as string) or None if not found or ambiguous
+    """
+    try:
+        project = project_names.resolve(project_name)
+        return project["project_id"] if project else None
     
     except Exception as e:
         logger.error(f"Error finding project: {e}")
         raise
 
+
+def autocomplete_projects(prefix: str, limit: int = 10) -> List[Dict[str, str]]:
+    """
+    Projects whose name has a word starting with `prefix`, shortest first.
+    
+    Args:
+        prefix: Partial project name typed by the user
+        limit: Maximum number of projects to return
+        
+    Returns:
+        List of dicts with project_id, project_name and project_key
+    """
+    return project_names.autocomplete(prefix, limit=limit)
+
+
+def is_ambiguous_project_name(project_name: str) -> bool:
+    """True if `project_name` is a prefix of several project names."""
+    return project_names.is_ambiguous(project_name)
@@ -0,0 +1,192 @@
+"""
+In-memory project-name index for resolving chat requests.
+
+Project names from Raw_Transcripts are normalised (case, accents,
+punctuation, whitespace) and kept in a dict for exact lookups and a prefix
+trie over every word start, so "alpha" and "project al" both reach
+"Project Alpha". A prefix shared by several names ("project") resolves to
+none of them; callers report it with `autocomplete` suggestions instead.
+Names that match neither fall back to rapidfuzz, as the
+participant directory does for transcript names. User input is never turned
+into a MongoDB query.
+
+The index is loaded once per process. Every PROJECT_INDEX_REFRESH_SECONDS it
+compares the collection's estimated document count and reloads when it has
+changed, and a lookup that misses reloads immediately (at most once per
+PROJECT_INDEX_MISS_RELOAD_SECONDS), so a newly created project resolves on
+its first request.
+"""
+import os
+import time
+import threading
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from rapidfuzz import fuzz, process
+
+
+# Minimum WRatio for a fuzzy project-name match
+PROJECT_MATCH_THRESHOLD = 85
+
+# Names kept per trie node, enough for any autocomplete page
+MAX_NAMES_PER_NODE = 100
+
+
+def normalize_project_name(name: str) -> str:
+    """Lower-case, strip accents and punctuation, collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join("".join(c if c.isalnum() else " " for c in stripped.lower()).split())
+
+
+class _TrieNode:
+    __slots__ = ("children", "names")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.names: List[str] = []
+
+
+def _build_trie(names: List[str]) -> _TrieNode:
+    """Trie over every word start of every normalised name."""
+    root = _TrieNode()
+    # Shorter names first, so each node's list is already in ranking order
+    for name in sorted(names, key=lambda n: (len(n), n)):
+        words = name.split(" ")
+        for i in range(len(words)):
+            node = root
+            for char in " ".join(words[i:]):
+                node = node.children.setdefault(char, _TrieNode())
+                if len(node.names) < MAX_NAMES_PER_NODE and (not node.names or node.names[-1] != name):
+                    node.names.append(name)
+    return root
+
+
+# ======================================================================
+# PROJECT NAME INDEX
+# ======================================================================
+class ProjectNameIndex:
+    def __init__(
+        self,
+        collection_factory: Callable[[], Any],
+        refresh_seconds: Optional[float] = None,
+        miss_reload_seconds: Optional[float] = None
+    ):
+        self.collection_factory = collection_factory
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else float(
+            os.getenv("PROJECT_INDEX_REFRESH_SECONDS", 30)
+        )
+        self.miss_reload_seconds = miss_reload_seconds if miss_reload_seconds is not None else float(
+            os.getenv("PROJECT_INDEX_MISS_RELOAD_SECONDS", 5)
+        )
+
+        self._lock = threading.Lock()
+        # (by_name, trie, doc_count), swapped as a whole on reload
+        self._state: Optional[Tuple[Dict[str, List[Dict[str, str]]], _TrieNode, int]] = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+
+    # ---------------------------------------------------------
+    # Loading
+    # ---------------------------------------------------------
+    def reload(self):
+        collection = self.collection_factory()
+        by_name: Dict[str, List[Dict[str, str]]] = {}
+        count = 0
+        for doc in collection.find({}, {"Project_name": 1, "Project_key": 1}):
+            count += 1
+            name = doc.get("Project_name")
+            if not name:
+                continue
+            by_name.setdefault(normalize_project_name(name), []).append({
+                "project_id": str(doc["_id"]),
+                "project_name": name,
+                "project_key": doc.get("Project_key")
+            })
+
+        with self._lock:
+            self._state = (by_name, _build_trie(list(by_name)), count)
+            self._checked_at = self._loaded_at = time.monotonic()
+
+        logger.info(f"Project name index loaded ({len(by_name)} names)")
+
+    def _current(self) -> Tuple[Dict[str, List[Dict[str, str]]], _TrieNode, int]:
+        """Loaded state, reloaded first if the collection's size changed."""
+        if self._state is None:
+            self.reload()
+        elif time.monotonic() - self._checked_at > self.refresh_seconds:
+            self._checked_at = time.monotonic()
+            if self.collection_factory().estimated_document_count() != self._state[2]:
+                self.reload()
+        return self._state
+
+    # ---------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------
+    def _complete(self, trie: _TrieNode, prefix: str) -> List[str]:
+        node = trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.names
+
+    def _match(self, name: str) -> Optional[Dict[str, str]]:
+        by_name, trie, _ = self._current()
+        key = normalize_project_name(name)
+        if not key:
+            return None
+
+        # Exact name, then the only name with a word starting with it. A prefix
+        # of several names is ambiguous and resolves to nothing
+        if key in by_name:
+            return by_name[key][0]
+        completions = self._complete(trie, key)
+        if len(completions) > 1:
+            return None
+        if completions:
+            return by_name[completions[0]][0]
+
+        match = process.extractOne(key, by_name.keys(), scorer=fuzz.WRatio, score_cutoff=PROJECT_MATCH_THRESHOLD)
+        return by_name[match[0]][0] if match else None
+
+    def resolve(self, name: str) -> Optional[Dict[str, str]]:
+        """
+        Project matching `name` (project_id, project_name, project_key), or
+        None if no project or several projects match (see `is_ambiguous`).
+        A miss reloads the index once in case the project is new.
+        """
+        project = self._match(name)
+        if (project is None and not self.is_ambiguous(name)
+                and time.monotonic() - self._loaded_at > self.miss_reload_seconds):
+            self.reload()
+            project = self._match(name)
+        return project
+
+    def is_ambiguous(self, name: str) -> bool:
+        """True if `name` is not a project name but starts words of several."""
+        by_name, trie, _ = self._current()
+        key = normalize_project_name(name)
+        return bool(key) and key not in by_name and len(self._complete(trie, key)) > 1
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Dict[str, str]]:
+        """Projects with a word starting with `prefix`, shortest names first."""
+        by_name, trie, _ = self._current()
+        key = normalize_project_name(prefix)
+        names = sorted(by_name, key=lambda n: (len(n), n)) if not key else self._complete(trie, key)
+
+        results = []
+        for name in names:
+            results.extend(by_name[name])
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+    def projects(self) -> List[Dict[str, str]]:
+        """Every indexed project (project_id, project_name, project_key)."""
+        by_name, _, _ = self._current()
+        return [project for entries in by_name.values() for project in entries]
+
+    def __len__(self) -> int:
+        return len(self._current()[0])
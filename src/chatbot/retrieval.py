@@ -0,0 +1,280 @@
+"""
+Retrieval layer for the OrbitMeetAI chatbot.
+
+Transcript chunks and summary entries are indexed on write by
+src/Agentic/utils/chunk_index.py, each with a hashed term-frequency vector
+and its exact term counts.
+
+At question time a project's entries are loaded once into a dense TF-IDF
+matrix and a BM25 inverted index (`ProjectIndex`). The two rankings are fused
+with reciprocal rank fusion, so questions naming people, tickets or dates
+(which hashed vectors blur) still find the right chunk, and only the top-k
+entries are sent to the LLM.
+"""
+import os
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from src.Agentic.utils.chunk_index import (
+    CHUNK_COLLECTION,
+    KIND_TRANSCRIPT,
+    KIND_SUMMARY,
+    KIND_PARTICIPANT,
+    KIND_PROJECT_SUMMARY,
+    VECTOR_DIM,
+    STOPWORDS,
+    TOKEN,
+    tokenize,
+    term_counts,
+    hashed_term_vector,
+    hash_tokens,
+    backfill_project
+)
+
+# ======================================================================
+# CONFIGURATION
+# ======================================================================
+DEFAULT_TOP_K = int(os.getenv("CHAT_TOP_K", 6))
+
+# BM25 parameters and reciprocal rank fusion constant
+BM25_K1 = 1.5
+BM25_B = 0.75
+RRF_K = 60
+FUSION_DEPTH = 50             # candidates taken from each ranker
+
+NEGATIONS = {"not", "no", "never", "without"}
+
+
+# ======================================================================
+# QUESTION VECTORS
+# ======================================================================
+def _dense(indices: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    vector = np.zeros(VECTOR_DIM, dtype=np.float32)
+    vector[indices] = weights
+    return vector
+
+
+def question_vector(question: str) -> Optional[np.ndarray]:
+    """
+    Unit-length dense vector of a question, for matching near-identical
+    questions. Negations are kept (unlike tokenize) so "who is not attending"
+    does not match "who is attending", and adjacent word pairs are hashed
+    with the words so "did Ana block Ben" does not match "did Ben block Ana".
+    None if the question has no terms.
+    """
+    tokens = [
+        t for t in TOKEN.findall(question.lower())
+        if len(t) > 1 and (t not in STOPWORDS or t in NEGATIONS)
+    ]
+    if not tokens:
+        return None
+    # Tokens never contain a space, so a bigram is never the same feature as a word
+    bigrams = [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vector = _dense(*hash_tokens(tokens + bigrams))
+    return vector / np.linalg.norm(vector)
+
+
+# ======================================================================
+# BM25 INVERTED INDEX
+# ======================================================================
+class BM25Index:
+    """
+    In-memory BM25 inverted index. Documents are added incrementally from
+    their stored term counts; posting arrays are rebuilt lazily on search.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        self._arrays: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None
+        self._length_norm: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def nbytes(self) -> int:
+        """Rough memory footprint (postings dominate)."""
+        postings = sum(len(posting) for posting in self._postings.values())
+        return postings * 80 + len(self._postings) * 100 + len(self._lengths) * 8
+
+    def add(self, terms: Dict[str, int]) -> int:
+        """Add a document by its term counts; returns its id."""
+        doc_id = len(self._lengths)
+        for term, count in terms.items():
+            self._postings[term].append((doc_id, count))
+        self._lengths.append(sum(terms.values()))
+        self._arrays = None
+        return doc_id
+
+    def _finalize(self):
+        self._arrays = {
+            term: (np.fromiter((d for d, _ in posting), dtype=np.int32, count=len(posting)),
+                   np.fromiter((c for _, c in posting), dtype=np.float32, count=len(posting)))
+            for term, posting in self._postings.items()
+        }
+        lengths = np.asarray(self._lengths, dtype=np.float32)
+        avgdl = float(lengths.mean()) if len(lengths) and lengths.mean() > 0 else 1.0
+        self._length_norm = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+
+    def scores(self, tokens: Iterable[str]) -> np.ndarray:
+        if self._arrays is None:
+            self._finalize()
+
+        n = len(self._lengths)
+        scores = np.zeros(n, dtype=np.float32)
+        for term in set(tokens):
+            posting = self._arrays.get(term)
+            if posting is None:
+                continue
+            doc_ids, tf = posting
+            idf = math.log(1 + (n - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            scores[doc_ids] += idf * tf * (self.k1 + 1) / (tf + self._length_norm[doc_ids])
+        return scores
+
+
+def _ranking(scores: np.ndarray, depth: int) -> List[int]:
+    """Indices of the `depth` best positive scores, best first."""
+    positive = np.flatnonzero(scores > 0)
+    if not len(positive):
+        return []
+    depth = min(depth, len(positive))
+    top = positive[np.argpartition(-scores[positive], depth - 1)[:depth]]
+    return top[np.argsort(-scores[top])].tolist()
+
+
+def reciprocal_rank_fusion(rankings: List[List[int]], k: int = RRF_K) -> List[Tuple[int, float]]:
+    """Fuse ranked id lists: score(d) = sum over rankings of 1 / (k + rank)."""
+    fused: Dict[int, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] += 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+# ======================================================================
+# QUERY-TIME INDEX
+# ======================================================================
+class ProjectIndex:
+    """
+    A project's transcript chunks and summary points as an L2-normalised
+    TF-IDF matrix plus a BM25 inverted index.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        chunks: List[Dict[str, Any]],
+        matrix: np.ndarray,
+        idf: np.ndarray,
+        bm25: BM25Index,
+        project_key: Optional[str] = None
+    ):
+        self.project_id = project_id
+        self.project_key = project_key
+        self.chunks = chunks
+        self.matrix = matrix
+        self.idf = idf
+        self.bm25 = bm25
+        self.kinds = np.array([chunk["kind"] for chunk in chunks], dtype=object)
+
+    @classmethod
+    def load(cls, db, project_doc: Dict[str, Any]) -> "ProjectIndex":
+        backfill_project(db, project_doc)
+
+        project_id = project_doc["_id"]
+        rows = list(db[CHUNK_COLLECTION].find(
+            {"project_id": project_id},
+            {"_id": 0, "meeting_name": 1, "meeting_time": 1, "kind": 1, "chunk_index": 1,
+             "speakers": 1, "text": 1, "term_idx": 1, "term_tf": 1, "terms": 1}
+        ).sort([("meeting_time", 1), ("kind", 1), ("chunk_index", 1)]))
+
+        tf = np.zeros((len(rows), VECTOR_DIM), dtype=np.float32)
+        bm25 = BM25Index()
+        chunks = []
+        for i, row in enumerate(rows):
+            indices = np.frombuffer(row.pop("term_idx"), dtype=np.int32)
+            weights = np.frombuffer(row.pop("term_tf"), dtype=np.float32)
+            tf[i, indices] = weights
+            # Chunks stored before BM25 postings existed are counted here
+            terms = row.pop("terms", None)
+            bm25.add(terms if terms is not None else term_counts(row["text"]))
+            row.setdefault("kind", KIND_TRANSCRIPT)
+            chunks.append(row)
+
+        document_freq = np.count_nonzero(tf, axis=0)
+        idf = (np.log((1 + len(rows)) / (1 + document_freq)) + 1).astype(np.float32)
+
+        matrix = tf * idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+
+        logger.info(f"Loaded retrieval index for project {project_id}: {len(chunks)} chunk(s)")
+        return cls(str(project_id), chunks, matrix, idf, bm25, project_doc.get("Project_key"))
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @property
+    def nbytes(self) -> int:
+        """Rough memory footprint, used to bound the chatbot cache."""
+        text = sum(len(chunk["text"]) for chunk in self.chunks)
+        return self.matrix.nbytes + self.idf.nbytes + self.bm25.nbytes + text + len(self.chunks) * 200
+
+    def of_kind(self, kind: str) -> List[Dict[str, Any]]:
+        """Entries of one kind, oldest meeting first."""
+        return [chunk for chunk in self.chunks if chunk["kind"] == kind]
+
+    def search(self, question: str, k: int = DEFAULT_TOP_K, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Top-k entries by reciprocal rank fusion of cosine (TF-IDF) and BM25
+        rankings, each with its fused `score` and its cosine `similarity`
+        (comparable across projects, unlike the rank-based score). With
+        `kind`, only entries of that kind (KIND_TRANSCRIPT or KIND_SUMMARY)
+        are ranked.
+        """
+        if not self.chunks:
+            return []
+
+        excluded = self.kinds != kind if kind is not None else None
+        rankings = []
+        cosine = np.zeros(len(self.chunks), dtype=np.float32)
+
+        query = _dense(*hashed_term_vector(question)) * self.idf
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            cosine = self.matrix @ (query / norm)
+            if excluded is not None:
+                cosine[excluded] = 0
+            rankings.append(_ranking(cosine, FUSION_DEPTH))
+
+        bm25 = self.bm25.scores(tokenize(question))
+        if excluded is not None:
+            bm25[excluded] = 0
+        rankings.append(_ranking(bm25, FUSION_DEPTH))
+
+        fused = reciprocal_rank_fusion(rankings)[:k]
+        return [{**self.chunks[i], "score": score, "similarity": float(cosine[i])} for i, score in fused]
+
+
+def format_context(chunks: List[Dict[str, Any]]) -> str:
+    """Render retrieved chunks as the document section of the chat prompt."""
+    parts = []
+    for chunk in chunks:
+        header = f"Meeting: {chunk['meeting_name']}"
+        if chunk.get("meeting_time"):
+            header += f" ({chunk['meeting_time']})"
+        if chunk.get("kind") == KIND_SUMMARY:
+            header += " [summary point]"
+        elif chunk.get("kind") == KIND_PARTICIPANT:
+            header += " [participant insight]"
+        elif chunk.get("kind") == KIND_PROJECT_SUMMARY:
+            header = "Project summary"
+        parts.append(f"{header}\n{'-' * 80}\n{chunk['text']}\n")
+    return ("=" * 80 + "\n").join(parts)
@@ -1,5 +1,5 @@
 import React, { useState, useRef, useEffect } from 'react';
-import { chatWithOrbit } from '../services/api';
+import { streamChatWithOrbit } from '../services/api';
 import { useTheme } from '../contexts/ThemeContext';
 import ReactMarkdown from 'react-markdown';
 import remarkGfm from 'remark-gfm';
@@ -10,6 +10,9 @@ const Chatbot = ({ projectName, meetingName }) => {
   const [messages, setMessages] = useState([]);
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
+  const [streaming, setStreaming] = useState(false);
+  // Server-side conversation memory; a new project starts a new conversation
+  const [sessionId, setSessionId] = useState(null);
   const messagesEndRef = useRef(null);
 
   const scrollToBottom = () => {
@@ -22,6 +25,7 @@ const Chatbot = ({ projectName, meetingName }) => {
 
   useEffect(() => {
     // Initialize with welcome message when project/meeting changes
+    setSessionId(null);
     if (projectName && meetingName) {
       setMessages([{
         role: 'assistant',
@@ -52,24 +56,18 @@ const Chatbot = ({ projectName, meetingName }) => {
     setLoading(true);
 
     try {
-      // Build chat history for context
-      const chatHistory = messages
-        .filter((msg) => msg.role !== 'system')
-        .map((msg) => ({
-          role: msg.role,
-          content: msg.content,
-        }));
+      // Sources arrive first and open the answer bubble; tokens fill it in
+      const updateAnswer = (update) =>
+        setMessages((prev) => [...prev.slice(0, -1), { ...prev[prev.length - 1], ...update(prev[prev.length - 1]) }]);
 
-      const response = await chatWithOrbit(projectName, input, chatHistory);
-
-      const assistantMessage = {
-        role: 'assistant',
-        content: response.answer,
-        sources: response.sources || [],
-        timestamp: new Date(),
-      };
-
-      setMessages((prev) => [...prev, assistantMessage]);
+      const result = await streamChatWithOrbit(projectName, input, sessionId, {
+        onSources: (sources) => {
+          setStreaming(true);
+          setMessages((prev) => [...prev, { role: 'assistant', content: '', sources, timestamp: new Date() }]);
+        },
+        onToken: (token) => updateAnswer((message) => ({ content: message.content + token })),
+      });
+      setSessionId(result.session_id || null);
     } catch (error) {
       console.error('Chat error:', error);
       let errorMessage = 'Sorry, I encountered an error. Please try again.';
@@ -98,6 +96,7 @@ const Chatbot = ({ projectName, meetingName }) => {
       setMessages((prev) => [...prev, errorMsg]);
     } finally {
       setLoading(false);
+      setStreaming(false);
     }
   };
 
@@ -234,7 +233,7 @@ const Chatbot = ({ projectName, meetingName }) => {
             </div>
           </div>
         ))}
-        {loading && (
+        {loading && !streaming && (
           <div className="flex justify-start">
             <div className={`${theme === 'dark' ? 'bg-gray-700 border-gray-600' : 'bg-white border-gray-200'} rounded-2xl p-4 shadow-md border`}>
               <div className="flex items-center space-x-2">
@@ -76,13 +76,14 @@ export const getProjectDataById = async (projectId) => {
   }
 };
 
-// Chat with OrbitMeetAI
-export const chatWithOrbit = async (projectName, question, chatHistory = null) => {
+// Chat with OrbitMeetAI. Pass the session_id from the previous answer to
+// continue a conversation; the server keeps the history.
+export const chatWithOrbit = async (projectName, question, sessionId = null) => {
   try {
     const response = await api.post('/orbit-chat', {
       project_name: projectName,
       question: question,
-      chat_history: chatHistory,
+      session_id: sessionId,
     });
     return response.data;
   } catch (error) {
@@ -91,6 +92,73 @@ export const chatWithOrbit = async (projectName, question, chatHistory = null) =
   }
 };
 
+// Chat with OrbitMeetAI, streaming the answer over Server-Sent Events.
+// onSources(sources) is called before the first token, onToken(text) per token.
+// Resolves to { answer, sources, session_id, ... }; pass session_id back to
+// continue the conversation.
+// Errors are thrown shaped like axios errors (error.response.status / .data).
+export const streamChatWithOrbit = async (projectName, question, sessionId = null, { onSources, onToken } = {}) => {
+  const response = await fetch(`${API_BASE_URL}/orbit-chat/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify({
+      project_name: projectName,
+      question: question,
+      session_id: sessionId,
+    }),
+  });
+
+  if (!response.ok) {
+    const error = new Error(`Request failed with status code ${response.status}`);
+    error.response = { status: response.status, data: await response.json().catch(() => ({})) };
+    console.error('Error chatting with Orbit:', error);
+    throw error;
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = { answer: '', sources: [], cached: false };
+
+  const handleEvent = (raw) => {
+    const event = raw.match(/^event: (.*)$/m)?.[1];
+    const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || '{}');
+
+    if (event === 'sources') {
+      result = {
+        ...result,
+        sources: data.sources || [],
+        project_id: data.project_id,
+        cached: data.cached,
+        session_id: data.session_id,
+      };
+      onSources?.(result.sources);
+    } else if (event === 'token') {
+      result.answer += data.content;
+      onToken?.(data.content);
+    } else if (event === 'error') {
+      const error = new Error(data.detail);
+      error.response = { status: 500, data };
+      throw error;
+    }
+  };
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // Events are separated by a blank line
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      handleEvent(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+    }
+  }
+
+  return result;
+};
+
 // Get all transcripts (for project/meeting selection)
 export const getAllTranscripts = async () => {
   try {
@@ -0,0 +1,254 @@
+"""
+In-memory stand-ins for the MongoDB collections the chatbot and pipeline
+use. Filters support dotted paths (including array elements and positional
+indexes), equality and the $in/$ne/$gt/$gte/$lt/$lte/$exists/$not/$elemMatch
+operators; updates support the operators the code under test sends.
+Projections are ignored by find(); aggregate() supports $match, inclusion
+$project and $unwind.
+"""
+import copy
+import operator
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+COMPARISONS = {"$gt": operator.gt, "$gte": operator.ge, "$lt": operator.lt, "$lte": operator.le}
+
+
+def _resolve(value, parts):
+    """Values at a dotted path; array elements are searched like MongoDB does."""
+    if not parts:
+        return [value]
+    if isinstance(value, list):
+        if parts[0].isdigit():
+            index = int(parts[0])
+            return _resolve(value[index], parts[1:]) if index < len(value) else []
+        return [found for item in value for found in _resolve(item, parts)]
+    if isinstance(value, dict) and parts[0] in value:
+        return _resolve(value[parts[0]], parts[1:])
+    return []
+
+
+def _compare(compare, value, target):
+    try:
+        return value is not None and compare(value, target)
+    except TypeError:
+        return False
+
+
+def _satisfies(values, condition):
+    present = bool(values)
+    values = values or [None]
+    if not (isinstance(condition, dict) and condition and all(op.startswith("$") for op in condition)):
+        return any(v == condition or (isinstance(v, list) and condition in v) for v in values)
+
+    for op, target in condition.items():
+        if op == "$in":
+            ok = any(v in target for v in values)
+        elif op == "$ne":
+            ok = all(v != target for v in values)
+        elif op in COMPARISONS:
+            ok = any(_compare(COMPARISONS[op], v, target) for v in values)
+        elif op == "$exists":
+            ok = present == bool(target)
+        elif op == "$not":
+            ok = not _satisfies(values if present else [], target)
+        elif op == "$elemMatch":
+            ok = any(isinstance(v, list) and any(isinstance(item, dict) and _matches(item, target) for item in v)
+                     for v in values)
+        else:
+            raise NotImplementedError(op)
+        if not ok:
+            return False
+    return True
+
+
+def _matches(doc, query):
+    for key, condition in (query or {}).items():
+        if key == "$or":
+            ok = any(_matches(doc, clause) for clause in condition)
+        elif key == "$and":
+            ok = all(_matches(doc, clause) for clause in condition)
+        else:
+            ok = _satisfies(_resolve(doc, key.split(".")), condition)
+        if not ok:
+            return False
+    return True
+
+
+def _parent(doc, path, create=True):
+    """Container holding the last part of a dotted path, and that part."""
+    parts = path.split(".")
+    node = doc
+    for part in parts[:-1]:
+        if isinstance(node, list):
+            node = node[int(part)]
+        elif part in node or create:
+            node = node.setdefault(part, {})
+        else:
+            return None, None
+    last = parts[-1]
+    return node, int(last) if isinstance(node, list) else last
+
+
+def _include(source, target, parts):
+    """Copy one dotted inclusion path from source into target, through arrays."""
+    if parts[0] not in source:
+        return
+    value = source[parts[0]]
+    if len(parts) == 1:
+        target[parts[0]] = copy.deepcopy(value)
+    elif isinstance(value, list):
+        items = target.setdefault(parts[0], [{} for item in value if isinstance(item, dict)])
+        for item, out in zip((item for item in value if isinstance(item, dict)), items):
+            _include(item, out, parts[1:])
+    elif isinstance(value, dict):
+        _include(value, target.setdefault(parts[0], {}), parts[1:])
+
+
+def _unwind(docs, spec):
+    if isinstance(spec, str):
+        spec = {"path": spec}
+    field = spec["path"].lstrip("$")
+    index_field = spec.get("includeArrayIndex")
+    for doc in docs:
+        for index, item in enumerate(doc.get(field) or []):
+            row = {**doc, field: item}
+            if index_field:
+                row[index_field] = index
+            yield row
+
+
+class FakeCursor(list):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def sort(self, keys):
+        for key, direction in reversed(keys):
+            super().sort(key=lambda doc: doc.get(key) or 0, reverse=direction < 0)
+        return self
+
+
+class FakeCollection:
+    def __init__(self, docs=None):
+        self.docs = [copy.deepcopy(doc) for doc in docs or []]
+
+    def _apply(self, doc, update, inserting=False):
+        sets = dict(update.get("$set", {}))
+        if inserting:
+            sets.update(update.get("$setOnInsert", {}))
+        for path, value in sets.items():
+            node, key = _parent(doc, path)
+            node[key] = copy.deepcopy(value)
+        for path, value in update.get("$inc", {}).items():
+            node, key = _parent(doc, path)
+            node[key] = (node.get(key, 0) if isinstance(node, dict) else node[key]) + value
+        for path in update.get("$unset", {}):
+            node, key = _parent(doc, path, create=False)
+            if isinstance(node, dict):
+                node.pop(key, None)
+        for path, value in update.get("$push", {}).items():
+            node, key = _parent(doc, path)
+            node.setdefault(key, []).append(copy.deepcopy(value))
+        for path, condition in update.get("$pull", {}).items():
+            node, key = _parent(doc, path)
+            node[key] = [item for item in node.get(key, []) if not _matches(item, condition)]
+
+    def find(self, query=None, projection=None):
+        return FakeCursor(copy.deepcopy(doc) for doc in self.docs if _matches(doc, query))
+
+    def find_one(self, query=None, projection=None):
+        found = self.find(query)
+        return found[0] if found else None
+
+    def aggregate(self, pipeline, **kwargs):
+        docs = [copy.deepcopy(doc) for doc in self.docs]
+        for stage in pipeline:
+            (op, spec), = stage.items()
+            if op == "$match":
+                docs = [doc for doc in docs if _matches(doc, spec)]
+            elif op == "$project":
+                projected = []
+                for doc in docs:
+                    out = {"_id": doc.get("_id")}
+                    for path in spec:
+                        _include(doc, out, path.split("."))
+                    projected.append(out)
+                docs = projected
+            elif op == "$unwind":
+                docs = list(_unwind(docs, spec))
+            else:
+                raise NotImplementedError(op)
+        return FakeCursor(docs)
+
+    def distinct(self, key, query=None):
+        return list({doc.get(key) for doc in self.docs if _matches(doc, query)})
+
+    def insert_one(self, doc):
+        # Like pymongo, a missing _id is generated and set on the caller's document
+        doc.setdefault("_id", ObjectId())
+        if any(existing.get("_id") == doc["_id"] for existing in self.docs):
+            raise DuplicateKeyError(f"duplicate _id {doc['_id']}")
+        self.docs.append(copy.deepcopy(doc))
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    def insert_many(self, docs, ordered=True):
+        for doc in docs:
+            self.insert_one(doc)
+
+    def delete_one(self, query):
+        for i, doc in enumerate(self.docs):
+            if _matches(doc, query):
+                del self.docs[i]
+                return SimpleNamespace(deleted_count=1)
+        return SimpleNamespace(deleted_count=0)
+
+    def delete_many(self, query):
+        before = len(self.docs)
+        self.docs = [doc for doc in self.docs if not _matches(doc, query)]
+        return SimpleNamespace(deleted_count=before - len(self.docs))
+
+    def update_one(self, query, update, upsert=False):
+        for doc in self.docs:
+            if _matches(doc, query):
+                before = copy.deepcopy(doc)
+                self._apply(doc, update)
+                return SimpleNamespace(matched_count=1, modified_count=int(doc != before), upserted_id=None)
+        if upsert:
+            doc = {
+                key: value for key, value in query.items()
+                if not key.startswith("$") and "." not in key and not isinstance(value, dict)
+            }
+            self._apply(doc, update, inserting=True)
+            self.insert_one(doc)
+            return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=doc.get("_id"))
+        return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=None)
+
+    def find_one_and_update(self, query, update, projection=None, upsert=False, return_document=None):
+        for doc in self.docs:
+            if _matches(doc, query):
+                before = copy.deepcopy(doc)
+                self._apply(doc, update)
+                return copy.deepcopy(doc if return_document else before)
+        if upsert:
+            result = self.update_one(query, update, upsert=True)
+            return self.find_one({"_id": result.upserted_id}) if return_document else None
+        return None
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def estimated_document_count(self):
+        return len(self.docs)
+
+
+@pytest.fixture
+def fake_db():
+    """Database of FakeCollections, created on first use."""
+    return defaultdict(FakeCollection)
@@ -0,0 +1,135 @@
+"""
+Bounded, version-checked chatbot caches.
+"""
+import pytest
+
+from src.chatbot import cache as cache_module
+from src.chatbot.cache import BoundedTTLCache, SemanticAnswerCache
+from src.chatbot.retrieval import question_vector
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def make_cache(max_entries=3, max_bytes=1000, ttl_seconds=60):
+    return BoundedTTLCache(max_entries, max_bytes, ttl_seconds, sizeof=len)
+
+
+def test_evicts_least_recently_used_by_count():
+    cache = make_cache(max_entries=2)
+    cache.put("a", "x")
+    cache.put("b", "x")
+    cache.get("a")
+    cache.put("c", "x")
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicts_by_bytes_but_keeps_the_newest_entry():
+    cache = make_cache(max_bytes=10)
+    cache.put("a", "x" * 4)
+    cache.put("b", "x" * 4)
+    cache.put("c", "x" * 4)
+
+    assert "a" not in cache
+    assert cache.stats()["bytes"] == 8
+
+    cache.put("huge", "x" * 50)
+    assert len(cache) == 1 and "huge" in cache
+
+
+def test_replacing_a_key_does_not_leak_bytes():
+    cache = make_cache()
+    cache.put("a", "x" * 10)
+    cache.put("a", "x" * 3)
+
+    assert cache.stats()["bytes"] == 3
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = make_cache(ttl_seconds=60)
+    cache.put("a", "x")
+
+    clock.now += 59
+    assert cache.get("a") == "x"
+    clock.now += 2
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.stats()["expirations"] == 1
+
+
+def test_newer_content_version_invalidates():
+    cache = make_cache()
+    cache.put("project", "index", version=3)
+
+    assert cache.get("project", version=3) == "index"
+    assert cache.get("project", version=4) is None
+    assert "project" not in cache
+
+    stats = cache.stats()
+    assert stats["invalidations"] == 1
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def make_answer_cache(threshold=0.92):
+    return SemanticAnswerCache(max_per_project=10, threshold=threshold, ttl_seconds=60, max_projects=4)
+
+
+def test_answer_cache_hits_a_rephrased_question():
+    answers = make_answer_cache()
+    answers.put("p1", 1, question_vector("Who owns the invoice schema?"), {"answer": "Bob"})
+
+    hit = answers.get("p1", 1, question_vector("who owns the invoice schema"))
+
+    assert hit["answer"] == "Bob"
+    assert hit["similarity"] >= 0.92
+
+
+def test_answer_cache_threshold():
+    question = question_vector("when is the billing migration due")
+    related = question_vector("when is the billing migration review due")
+    similarity = float(question @ related)
+    assert 0 < similarity < 1
+
+    strict = make_answer_cache(threshold=similarity + 0.01)
+    strict.put("p1", 1, question, {"answer": "Friday"})
+    assert strict.get("p1", 1, related) is None
+
+    loose = make_answer_cache(threshold=similarity - 0.01)
+    loose.put("p1", 1, question, {"answer": "Friday"})
+    assert loose.get("p1", 1, related)["answer"] == "Friday"
+
+
+def test_answer_cache_keeps_word_order_and_negation_apart():
+    answers = make_answer_cache()
+    answers.put("p1", 1, question_vector("did Ana block Ben"), {"answer": "yes"})
+    answers.put("p1", 1, question_vector("who is attending"), {"answer": "everyone"})
+
+    assert answers.get("p1", 1, question_vector("did Ben block Ana")) is None
+    assert answers.get("p1", 1, question_vector("who is not attending")) is None
+
+
+def test_answer_cache_is_per_project_and_version():
+    answers = make_answer_cache()
+    vector = question_vector("who owns the invoice schema")
+    answers.put("p1", 1, vector, {"answer": "Bob"})
+
+    assert answers.get("p2", 1, vector) is None
+    assert answers.get("p1", 2, vector) is None
+    # The newer version dropped the project's answers
+    assert answers.get("p1", 1, vector) is None
+    assert answers.stats()["invalidations"] == 1
@@ -0,0 +1,90 @@
+"""
+/orbit-chat/stream: Server-Sent Events framing and error reporting.
+"""
+import json
+
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+from src.backend.main import app
+from src.chatbot import orbit_chat
+
+
+PROJECT_ID = str(ObjectId())
+
+
+def stream_of(*events, fail_with=None):
+    async def stream_chat_with_project(project_id, question, chat_history=None, session_id=None):
+        for event in events:
+            yield event
+        if fail_with:
+            raise fail_with
+
+    return stream_chat_with_project
+
+
+def parse_sse(body):
+    """[(event, data)] from an SSE response body."""
+    messages = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        messages.append((lines["event"], json.loads(lines["data"])))
+    return messages
+
+
+@pytest.fixture
+def client():
+    # Not entered as a context manager, so the lifespan (LLM, scheduler) does not start
+    return TestClient(app)
+
+
+SOURCES = {"type": "sources", "sources": ["Kickoff"], "project_id": PROJECT_ID, "cached": False,
+           "tier": "summary", "session_id": "s1"}
+
+
+def test_streams_sources_then_tokens_then_done(client, monkeypatch):
+    monkeypatch.setattr(orbit_chat, "stream_chat_with_project", stream_of(
+        SOURCES,
+        {"type": "token", "content": "Bob "},
+        {"type": "token", "content": "owns it."},
+        {"type": "done", "cached": False, "tier": "summary"}
+    ))
+
+    response = client.post("/orbit-chat/stream", json={"project_id": PROJECT_ID, "question": "Who owns billing?"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["x-accel-buffering"] == "no"
+    messages = parse_sse(response.text)
+    assert [event for event, _ in messages] == ["sources", "token", "token", "done"]
+    assert messages[0][1]["session_id"] == "s1"
+    assert "".join(data["content"] for event, data in messages if event == "token") == "Bob owns it."
+
+
+def test_retrieval_error_is_a_status_code_before_the_stream(client, monkeypatch):
+    monkeypatch.setattr(orbit_chat, "stream_chat_with_project",
+                        stream_of(fail_with=ValueError("No transcripts found for this project")))
+
+    response = client.post("/orbit-chat/stream", json={"project_id": PROJECT_ID, "question": "Who owns billing?"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "No transcripts found for this project"
+
+
+def test_generation_error_ends_the_stream_with_an_error_event(client, monkeypatch):
+    monkeypatch.setattr(orbit_chat, "stream_chat_with_project", stream_of(
+        SOURCES, {"type": "token", "content": "Bob "}, fail_with=RuntimeError("connection reset")
+    ))
+
+    response = client.post("/orbit-chat/stream", json={"project_id": PROJECT_ID, "question": "Who owns billing?"})
+
+    messages = parse_sse(response.text)
+    assert [event for event, _ in messages] == ["sources", "token", "error"]
+    assert messages[-1][1]["detail"].startswith("Error in chat")
+
+
+def test_invalid_project_id_is_rejected(client):
+    response = client.post("/orbit-chat/stream", json={"project_id": "not-an-id", "question": "Who owns billing?"})
+
+    assert response.status_code == 400
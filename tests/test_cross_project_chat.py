@@ -0,0 +1,130 @@
+"""
+Cross-project chat: endpoint name resolution and scoping, and the merged
+retrieval across projects.
+"""
+import asyncio
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from src.backend import main
+from src.backend.main import CrossProjectChatRequest, orbit_chat_across_projects
+from src.chatbot import orbit_chat
+from src.chatbot.project_names import ProjectNameIndex
+
+
+NAMES = ["Project Alpha", "Project Beta", "Mobile App Launch"]
+
+
+@pytest.fixture
+def searched(fake_db, monkeypatch):
+    """Project ids each cross-project question was asked over."""
+    collection = fake_db["Raw_Transcripts"]
+    collection.insert_many([{"_id": ObjectId(), "Project_name": name} for name in NAMES])
+    index = ProjectNameIndex(lambda: collection, refresh_seconds=3600, miss_reload_seconds=0)
+    monkeypatch.setattr(orbit_chat, "project_names", index)
+    calls = []
+
+    async def chat_across_projects(question, project_ids=None):
+        calls.append(project_ids)
+        return {"answer": "None are blocked.", "sources": [], "project_ids": project_ids or []}
+
+    monkeypatch.setattr(orbit_chat, "chat_across_projects", chat_across_projects)
+    return calls
+
+
+def ask(**fields):
+    return asyncio.run(orbit_chat_across_projects(CrossProjectChatRequest(question="Who is blocked?", **fields)))
+
+
+def test_names_resolve_like_the_single_project_endpoint(searched):
+    ask(project_names=["mobile app launch"])
+
+    assert searched == [[orbit_chat.find_project_by_name("Mobile App Launch")]]
+
+
+def test_ambiguous_name_is_a_bad_request_with_suggestions(searched):
+    with pytest.raises(HTTPException) as error:
+        ask(project_names=["project"])
+
+    assert error.value.status_code == 400
+    assert "'Project Alpha'" in error.value.detail and "'Project Beta'" in error.value.detail
+    assert searched == []
+
+
+def test_unknown_name_is_not_found(searched):
+    with pytest.raises(HTTPException) as error:
+        ask(project_names=["Payroll"])
+
+    assert error.value.status_code == 404
+
+
+def test_unscoped_requests_search_every_project_unless_scope_is_required(searched, monkeypatch):
+    ask()
+    assert searched == [None]
+
+    monkeypatch.setattr(main, "cross_project_require_scope", True)
+    with pytest.raises(HTTPException) as error:
+        ask()
+    assert error.value.status_code == 400
+
+
+def hit(project, meeting, similarity, text="x" * 10, score=0.0):
+    return {"project_id": project, "project_name": project.title(), "meeting_name": meeting,
+            "similarity": similarity, "score": score, "text": text}
+
+
+def test_merge_ranks_by_similarity_across_projects():
+    merged = orbit_chat.merge_project_hits([
+        [hit("alpha", "Kickoff", 0.9, score=0.02), hit("alpha", "Retro", 0.2, score=0.03)],
+        [hit("beta", "Standup", 0.5, score=0.01)]
+    ], k=2)
+
+    assert [(h["project_id"], h["meeting_name"]) for h in merged] == [("alpha", "Kickoff"), ("beta", "Standup")]
+
+
+def test_merge_stops_at_the_context_budget():
+    merged = orbit_chat.merge_project_hits([
+        [hit("alpha", "Kickoff", 0.9, text="a" * 80), hit("alpha", "Retro", 0.8, text="b" * 80)],
+        [hit("beta", "Standup", 0.7, text="c" * 15)]
+    ], k=5, budget_chars=100)
+
+    # The second long snippet doesn't fit; the shorter one further down does
+    assert [h["meeting_name"] for h in merged] == ["Kickoff", "Standup"]
+
+
+class EchoChain:
+    def __init__(self):
+        self.inputs = None
+
+    async def ainvoke(self, inputs):
+        self.inputs = inputs
+        return "Alpha is blocked on staging [Project Alpha / Kickoff]."
+
+
+def test_answer_cites_project_and_meeting(fake_db, monkeypatch):
+    collection = fake_db["Raw_Transcripts"]
+    collection.insert_many([{"_id": ObjectId(), "Project_name": name} for name in NAMES])
+    monkeypatch.setattr(orbit_chat, "project_names",
+                        ProjectNameIndex(lambda: collection, refresh_seconds=3600, miss_reload_seconds=0))
+    searched = []
+
+    def search_project(project, question, k):
+        searched.append(project["project_name"])
+        if project["project_name"] != "Project Alpha":
+            return []
+        return [{**hit(project["project_id"], "Kickoff", 0.8, text="Staging access is blocked."),
+                 "project_name": project["project_name"]}]
+
+    chain = EchoChain()
+    monkeypatch.setattr(orbit_chat, "search_project", search_project)
+    monkeypatch.setattr(orbit_chat, "get_cross_project_chain", lambda: chain)
+
+    result = asyncio.run(orbit_chat.chat_across_projects("Who is blocked on staging?"))
+
+    assert sorted(searched) == sorted(NAMES)
+    alpha = orbit_chat.find_project_by_name("Project Alpha")
+    assert result["sources"] == [{"project_id": alpha, "project_name": "Project Alpha", "meeting_name": "Kickoff"}]
+    assert "[Project Alpha / Kickoff]" in chain.inputs["document"]
+    assert len(result["project_ids"]) == len(NAMES)
@@ -0,0 +1,170 @@
+"""
+SMTP delivery engine against a local aiosmtpd stand-in.
+"""
+import smtplib
+import socket
+import threading
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.Agentic.utils import email_delivery
+from src.Agentic.utils.email_delivery import SMTPConnectionPool, close_connection_pools, deliver_emails
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class RecordingHandler:
+    """Keeps every accepted message and the client address it came from."""
+
+    def __init__(self):
+        self.messages = []
+        self.peers = set()
+        self.lock = threading.Lock()
+
+    async def handle_DATA(self, server, session, envelope):
+        with self.lock:
+            self.messages.append(envelope.rcpt_tos[0])
+            self.peers.add(session.peer)
+        return "250 OK"
+
+
+@pytest.fixture(autouse=True)
+def shared_pools():
+    yield
+    close_connection_pools()
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="localhost", port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+def make_settings(port: int, **overrides):
+    settings = {
+        "server": "localhost",
+        "port": port,
+        "email": "orbit@example.com",
+        "password": "",
+        "use_ssl": False,
+        "pool_size": 2,
+        "max_retries": 2,
+        "retry_backoff": 0.0,
+    }
+    settings.update(overrides)
+    return settings
+
+
+def make_messages(count: int):
+    return [
+        {"to": f"user{i}@example.com", "subject": f"Meeting {i}", "html": "<p>Summary</p>"}
+        for i in range(count)
+    ]
+
+
+def test_delivers_more_messages_than_pool_sessions(smtp_server):
+    controller, handler = smtp_server
+
+    result = deliver_emails(make_messages(10), make_settings(controller.port, pool_size=3))
+
+    assert len(result["delivered"]) == 10
+    assert result["failed"] == []
+    assert sorted(handler.messages) == sorted(f"user{i}@example.com" for i in range(10))
+    assert result["metrics"]["pool_size"] == 3
+
+
+def test_refused_connection_is_reported_after_retries():
+    settings = make_settings(free_port(), max_retries=2)
+
+    result = deliver_emails(make_messages(2), settings)
+
+    assert result["delivered"] == []
+    assert [failure["to"] for failure in result["failed"]] == ["user0@example.com", "user1@example.com"]
+    assert result["metrics"]["retries"] == 2 * 2
+
+
+def test_pool_reuses_sessions(smtp_server):
+    controller, handler = smtp_server
+
+    result = deliver_emails(make_messages(12), make_settings(controller.port, pool_size=2))
+
+    assert len(result["delivered"]) == 12
+    # One client port per SMTP connection: at most pool_size were opened
+    assert 1 <= len(handler.peers) <= 2
+
+
+def test_pool_hands_back_idle_session(smtp_server):
+    controller, _ = smtp_server
+    pool = SMTPConnectionPool(make_settings(controller.port, pool_size=1))
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+    pool.release(second)
+    pool.close()
+
+    assert second is first
+
+
+def test_password_is_not_sent_without_starttls(smtp_server):
+    controller, handler = smtp_server
+    settings = make_settings(controller.port, password="secret", max_retries=0)
+
+    result = deliver_emails(make_messages(1), settings)
+
+    # The stand-in offers no STARTTLS, so the session is refused before login
+    assert result["delivered"] == []
+    assert "STARTTLS" in result["failed"][0]["error"]
+    assert handler.messages == []
+
+
+def test_consecutive_runs_share_sessions(smtp_server):
+    controller, handler = smtp_server
+    settings = make_settings(controller.port, pool_size=1)
+
+    deliver_emails(make_messages(3), settings)
+    deliver_emails(make_messages(3), dict(settings))
+
+    assert len(handler.messages) == 6
+    assert len(handler.peers) == 1
+
+
+def test_stale_idle_session_is_replaced(smtp_server, monkeypatch):
+    controller, handler = smtp_server
+    settings = make_settings(controller.port, pool_size=1, max_retries=0)
+    deliver_emails(make_messages(1), settings)
+
+    # The server dropped the idle session
+    pool = email_delivery.get_connection_pool(settings)
+    conn, _ = pool._idle.queue[0]
+
+    def noop():
+        raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    monkeypatch.setattr(conn, "noop", noop)
+    monkeypatch.setattr(email_delivery, "IDLE_CHECK_SECONDS", 0)
+
+    result = deliver_emails(make_messages(1), settings)
+
+    assert result["failed"] == [] and result["metrics"]["retries"] == 0
+    assert len(handler.peers) == 2
+
+
+def test_unexpected_error_fails_one_message_not_the_batch(smtp_server):
+    controller, handler = smtp_server
+    messages = make_messages(2)
+    messages.insert(1, {"to": "jösé@example.com", "subject": "Meeting", "html": "<p>Summary</p>"})
+
+    result = deliver_emails(messages, make_settings(controller.port, pool_size=1))
+
+    assert result["delivered"] == ["user0@example.com", "user1@example.com"]
+    assert [failure["to"] for failure in result["failed"]] == ["jösé@example.com"]
+    assert result["metrics"]["retries"] == 0
@@ -0,0 +1,88 @@
+"""
+Digest batching: one email per recipient per flush, failed recipients kept.
+"""
+import pytest
+
+from src.Agentic.utils import email_digest
+from src.Agentic.utils.email_digest import EmailDigest
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    """Messages per flush; addresses in `outbox.failing` are refused."""
+    class Outbox(list):
+        failing = set()
+
+    sent = Outbox()
+
+    def deliver_emails(messages):
+        sent.append(messages)
+        return {
+            "delivered": [m["to"] for m in messages if m["to"] not in sent.failing],
+            "failed": [{"to": m["to"], "error": "421 try later"} for m in messages if m["to"] in sent.failing],
+            "metrics": {"messages": len(messages)}
+        }
+
+    monkeypatch.setattr(email_digest, "deliver_emails", deliver_emails)
+    return sent
+
+
+def section(to, meeting):
+    return {"to": to, "name": to.split("@")[0].title(), "html": f"<h2>{meeting}</h2>"}
+
+
+def test_one_email_per_recipient(outbox):
+    digest = EmailDigest()
+    digest.add([section("alice@example.com", "Kickoff"), section("bob@example.com", "Kickoff")])
+    digest.add([section("Alice@example.com", "Retro")])
+
+    digest.flush()
+
+    assert sorted(m["to"] for m in outbox[0]) == ["alice@example.com", "bob@example.com"]
+    alice = next(m for m in outbox[0] if m["to"] == "alice@example.com")
+    assert alice["subject"] == "OrbitMeetAI Digest: 2 meeting summaries"
+    assert "Kickoff" in alice["html"] and "Retro" in alice["html"]
+    assert len(digest) == 0
+
+
+def test_failed_recipient_is_sent_on_the_next_flush(outbox):
+    digest = EmailDigest()
+    digest.add([section("alice@example.com", "Kickoff"), section("bob@example.com", "Kickoff")])
+    outbox.failing = {"bob@example.com"}
+
+    digest.flush()
+    assert len(digest) == 1
+
+    digest.add([section("bob@example.com", "Retro")])
+    outbox.failing = set()
+    digest.flush()
+
+    assert [m["to"] for m in outbox[1]] == ["bob@example.com"]
+    assert outbox[1][0]["html"].index("Kickoff") < outbox[1][0]["html"].index("Retro")
+    assert len(digest) == 0
+
+
+def test_failed_delivery_run_keeps_everything(monkeypatch):
+    def deliver_emails(messages):
+        raise ValueError("SMTP_EMAIL not configured")
+
+    monkeypatch.setattr(email_digest, "deliver_emails", deliver_emails)
+    digest = EmailDigest()
+    digest.add([section("alice@example.com", "Kickoff")])
+
+    with pytest.raises(ValueError):
+        digest.flush()
+
+    assert len(digest) == 1
+
+
+def test_recipient_is_dropped_after_max_attempts(outbox, monkeypatch):
+    monkeypatch.setattr(email_digest, "max_flush_attempts", 2)
+    outbox.failing = {"bob@example.com"}
+    digest = EmailDigest()
+    digest.add([section("bob@example.com", "Kickoff")])
+
+    digest.flush()
+    digest.flush()
+
+    assert len(outbox) == 2 and len(digest) == 0
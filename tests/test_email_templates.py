@@ -0,0 +1,57 @@
+"""
+Meeting email rendering: one render per audience, personalised per recipient.
+"""
+from src.Agentic.utils.email_templates import (
+    AUDIENCE_EXECUTIVE,
+    AUDIENCE_PARTICIPANT,
+    RECEIVER_PLACEHOLDER,
+    cards_from_summaries,
+    personalize,
+    render_audience_bodies,
+    render_participant_sections,
+    to_bullets
+)
+
+
+MEETING = "Decided to ship on Friday\nStaging access <still> blocked"
+PROJECT_SUMMARY = "Billing is on track for the Q3 launch."
+
+
+def test_bullets_escape_summary_text():
+    html = str(to_bullets(MEETING + "\n\n"))
+
+    assert html.count("<li>") == 2
+    assert "&lt;still&gt;" in html and "<still>" not in html
+
+
+def test_each_audience_gets_its_own_body():
+    bodies = render_audience_bodies("Sprint Planning", "Billing", MEETING, PROJECT_SUMMARY)
+
+    assert PROJECT_SUMMARY in bodies[AUDIENCE_EXECUTIVE]
+    assert PROJECT_SUMMARY not in bodies[AUDIENCE_PARTICIPANT]
+    assert all(RECEIVER_PLACEHOLDER in body for body in bodies.values())
+
+
+def test_participants_only_see_their_own_card():
+    cards = cards_from_summaries([
+        {"participant_name": "Alice Smith", "key_updates": ["Finished invoices"], "roadblocks": [], "actionable": []},
+        {"participant_name": "Bob Jones", "key_updates": [], "roadblocks": ["Needs staging access"],
+         "actionable": []},
+        {"participant_name": "Quiet Person", "key_updates": [], "roadblocks": [], "actionable": []}
+    ])
+    sections = render_participant_sections(cards)
+    body = render_audience_bodies("Sprint Planning", "Billing", MEETING, PROJECT_SUMMARY)[AUDIENCE_PARTICIPANT]
+
+    alice = personalize(body, "Alice Smith", sections["Alice Smith"])
+
+    assert sorted(sections) == ["Alice Smith", "Bob Jones"]
+    assert "Finished invoices" in alice and "Needs staging access" not in alice
+    assert RECEIVER_PLACEHOLDER not in alice
+
+
+def test_receiver_name_is_escaped():
+    body = render_audience_bodies("Sprint Planning", "Billing", MEETING, PROJECT_SUMMARY)[AUDIENCE_EXECUTIVE]
+
+    html = personalize(body, "<b>Eve</b>")
+
+    assert "&lt;b&gt;Eve&lt;/b&gt;" in html and "<b>Eve</b>" not in html
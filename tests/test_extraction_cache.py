@@ -0,0 +1,82 @@
+"""
+Extraction cache: content-addressed keys, LRU bound and the disk tier.
+"""
+import pytest
+
+from src.Agentic.utils import extraction_cache as cache_module
+from src.Agentic.utils import store_to_mongodb
+from src.Agentic.utils.extraction_cache import ExtractionCache
+
+
+TRANSCRIPT = "Project Alpha-Meeting Recording\nAlice Smith 0:05\nHello.\n"
+
+
+@pytest.fixture
+def transcript(tmp_path):
+    path = tmp_path / "kickoff.txt"
+    path.write_text(TRANSCRIPT)
+    return path
+
+
+def test_renamed_copy_has_the_same_key(transcript, tmp_path):
+    cache = ExtractionCache()
+    copy = tmp_path / "kickoff (1).txt"
+    copy.write_bytes(transcript.read_bytes())
+
+    assert cache.file_key(copy) == cache.file_key(transcript)
+
+
+def test_key_follows_edits(transcript):
+    cache = ExtractionCache()
+    before = cache.file_key(transcript)
+
+    transcript.write_text(TRANSCRIPT + "Bob Jones 0:10\nBye.\n")
+
+    assert cache.file_key(transcript) != before
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ExtractionCache(max_entries=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")
+    cache.put("c", {"n": 3})
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    ExtractionCache(disk_dir=str(tmp_path / "cache")).put("abc123", {"Project_name": "Alpha"})
+
+    restarted = ExtractionCache(disk_dir=str(tmp_path / "cache"))
+
+    assert restarted.get("abc123") == {"Project_name": "Alpha"}
+    assert restarted.stats["disk_hits"] == 1
+
+
+def test_disk_entries_from_an_older_parser_are_ignored(tmp_path, monkeypatch):
+    ExtractionCache(disk_dir=str(tmp_path / "cache")).put("abc123", {"Project_name": "Alpha"})
+    monkeypatch.setattr(cache_module, "CACHE_VERSION", cache_module.CACHE_VERSION + 1)
+
+    assert ExtractionCache(disk_dir=str(tmp_path / "cache")).get("abc123") is None
+
+
+def test_each_file_is_parsed_once(transcript, tmp_path, monkeypatch):
+    parsed = []
+
+    def extract_transcripts(paths):
+        parsed.extend(paths)
+        return TRANSCRIPT
+
+    monkeypatch.setattr(store_to_mongodb, "extraction_cache", ExtractionCache())
+    monkeypatch.setattr(store_to_mongodb, "extract_transcripts", extract_transcripts)
+    copy = tmp_path / "renamed.txt"
+    copy.write_text(TRANSCRIPT)
+
+    first = store_to_mongodb.extract_transcript_cached(transcript)
+    again = store_to_mongodb.extract_transcript_cached(transcript)
+    renamed = store_to_mongodb.extract_transcript_cached(copy)
+
+    assert len(parsed) == 1
+    assert first == again == renamed
+    assert first["Project_name"] == "Project Alpha"
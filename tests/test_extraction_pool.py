@@ -0,0 +1,71 @@
+"""
+Process-pool extraction: per-file timeouts, worker crashes and recycling.
+"""
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.Agentic.utils import extraction_pool
+from src.Agentic.utils.extraction_pool import extract_files
+
+
+def fake_extract(paths):
+    """Stands in for the parsers; the file name picks the behaviour."""
+    name = Path(paths[0]).stem
+    if name == "hang":
+        time.sleep(60)
+    if name == "crash":
+        os._exit(1)
+    if name == "corrupt":
+        raise ValueError("not a zip file")
+    return f"text of {name}"
+
+
+@pytest.fixture(autouse=True)
+def fake_parsers(monkeypatch):
+    # Workers are forked, so they inherit the patched parser
+    fork = multiprocessing.get_context("fork")
+    monkeypatch.setattr(extraction_pool.multiprocessing, "get_context", lambda: fork)
+    monkeypatch.setattr(extraction_pool, "extract_transcripts", fake_extract)
+
+
+def test_extracts_every_file():
+    results = extract_files([Path(f"m{i}.txt") for i in range(5)], workers=2)
+
+    assert results == {f"m{i}.txt": {"text": f"text of m{i}"} for i in range(5)}
+
+
+def test_hung_file_times_out_without_holding_up_the_batch():
+    started = time.monotonic()
+    results = extract_files(["hang.pdf", "a.txt", "b.txt"], workers=1, timeout=0.5)
+
+    assert results["hang.pdf"]["error"].startswith("extraction timed out")
+    assert results["a.txt"] == {"text": "text of a"}
+    assert results["b.txt"] == {"text": "text of b"}
+    assert time.monotonic() - started < 10
+
+
+def test_crashed_worker_fails_only_its_file():
+    results = extract_files(["crash.docx", "a.txt", "b.txt"], workers=1, timeout=10)
+
+    assert results["crash.docx"] == {"error": "extraction worker crashed"}
+    assert results["a.txt"] == {"text": "text of a"}
+    assert results["b.txt"] == {"text": "text of b"}
+
+
+def test_parser_error_is_reported_per_file():
+    results = extract_files(["corrupt.docx", "a.txt"], workers=1, timeout=10)
+
+    assert results["corrupt.docx"] == {"error": "ValueError: not a zip file"}
+    assert results["a.txt"] == {"text": "text of a"}
+
+
+def test_workers_are_recycled(monkeypatch):
+    monkeypatch.setattr(extraction_pool, "MAX_TASKS_PER_CHILD", 2)
+
+    results = extract_files([f"m{i}.txt" for i in range(5)], workers=1, timeout=10)
+
+    assert all("text" in result for result in results.values()) and len(results) == 5
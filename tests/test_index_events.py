@@ -0,0 +1,83 @@
+"""
+Summary index events: batching, per-record dedup and one version bump per
+project.
+"""
+import pytest
+from bson import ObjectId
+
+from src.Agentic.utils import index_events as module
+from src.Agentic.utils.index_events import EVENT_PARTICIPANTS, EVENT_SUMMARY, IndexEventWorker
+
+
+@pytest.fixture
+def indexed(fake_db, monkeypatch):
+    """Calls the worker made into the chunk index, against a two-meeting project."""
+    project_id = ObjectId()
+    fake_db["Raw_Transcripts"].insert_one({"_id": project_id, "Project_key": "billing", "meetings": [
+        {"meeting_name": "Kickoff", "meeting_time": "2025-03-03 10:00:00"},
+        {"meeting_name": "Retro", "meeting_time": "2025-03-10 10:00:00"}
+    ]})
+    calls = {"summary": [], "participants": [], "bumped": [], "backfill": [], "project_id": project_id}
+
+    def index_summary_points(db, project_id, project_key, meeting_name, meeting_time, points, bump_version):
+        calls["summary"].append((meeting_name, meeting_time, points))
+        return len(points)
+
+    def index_participant_insights(db, project_id, project_key, meeting_name, meeting_time, summaries,
+                                   bump_version):
+        raise RuntimeError("write conflict")
+
+    monkeypatch.setattr(module, "index_summary_points", index_summary_points)
+    monkeypatch.setattr(module, "index_participant_insights", index_participant_insights)
+    monkeypatch.setattr(module, "bump_content_version", lambda db, pid: calls["bumped"].append(pid))
+    monkeypatch.setattr(module, "mark_needs_backfill", lambda db, pid: calls["backfill"].append(pid))
+    return fake_db, calls
+
+
+def make_worker(db, **settings):
+    worker = IndexEventWorker("mongodb://unused", **{"batch_size": 32, "batch_wait_seconds": 0.2, **settings})
+    worker._db = lambda: db
+    return worker
+
+
+def test_batch_keeps_the_latest_event_per_record(indexed):
+    db, calls = indexed
+    worker = make_worker(db)
+
+    worker.emit(EVENT_SUMMARY, "billing", "Kickoff", summary_points=["draft"])
+    worker.emit(EVENT_SUMMARY, "billing", "Retro", summary_points=["Ship Friday", "Fix CI"])
+    worker.emit(EVENT_SUMMARY, "billing", "Kickoff", summary_points=["Bob owns billing"])
+    assert worker.flush(timeout=5)
+
+    assert sorted(calls["summary"]) == [
+        ("Kickoff", "2025-03-03 10:00:00", ["Bob owns billing"]),
+        ("Retro", "2025-03-10 10:00:00", ["Ship Friday", "Fix CI"])
+    ]
+    assert calls["bumped"] == [calls["project_id"]]
+    stats = worker.stats()
+    assert (stats["events"], stats["batches"], stats["entries"], stats["pending"]) == (3, 1, 3, 0)
+
+
+def test_batch_size_caps_a_batch(indexed):
+    db, calls = indexed
+    worker = make_worker(db, batch_size=2)
+
+    for meeting in ("Kickoff", "Retro", "Kickoff"):
+        worker.emit(EVENT_SUMMARY, "billing", meeting, summary_points=["x"])
+    worker.flush(timeout=5)
+
+    assert worker.stats()["batches"] == 2
+
+
+def test_failed_entry_flags_backfill_without_losing_the_batch(indexed):
+    db, calls = indexed
+    worker = make_worker(db)
+
+    worker.emit(EVENT_PARTICIPANTS, "billing", "Kickoff", participant_summaries={"Alice": "..."})
+    worker.emit(EVENT_SUMMARY, "billing", "Kickoff", summary_points=["Bob owns billing"])
+    worker.emit(EVENT_SUMMARY, "unknown-project", "Kickoff", summary_points=["ignored"])
+    assert worker.flush(timeout=5)
+
+    assert [call[0] for call in calls["summary"]] == ["Kickoff"]
+    assert calls["backfill"] == [calls["project_id"]]
+    assert worker.stats()["errors"] == 1
@@ -0,0 +1,79 @@
+"""
+Ingest manifest: skip handled files on stat alone, re-check touched ones.
+"""
+import os
+
+import pytest
+
+from src.Agentic.utils.ingest_manifest import IngestManifest
+
+
+@pytest.fixture
+def transcript(tmp_path):
+    path = tmp_path / "kickoff.txt"
+    path.write_text("Project Alpha-Meeting Recording\nAlice Smith 0:05\nHello.\n")
+    return path
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return IngestManifest(tmp_path / "manifest.json")
+
+
+def touch(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+def test_unknown_file_is_new(manifest, transcript):
+    assert manifest.lookup(transcript) is None
+
+
+def test_recorded_file_is_skipped(manifest, transcript):
+    manifest.record(transcript, "uploaded", project_key="alpha")
+
+    entry = manifest.lookup(transcript)
+    assert entry["status"] == "uploaded" and entry["project_key"] == "alpha"
+
+
+def test_touched_file_with_same_content_is_still_known(manifest, transcript):
+    manifest.record(transcript, "uploaded")
+    touch(transcript)
+
+    entry = manifest.lookup(transcript)
+    assert entry is not None
+    assert entry["mtime_ns"] == os.stat(transcript).st_mtime_ns
+
+
+def test_edited_file_is_new_again(manifest, transcript):
+    manifest.record(transcript, "uploaded")
+    transcript.write_text(transcript.read_text().replace("Hello", "Howdy"))
+    touch(transcript)
+
+    assert manifest.lookup(transcript) is None
+
+
+def test_survives_a_restart(manifest, transcript, tmp_path):
+    manifest.record(transcript, "exists")
+    manifest.save()
+
+    reloaded = IngestManifest(tmp_path / "manifest.json").load()
+
+    assert len(reloaded) == 1
+    assert reloaded.lookup(transcript)["status"] == "exists"
+
+
+def test_deleted_files_are_forgotten(manifest, transcript):
+    manifest.record(transcript, "uploaded")
+    transcript.unlink()
+
+    assert manifest.lookup(transcript) is None
+    assert manifest.forget_missing() == 1
+    assert len(manifest) == 0
+
+
+def test_unreadable_manifest_starts_empty(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json")
+
+    assert len(IngestManifest(path).load()) == 0
@@ -0,0 +1,111 @@
+"""
+Scheduler leader election over a lock document in Scheduler_state.
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.backend import leader
+from src.backend.leader import STATE_COLLECTION, LeaderElection
+
+
+@pytest.fixture
+def lock(fake_db):
+    return fake_db[STATE_COLLECTION]
+
+
+def election(lock, owner_id, on_elected=lambda: None, on_demoted=lambda: None):
+    # MongoClient connects lazily, so nothing is contacted here
+    candidate = LeaderElection("mongodb://localhost", owner_id, on_elected, on_demoted)
+    candidate._collection = lock
+    return candidate
+
+
+def expire(lock):
+    lock.update_one({"_id": "scheduler_leader"}, {"$set": {"expires_at": datetime(2000, 1, 1, tzinfo=timezone.utc)}})
+
+
+def test_only_one_owner_holds_the_lock(lock):
+    first, second = election(lock, "a"), election(lock, "b")
+
+    assert first._try_acquire()
+    assert not second._try_acquire()
+    # The holder renews its own lock
+    assert first._try_acquire()
+
+
+def test_takeover_after_the_lease_expires(lock):
+    first, second = election(lock, "a"), election(lock, "b")
+    first._try_acquire()
+
+    expire(lock)
+
+    assert second._try_acquire()
+    assert lock.find_one({"_id": "scheduler_leader"})["owner"] == "b"
+    assert not first._try_acquire()
+
+
+def test_release_hands_the_lock_over_at_once(lock):
+    first, second = election(lock, "a"), election(lock, "b")
+    first._try_acquire()
+
+    first._release()
+
+    assert second._try_acquire()
+
+
+def run_elections(candidates, seconds=0.3):
+    async def run():
+        for candidate in candidates:
+            candidate.start()
+        await asyncio.sleep(seconds)
+        for candidate in candidates:
+            await candidate.stop()
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def fast_leases(monkeypatch):
+    monkeypatch.setattr(leader, "leader_lease_seconds", 0.03)
+
+
+def test_elected_and_demoted_callbacks(lock, fast_leases):
+    events = []
+
+    async def on_elected():
+        events.append("elected")
+
+    candidate = election(lock, "a", on_elected, lambda: events.append("demoted"))
+    run_elections([candidate], seconds=0.1)
+
+    assert events == ["elected", "demoted"]
+    assert not candidate.is_leader
+    assert lock.find_one({"_id": "scheduler_leader"}) is None
+
+
+def test_failed_start_steps_down_for_another_worker(lock, fast_leases):
+    events = []
+
+    def broken_start():
+        events.append("a elected")
+        raise ValueError("GROQ_API_KEY not found in environment variables")
+
+    broken = election(lock, "a", broken_start, lambda: events.append("a demoted"))
+    healthy = election(lock, "b", lambda: events.append("b elected"))
+
+    async def run():
+        # The broken worker starts first and wins the first election
+        broken.start()
+        await asyncio.sleep(0.005)
+        healthy.start()
+        await asyncio.sleep(0.1)
+        status = (broken.is_leader, healthy.is_leader)
+        for candidate in (broken, healthy):
+            await candidate.stop()
+        return status
+
+    assert asyncio.run(run()) == (False, True)
+    assert events[:2] == ["a elected", "a demoted"]
+    assert "b elected" in events
@@ -0,0 +1,102 @@
+"""
+Chat session memory: history rendering within budget and condensing.
+"""
+import asyncio
+
+from src.chatbot import memory
+from src.chatbot.memory import (
+    MEMORY_TOKENS,
+    MEMORY_TURNS,
+    condense_session,
+    estimate_tokens,
+    load_session,
+    record_turn,
+    render_history
+)
+
+
+class FakeSummaryChain:
+    """Stands in for the LLM summary chain; records what it was asked to fold."""
+
+    def __init__(self, summary="Earlier they discussed the billing migration."):
+        self.summary = summary
+        self.calls = []
+
+    async def ainvoke(self, inputs):
+        self.calls.append(inputs)
+        return self.summary
+
+
+def turn(i, size=40):
+    return {"id": str(i), "question": f"Question {i} " + "q" * size, "answer": f"Answer {i} " + "a" * size}
+
+
+def test_new_session_renders_nothing():
+    assert render_history({"summary": "", "turns": []}) == ""
+
+
+def test_history_keeps_the_last_turns_in_order():
+    session = {"summary": "", "turns": [turn(i) for i in range(MEMORY_TURNS + 3)]}
+
+    history = render_history(session)
+
+    kept = [i for i in range(MEMORY_TURNS + 3) if f"Question {i} " in history]
+    assert kept == list(range(3, MEMORY_TURNS + 3))
+    assert history.index("Question 3 ") < history.index(f"Question {MEMORY_TURNS + 2} ")
+
+
+def test_history_stays_within_token_budget():
+    huge = MEMORY_TOKENS * memory.CHARS_PER_TOKEN * 2
+    session = {"summary": "s" * huge, "turns": [turn(i, size=huge) for i in range(MEMORY_TURNS)]}
+
+    history = render_history(session)
+
+    # Summary and every turn are clipped; headers add only a few tokens
+    assert estimate_tokens(history) <= MEMORY_TOKENS + 50
+    assert "(Summary of earlier conversation)" in history
+    assert f"Question {MEMORY_TURNS - 1} " in history
+
+
+def test_record_turn_counts_verbatim_turns(fake_db):
+    assert record_turn(fake_db, "s1", "p1", "Who owns billing?", "Bob") == 1
+    assert record_turn(fake_db, "s1", "p1", "By when?", "Friday") == 2
+    # Sessions are per project
+    assert record_turn(fake_db, "s1", "p2", "Who owns billing?", "Ana") == 1
+
+    session = load_session(fake_db, "s1", "p1")
+    assert [t["question"] for t in session["turns"]] == ["Who owns billing?", "By when?"]
+
+
+def test_condense_folds_old_turns_once(fake_db):
+    for i in range(MEMORY_TURNS + 2):
+        record_turn(fake_db, "s1", "p1", f"Question {i}", f"Answer {i}")
+    chain = FakeSummaryChain()
+
+    assert asyncio.run(condense_session(fake_db, "s1", "p1", chain)) is True
+    session = load_session(fake_db, "s1", "p1")
+    assert session["summary"] == chain.summary
+    assert [t["question"] for t in session["turns"]] == [f"Question {i}" for i in range(2, MEMORY_TURNS + 2)]
+    assert "Question 0" in chain.calls[0]["turns"] and "Question 2" not in chain.calls[0]["turns"]
+
+    # Nothing left to fold: a second run is a no-op and skips the LLM
+    assert asyncio.run(condense_session(fake_db, "s1", "p1", chain)) is False
+    assert len(chain.calls) == 1
+    assert load_session(fake_db, "s1", "p1") == session
+
+
+def test_condense_loses_to_a_concurrent_condense(fake_db):
+    for i in range(MEMORY_TURNS + 2):
+        record_turn(fake_db, "s1", "p1", f"Question {i}", f"Answer {i}")
+
+    class RacingChain(FakeSummaryChain):
+        async def ainvoke(self, inputs):
+            # Another worker condenses while this one waits on the LLM
+            fake_db[memory.SESSION_COLLECTION].update_one(
+                {"_id": "s1:p1"}, {"$set": {"summary": "theirs"}, "$inc": {"summary_version": 1}}
+            )
+            return await super().ainvoke(inputs)
+
+    assert asyncio.run(condense_session(fake_db, "s1", "p1", RacingChain("ours"))) is False
+    session = load_session(fake_db, "s1", "p1")
+    assert session["summary"] == "theirs"
+    assert len(session["turns"]) == MEMORY_TURNS + 2
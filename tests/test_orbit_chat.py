@@ -0,0 +1,187 @@
+"""
+Chat handlers: blocking Mongo and index work stays off the event loop,
+session memory is condensed in batches, and summary answers escalate to the
+transcript tier when they come up short.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.chatbot import orbit_chat
+
+
+CACHED = {"answer": "Bob owns it.", "sources": ["Kickoff"], "tier": "summary", "similarity": 1.0}
+
+
+@pytest.fixture
+def loop_threads(monkeypatch):
+    """Records which thread each blocking step ran on."""
+    threads = {}
+
+    def open_session(project_id, session_id, chat_history):
+        threads["open_session"] = threading.current_thread()
+        return {"summary": "", "turns": []}
+
+    def prepare_chat(project_id, question, session):
+        threads["prepare_chat"] = threading.current_thread()
+        return {"cached": CACHED}
+
+    monkeypatch.setattr(orbit_chat, "open_session", open_session)
+    monkeypatch.setattr(orbit_chat, "prepare_chat", prepare_chat)
+
+    async def remember_turn(*args):
+        pass
+
+    monkeypatch.setattr(orbit_chat, "remember_turn", remember_turn)
+    return threads
+
+
+def test_chat_prepares_off_the_event_loop(loop_threads):
+    result = asyncio.run(orbit_chat.chat_with_project("p1", "Who owns billing?"))
+
+    assert result["answer"] == CACHED["answer"] and result["cached"]
+    assert loop_threads["open_session"] is not threading.main_thread()
+    assert loop_threads["prepare_chat"] is not threading.main_thread()
+
+
+def test_stream_prepares_off_the_event_loop(loop_threads):
+    async def collect():
+        return [event async for event in orbit_chat.stream_chat_with_project("p1", "Who owns billing?")]
+
+    events = asyncio.run(collect())
+
+    assert [event["type"] for event in events] == ["sources", "token", "done"]
+    assert loop_threads["open_session"] is not threading.main_thread()
+    assert loop_threads["prepare_chat"] is not threading.main_thread()
+
+
+class FakeChain:
+    async def ainvoke(self, inputs):
+        return "Summary so far."
+
+
+@pytest.fixture
+def session_db(fake_db, monkeypatch):
+    monkeypatch.setattr(orbit_chat, "get_mongo_client", lambda: {"OMNI_MEET_DB": fake_db})
+    monkeypatch.setattr(orbit_chat, "get_condense_chain", lambda: FakeChain())
+    calls = {"record": set(), "condense": 0}
+    real_record, real_condense = orbit_chat.record_turn, orbit_chat.condense_session
+
+    def record_turn(*args):
+        calls["record"].add(threading.current_thread())
+        return real_record(*args)
+
+    async def condense_session(*args):
+        calls["condense"] += 1
+        return await real_condense(*args)
+
+    monkeypatch.setattr(orbit_chat, "record_turn", record_turn)
+    monkeypatch.setattr(orbit_chat, "condense_session", condense_session)
+    return fake_db, calls
+
+
+def test_turns_are_condensed_in_batches(session_db):
+    db, calls = session_db
+
+    async def chat(turns):
+        for i in range(turns):
+            await orbit_chat.remember_turn("s1", "p1", f"Question {i}", f"Answer {i}")
+            await asyncio.gather(*orbit_chat.background_tasks)
+
+    asyncio.run(chat(orbit_chat.CONDENSE_AT_TURNS - 1))
+    assert calls["condense"] == 0
+    assert threading.main_thread() not in calls["record"]
+
+    asyncio.run(chat(1))
+    assert calls["condense"] == 1
+    session = orbit_chat.load_session(db, "s1", "p1")
+    assert session["summary"] == "Summary so far."
+    assert len(session["turns"]) == orbit_chat.CONDENSE_AT_TURNS // 2
+
+    # The next condense waits for another full batch
+    asyncio.run(chat(orbit_chat.CONDENSE_AT_TURNS // 2 - 1))
+    assert calls["condense"] == 1
+
+
+class TierChain:
+    """Answers with a fixed reply, as one call or as a token stream."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    async def ainvoke(self, inputs):
+        self.calls += 1
+        return self.reply
+
+    async def astream(self, inputs):
+        self.calls += 1
+        for i in range(0, len(self.reply), 7):
+            yield self.reply[i:i + 7]
+
+
+@pytest.fixture
+def tiers(loop_threads, monkeypatch):
+    """Summary and transcript tiers; set `tiers["summary"].reply` per test."""
+    chains = {"summary": TierChain(""), "transcript": TierChain("Bob owns billing, per the kickoff.")}
+
+    def prepare_chat(project_id, question, session):
+        return {"cached": None, "version": 1, "vector": None, "tiers": [
+            {"name": name, "chain": chain, "inputs": {"question": question}, "sources": [f"{name} source"]}
+            for name, chain in chains.items()
+        ]}
+
+    monkeypatch.setattr(orbit_chat, "prepare_chat", prepare_chat)
+    monkeypatch.setattr(orbit_chat, "_cache_answer", lambda *args: None)
+    return chains
+
+
+def stream_answer(question):
+    async def collect():
+        return [event async for event in orbit_chat.stream_chat_with_project("p1", question)]
+
+    events = asyncio.run(collect())
+    return events[0], "".join(event["content"] for event in events if event["type"] == "token")
+
+
+def test_summary_answer_is_used_when_it_answers(tiers):
+    tiers["summary"].reply = "Bob owns billing."
+
+    result = asyncio.run(orbit_chat.chat_with_project("p1", "Who owns billing?"))
+
+    assert (result["tier"], result["answer"]) == ("summary", "Bob owns billing.")
+    assert tiers["transcript"].calls == 0
+
+
+@pytest.mark.parametrize("reply", [
+    orbit_chat.INSUFFICIENT_CONTEXT,
+    "The summaries do not mention who owns billing.",
+    ""
+])
+def test_unanswered_summary_escalates_to_transcripts(tiers, reply):
+    tiers["summary"].reply = reply
+
+    result = asyncio.run(orbit_chat.chat_with_project("p1", "Who owns billing?"))
+
+    assert result["tier"] == "transcript"
+    assert result["sources"] == ["transcript source"]
+
+
+def test_stream_escalates_without_sending_the_sentinel(tiers):
+    tiers["summary"].reply = orbit_chat.INSUFFICIENT_CONTEXT
+
+    sources, answer = stream_answer("Who owns billing?")
+
+    assert sources["tier"] == "transcript"
+    assert answer == "Bob owns billing, per the kickoff."
+
+
+def test_stream_sends_a_long_summary_answer(tiers):
+    tiers["summary"].reply = "Bob owns billing. " * 10
+
+    sources, answer = stream_answer("Who owns billing?")
+
+    assert sources["tier"] == "summary"
+    assert answer == tiers["summary"].reply
+    assert tiers["transcript"].calls == 0
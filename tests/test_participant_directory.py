@@ -0,0 +1,78 @@
+"""
+Participant directory: fuzzy name matching and recipient targeting.
+"""
+import os
+
+import pytest
+
+from src.Agentic.utils.participant_directory import ParticipantDirectory, fuzzy_lookup, normalize_name
+
+
+CSV = """EmployeeName,EmployeeEmail,Department,Role
+Ana Gomez,ana@example.com,Engineering,Developer
+Ben Okafor,ben@example.com,Engineering,QA Engineer
+Carla Rossi,carla@example.com,Engineering,Director
+Dev Patel,dev@example.com,Marketing,Designer
+Erin Walsh,erin@example.com,Marketing,Head
+Farid Haddad,farid@example.com,Finance,Chief
+"""
+
+
+@pytest.fixture
+def directory(tmp_path):
+    path = tmp_path / "participants.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return ParticipantDirectory(str(path)).refresh()
+
+
+def emails(participants):
+    return sorted(p.email for p in participants)
+
+
+def test_fuzzy_lookup_threshold():
+    mapping = {normalize_name("Ana Gomez"): "ana"}
+
+    assert fuzzy_lookup("  ANA   gomez ", mapping) == "ana"
+    assert fuzzy_lookup("Gomez Ana", mapping) == "ana"
+    assert fuzzy_lookup("Ana Gomes", mapping) == "ana"
+    assert fuzzy_lookup("Anne Gmz", mapping) is None
+    assert fuzzy_lookup("Anne Gmz", mapping, threshold=60) == "ana"
+    assert fuzzy_lookup("Ana Gomez", {}) is None
+
+
+def test_attendees_split_into_participants_and_department_executives(directory):
+    recipients = directory.resolve_recipients(["Ana Gomes", "Ben Okafor", "Dev Patel", "Ana Gomez"])
+
+    # Ana is matched once despite the two spellings
+    assert [(p.email, name) for p, name in recipients["participants"]] == [
+        ("ana@example.com", "Ana Gomes"),
+        ("ben@example.com", "Ben Okafor"),
+        ("dev@example.com", "Dev Patel")
+    ]
+    # Engineering is the attendees' most common department
+    assert emails(recipients["executives"]) == ["carla@example.com"]
+    assert recipients["unmatched"] == []
+
+
+def test_executive_attendees_are_kept_outside_their_department(directory):
+    recipients = directory.resolve_recipients(["Dev Patel", "Erin Walsh", "Farid Haddad"])
+
+    assert emails(recipients["executives"]) == ["erin@example.com", "farid@example.com"]
+    assert emails(p for p, _ in recipients["participants"]) == ["dev@example.com"]
+
+
+def test_unmatched_attendees_fall_back_to_all_executives(directory):
+    recipients = directory.resolve_recipients(["Zed Unknown"])
+
+    assert recipients["participants"] == []
+    assert recipients["unmatched"] == ["Zed Unknown"]
+    assert emails(recipients["executives"]) == ["carla@example.com", "erin@example.com", "farid@example.com"]
+
+
+def test_directory_reloads_when_the_file_changes(directory):
+    with open(directory.path, "a", encoding="utf-8") as f:
+        f.write("Gia Lee,gia@example.com,Finance,Analyst\n")
+    stat = os.stat(directory.path)
+    os.utime(directory.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert directory.refresh().get_by_email("GIA@example.com").name == "Gia Lee"
@@ -0,0 +1,80 @@
+"""
+In-memory project-name resolution: exact, unique word prefix, fuzzy.
+"""
+import pytest
+from bson import ObjectId
+
+from src.chatbot.project_names import ProjectNameIndex, normalize_project_name
+
+
+NAMES = ["Project Alpha", "Project Beta", "Café Redesign", "Mobile App Launch"]
+
+
+def make_index(collection, **overrides):
+    settings = {"refresh_seconds": 3600, "miss_reload_seconds": 0}
+    settings.update(overrides)
+    return ProjectNameIndex(lambda: collection, **settings)
+
+
+@pytest.fixture
+def collection(fake_db):
+    collection = fake_db["Raw_Transcripts"]
+    collection.insert_many([
+        {"_id": ObjectId(), "Project_name": name, "Project_key": normalize_project_name(name).replace(" ", "_")}
+        for name in NAMES
+    ])
+    return collection
+
+
+def test_exact_name_ignores_case_accents_and_punctuation(collection):
+    index = make_index(collection)
+
+    assert index.resolve("cafe  redesign!")["project_name"] == "Café Redesign"
+    assert index.resolve("PROJECT ALPHA")["project_name"] == "Project Alpha"
+
+
+def test_unique_word_prefix_resolves(collection):
+    index = make_index(collection)
+
+    assert index.resolve("project al")["project_name"] == "Project Alpha"
+    assert index.resolve("launch")["project_name"] == "Mobile App Launch"
+    assert index.resolve("app l")["project_name"] == "Mobile App Launch"
+
+
+def test_ambiguous_prefix_resolves_to_nothing(collection):
+    index = make_index(collection)
+
+    assert index.resolve("project") is None
+    assert index.is_ambiguous("project")
+    assert [p["project_name"] for p in index.autocomplete("project")] == ["Project Beta", "Project Alpha"]
+
+    # Ambiguity is not a miss, so it does not reload the index
+    collection.insert_one({"_id": ObjectId(), "Project_name": "Project Gamma"})
+    index.resolve("project")
+    assert len(index) == len(NAMES)
+
+
+def test_fuzzy_match_above_threshold_only(collection):
+    index = make_index(collection)
+
+    assert index.resolve("Mobile Ap Lanch")["project_name"] == "Mobile App Launch"
+    assert index.resolve("Quarterly Budget") is None
+    assert not index.is_ambiguous("Quarterly Budget")
+
+
+def test_miss_reloads_once_for_new_project(collection):
+    index = make_index(collection)
+    assert index.resolve("Data Platform") is None
+
+    collection.insert_one({"_id": ObjectId(), "Project_name": "Data Platform"})
+
+    assert index.resolve("Data Platform")["project_name"] == "Data Platform"
+
+
+def test_miss_reload_is_rate_limited(collection):
+    index = make_index(collection, miss_reload_seconds=3600)
+    len(index)
+
+    collection.insert_one({"_id": ObjectId(), "Project_name": "Data Platform"})
+
+    assert index.resolve("Data Platform") is None
@@ -0,0 +1,103 @@
+"""
+Transcript chunking and hybrid (TF-IDF + BM25) search over a project index.
+"""
+from bson import ObjectId
+
+from src.Agentic.utils.chunk_index import (
+    BACKFILL_FIELD,
+    BACKFILL_VERSION,
+    KIND_SUMMARY,
+    KIND_TRANSCRIPT,
+    chunk_transcript,
+    index_meeting_chunks,
+    index_summary_points
+)
+from src.chatbot.retrieval import ProjectIndex
+
+
+TRANSCRIPT = """Alice Moreno 0:01
+The billing migration is blocked on the invoice schema.
+Bob Kumar 0:45
+I can fix the invoice schema by Friday.
+Carol Diaz 1:30
+Marketing wants the launch video reviewed next week.
+Alice Moreno 2:10
+Let's also plan the team offsite in Lisbon.
+"""
+
+
+def load_index(db, project_id):
+    project = {"_id": project_id, "Project_key": "billing", BACKFILL_FIELD: BACKFILL_VERSION, "meetings": []}
+    return ProjectIndex.load(db, project)
+
+
+def test_chunks_keep_whole_speaker_turns():
+    chunks = chunk_transcript(TRANSCRIPT, max_chars=140)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        # Every chunk starts at a speaker header, so no turn is split
+        assert chunk["text"].split("\n")[0].split(" ")[0] in {"Alice", "Bob", "Carol"}
+    assert [chunk["speakers"] for chunk in chunks] == [
+        ["Alice Moreno", "Bob Kumar"],
+        ["Carol Diaz", "Alice Moreno"]
+    ]
+    assert "\n".join(chunk["text"] for chunk in chunks) == "\n".join(
+        line.strip() for line in TRANSCRIPT.splitlines() if line.strip()
+    )
+
+
+def test_text_without_speaker_headers_is_one_chunk():
+    chunks = chunk_transcript("Notes from the call.\nNo speaker lines here.")
+
+    assert chunks == [{"text": "Notes from the call.\nNo speaker lines here.", "speakers": []}]
+
+
+def test_search_ranks_the_relevant_chunk_first(fake_db):
+    project_id = ObjectId()
+    meetings = {
+        "Billing sync": "Bob Kumar 0:01\nI can fix the invoice schema by Friday.",
+        "Marketing sync": "Carol Diaz 0:01\nThe launch video needs a review before Friday.",
+        "Team sync": "Alice Moreno 0:01\nLet's plan the team offsite in Lisbon."
+    }
+    for meeting_name, transcript in meetings.items():
+        index_meeting_chunks(fake_db, project_id, "billing", meeting_name, "2024-05-01", transcript)
+    index = load_index(fake_db, project_id)
+
+    results = index.search("When will the invoice schema be fixed?", k=3)
+
+    assert [result["meeting_name"] for result in results] == ["Billing sync"]
+    assert results[0]["similarity"] > 0
+
+    # "Friday" alone matches two meetings; the fused scores stay ordered
+    results = index.search("what is due friday", k=3)
+    assert {result["meeting_name"] for result in results} == {"Billing sync", "Marketing sync"}
+    assert results[0]["score"] >= results[1]["score"]
+
+
+def test_search_filters_by_kind(fake_db):
+    project_id = ObjectId()
+    index_meeting_chunks(fake_db, project_id, "billing", "Weekly sync", "2024-05-01", TRANSCRIPT)
+    index_summary_points(fake_db, project_id, "billing", "Weekly sync", "2024-05-01",
+                         ["Invoice schema fix is due Friday"])
+    index = load_index(fake_db, project_id)
+
+    results = index.search("invoice schema", kind=KIND_SUMMARY)
+
+    assert [result["kind"] for result in results] == [KIND_SUMMARY]
+    assert all(result["kind"] == KIND_TRANSCRIPT for result in index.search("offsite Lisbon", kind=KIND_TRANSCRIPT))
+
+
+def test_search_without_matching_terms_is_empty(fake_db):
+    project_id = ObjectId()
+    index_meeting_chunks(fake_db, project_id, "billing", "Weekly sync", "2024-05-01", TRANSCRIPT)
+    index = load_index(fake_db, project_id)
+
+    assert index.search("quarterly kubernetes budget") == []
+
+
+def test_empty_project_index(fake_db):
+    index = load_index(fake_db, ObjectId())
+
+    assert len(index) == 0
+    assert index.search("invoice schema") == []
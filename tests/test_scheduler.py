@@ -0,0 +1,176 @@
+"""
+Scheduler meeting leases: claiming, expiry takeover, fencing and retry backoff.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+
+from src.backend import scheduler
+
+
+@pytest.fixture
+def raw(fake_db, monkeypatch):
+    monkeypatch.setattr(scheduler, "get_db", lambda: fake_db)
+    return fake_db["Raw_Transcripts"]
+
+
+@pytest.fixture
+def project(raw):
+    project_id = ObjectId()
+    raw.insert_one({"_id": project_id, "Project_key": "billing", "Project_name": "Billing", "meetings": [
+        {"meeting_name": "Kickoff", "processed": False}
+    ]})
+    return project_id
+
+
+def stored_meeting(raw, project_id, index=0):
+    return raw.find_one({"_id": project_id})["meetings"][index]
+
+
+def meeting_info(raw, project_id, index=0):
+    return {
+        "document_id": project_id,
+        "meeting_index": index,
+        "meeting_data": stored_meeting(raw, project_id, index),
+        "project_key": "billing",
+        "project_name": "Billing"
+    }
+
+
+def fail_runs(monkeypatch):
+    async def failing_run(*args):
+        return False
+
+    monkeypatch.setattr(scheduler, "workflow", object())
+    monkeypatch.setattr(scheduler, "_run_claimed_meeting", failing_run)
+
+
+def test_retry_backoff_doubles_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(scheduler, "retry_backoff_seconds", 60)
+    monkeypatch.setattr(scheduler, "retry_backoff_max_seconds", 300)
+
+    assert [scheduler.retry_backoff(n).total_seconds() for n in (1, 2, 3, 4, 50)] == [60, 120, 240, 300, 300]
+
+
+def test_failed_run_backs_off_before_the_next_claim(raw, project, monkeypatch):
+    fail_runs(monkeypatch)
+
+    assert asyncio.run(scheduler.process_meeting(meeting_info(raw, project))) is False
+
+    meeting = stored_meeting(raw, project)
+    assert meeting["attempts"] == 1
+    assert meeting["retry_after"] > datetime.now(timezone.utc)
+    assert "processing_owner" not in meeting and "lease_expires_at" not in meeting
+    # Another trigger inside the backoff window can't claim it again
+    assert scheduler.claim_meeting(project, 0, "Kickoff") is False
+
+
+def test_failures_count_up_across_attempts(raw, project, monkeypatch):
+    fail_runs(monkeypatch)
+    asyncio.run(scheduler.process_meeting(meeting_info(raw, project)))
+    raw.update_one({"_id": project}, {"$set": {
+        "meetings.0.retry_after": datetime.now(timezone.utc) - timedelta(seconds=1)
+    }})
+
+    asyncio.run(scheduler.process_meeting(meeting_info(raw, project)))
+
+    meeting = stored_meeting(raw, project)
+    assert meeting["attempts"] == 2
+    assert meeting["retry_after"] - meeting["last_failed_at"] == scheduler.retry_backoff(2)
+
+
+def as_worker(monkeypatch, name):
+    monkeypatch.setattr(scheduler, "worker_id", name)
+
+
+def expire_lease(raw, project_id, index=0):
+    raw.update_one({"_id": project_id}, {"$set": {
+        f"meetings.{index}.lease_expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)
+    }})
+
+
+def test_live_lease_blocks_other_claims(raw, project, monkeypatch):
+    as_worker(monkeypatch, "a")
+    assert scheduler.claim_meeting(project, 0, "Kickoff")
+
+    as_worker(monkeypatch, "b")
+    assert scheduler.claim_meeting(project, 0, "Kickoff") is False
+    # Index fencing: a meeting that moved under a different name is not claimed
+    assert scheduler.claim_meeting(project, 0, "Retro") is False
+    assert stored_meeting(raw, project)["processing_owner"] == "a"
+
+
+def test_expired_lease_can_be_taken_over(raw, project, monkeypatch):
+    as_worker(monkeypatch, "a")
+    scheduler.claim_meeting(project, 0, "Kickoff")
+    expire_lease(raw, project)
+
+    as_worker(monkeypatch, "b")
+    assert scheduler.claim_meeting(project, 0, "Kickoff")
+    assert stored_meeting(raw, project)["processing_owner"] == "b"
+
+
+def test_only_the_lease_holder_can_complete_or_release(raw, project, monkeypatch):
+    monkeypatch.setattr(scheduler, "mongo_uri", "mongodb://unused")
+    as_worker(monkeypatch, "a")
+    scheduler.claim_meeting(project, 0, "Kickoff")
+
+    as_worker(monkeypatch, "b")
+    assert scheduler.mark_meeting_as_processed(project, 0) is False
+    scheduler.release_lease(project, 0)
+    assert stored_meeting(raw, project)["processing_owner"] == "a"
+
+    as_worker(monkeypatch, "a")
+    assert scheduler.mark_meeting_as_processed(project, 0)
+    meeting = stored_meeting(raw, project)
+    assert meeting["processed"] is True and "processing_owner" not in meeting
+
+
+def test_expired_lease_cannot_complete(raw, project, monkeypatch):
+    monkeypatch.setattr(scheduler, "mongo_uri", "mongodb://unused")
+    as_worker(monkeypatch, "a")
+    scheduler.claim_meeting(project, 0, "Kickoff")
+    expire_lease(raw, project)
+
+    assert scheduler.mark_meeting_as_processed(project, 0) is False
+    assert stored_meeting(raw, project)["processed"] is False
+
+
+def test_renewal_fails_once_another_worker_took_over(raw, project, monkeypatch):
+    as_worker(monkeypatch, "a")
+    scheduler.claim_meeting(project, 0, "Kickoff")
+    first_expiry = stored_meeting(raw, project)["lease_expires_at"]
+    assert scheduler.renew_lease(project, 0)
+    assert stored_meeting(raw, project)["lease_expires_at"] >= first_expiry
+
+    expire_lease(raw, project)
+    as_worker(monkeypatch, "b")
+    scheduler.claim_meeting(project, 0, "Kickoff")
+
+    as_worker(monkeypatch, "a")
+    assert scheduler.renew_lease(project, 0) is False
+
+
+def test_backlog_lists_only_meetings_ready_to_run(raw):
+    now = datetime.now(timezone.utc)
+    project_id = ObjectId()
+    raw.insert_one({"_id": project_id, "Project_key": "billing", "Project_name": "Billing", "meetings": [
+        {"meeting_name": "Kickoff", "processed": True, "Transcript": ["old inline text"]},
+        {"meeting_name": "Planning", "processed": False, "Transcript": ["inline text"]},
+        {"meeting_name": "Standup", "processed": False, "attempts": 2, "retry_after": now + timedelta(hours=1)},
+        {"meeting_name": "Retro", "processed": False, "attempts": 1, "retry_after": now - timedelta(minutes=1)}
+    ]})
+    raw.insert_one({"_id": ObjectId(), "Project_key": "done", "meetings": [
+        {"meeting_name": "Wrap-up", "processed": True}
+    ]})
+
+    backlog = list(scheduler.iter_unprocessed_meetings())
+
+    assert [(item["meeting_index"], item["meeting_data"]["meeting_name"]) for item in backlog] == [
+        (1, "Planning"), (3, "Retro")
+    ]
+    assert all(item["document_id"] == project_id and item["project_name"] == "Billing" for item in backlog)
+    # Transcript bodies never leave the database
+    assert all("Transcript" not in item["meeting_data"] for item in backlog)
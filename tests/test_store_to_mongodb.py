@@ -0,0 +1,61 @@
+"""
+Transcript ingest: content-hash dedup and blob cleanup on failed writes.
+"""
+import pytest
+
+from src.Agentic.utils import store_to_mongodb
+from src.Agentic.utils.store_to_mongodb import add_transcript_to_mongo
+from src.Agentic.utils.transcript_store import BLOB_COLLECTION
+
+
+TRANSCRIPT = """Project Alpha-Meeting Recording
+3 March 2025, 10:00am
+12m 30s
+
+Alice Smith 0:05
+Staging access is still blocked.
+
+Bob Jones 0:20
+I'll chase the infra team today.
+"""
+
+
+@pytest.fixture
+def db(fake_db, monkeypatch):
+    monkeypatch.setattr(store_to_mongodb, "MongoClient", lambda uri: {"OMNI_MEET_DB": fake_db})
+    return fake_db
+
+
+def add(transcript):
+    return add_transcript_to_mongo("unused.txt", mongo_uri="mongodb://unused", transcript=transcript)
+
+
+def test_renamed_copy_is_rejected_by_content_hash(db):
+    assert add(TRANSCRIPT).startswith("Created new project")
+
+    # Same words, different spacing and case: a re-exported copy of the same meeting
+    copy = TRANSCRIPT.replace("Staging access", "staging   ACCESS")
+    assert "already exists with content_hash" in add(copy)
+
+    assert len(db[BLOB_COLLECTION].docs) == 1
+    assert len(db["Raw_Transcripts"].docs) == 1
+
+
+def test_failed_meeting_write_leaves_no_blob_behind(db, monkeypatch):
+    raw = db["Raw_Transcripts"]
+    insert_one = raw.insert_one
+    failures = [ConnectionError("primary stepped down")]
+
+    def flaky_insert(doc):
+        if failures:
+            raise failures.pop()
+        return insert_one(doc)
+
+    monkeypatch.setattr(raw, "insert_one", flaky_insert)
+    with pytest.raises(ConnectionError):
+        add(TRANSCRIPT)
+    assert db[BLOB_COLLECTION].docs == []
+
+    # The retry is not mistaken for a duplicate
+    assert add(TRANSCRIPT).startswith("Created new project")
+    assert raw.docs[0]["meetings"][0]["transcript_ref"] == db[BLOB_COLLECTION].docs[0]["_id"]
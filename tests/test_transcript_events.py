@@ -0,0 +1,216 @@
+"""
+Scheduler triggers: change stream events and resume tokens, and the polling
+fallback.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from src.backend import transcript_events
+from src.backend.transcript_events import (
+    DB_NAME,
+    RAW_COLLECTION,
+    RESUME_TOKEN_ID,
+    STATE_COLLECTION,
+    TranscriptChangeWatcher,
+    is_new_meeting_event
+)
+
+
+def meeting(name, **fields):
+    return {"meeting_name": name, "processed": False, **fields}
+
+
+def in_minutes(minutes):
+    return datetime.now(timezone.utc) + timedelta(minutes=minutes)
+
+
+@pytest.fixture
+def raw(fake_db, monkeypatch):
+    monkeypatch.setattr(transcript_events, "poll_interval_seconds", 0.01)
+    return fake_db[RAW_COLLECTION]
+
+
+def poll(collection, on_change, seconds=0.1):
+    """Run the polling loop for a while; returns how often it triggered."""
+    calls = []
+
+    async def trigger():
+        calls.append(datetime.now(timezone.utc))
+        await on_change()
+
+    async def run():
+        watcher = TranscriptChangeWatcher("mongodb://unused", trigger)
+        watcher._client = lambda: {DB_NAME: {RAW_COLLECTION: collection}}
+        task = asyncio.create_task(watcher._poll())
+        await asyncio.sleep(seconds)
+        watcher._stopping = True
+        await task
+        assert watcher.mode == "polling"
+
+    asyncio.run(run())
+    return len(calls)
+
+
+async def nothing():
+    pass
+
+
+def test_new_meeting_events():
+    assert is_new_meeting_event({"operationType": "insert"})
+    assert is_new_meeting_event({"operationType": "update",
+                                 "updateDescription": {"updatedFields": {"meetings.3": {}}}})
+    # Scheduler bookkeeping on a meeting does not retrigger
+    assert not is_new_meeting_event({"operationType": "update", "updateDescription": {"updatedFields": {
+        "meetings.3.processed": True, "meetings.3.retry_after": in_minutes(5)
+    }}})
+
+
+def test_poll_triggers_for_a_ready_meeting(raw):
+    raw.insert_one({"_id": ObjectId(), "meetings": [meeting("Done", processed=True), meeting("New")]})
+
+    assert poll(raw, nothing) > 1
+
+
+def test_poll_ignores_processed_leased_and_backing_off_meetings(raw):
+    raw.insert_one({"_id": ObjectId(), "meetings": [
+        meeting("Done", processed=True),
+        meeting("Running", processing_owner="other", lease_expires_at=in_minutes(5)),
+        meeting("Failing", attempts=2, retry_after=in_minutes(10))
+    ]})
+
+    assert poll(raw, nothing) == 0
+
+
+def test_poll_does_not_retrigger_a_meeting_that_keeps_failing(raw):
+    project_id = ObjectId()
+    raw.insert_one({"_id": project_id, "meetings": [meeting("Broken transcript")]})
+
+    async def failing_run():
+        # What process_meeting records when the run fails
+        raw.update_one({"_id": project_id}, {"$set": {
+            "meetings.0.attempts": 1,
+            "meetings.0.retry_after": in_minutes(5)
+        }})
+
+    assert poll(raw, failing_run) == 1
+
+
+def test_poll_retries_once_the_backoff_has_passed(raw):
+    raw.insert_one({"_id": ObjectId(), "meetings": [
+        meeting("Failing", attempts=1, retry_after=in_minutes(-1)),
+        meeting("Expired lease", processing_owner="gone", lease_expires_at=in_minutes(-1))
+    ]})
+
+    assert poll(raw, nothing) > 0
+
+
+class FakeStream:
+    """Replays change events; resume tokens are the event positions."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.resume_token = None
+
+    def try_next(self):
+        if not self.events:
+            time.sleep(0.005)
+            return None
+        self.resume_token = {"_data": self.events[0]["_id"]}
+        return self.events.pop(0)
+
+    def close(self):
+        pass
+
+
+class WatchedCollection:
+    """Raw_Transcripts stand-in whose watch() fails first for the given errors."""
+
+    def __init__(self, events, errors=()):
+        self.events = events
+        self.errors = list(errors)
+        self.resumed_after = []
+
+    def watch(self, pipeline, resume_after=None, max_await_time_ms=None):
+        self.resumed_after.append(resume_after)
+        if self.errors:
+            raise self.errors.pop(0)
+        return FakeStream(self.events)
+
+
+class FakeClient(dict):
+    def close(self):
+        pass
+
+
+def event(position, operation="update", fields=("meetings.1",)):
+    return {"_id": position, "operationType": operation, "documentKey": {"_id": ObjectId()},
+            "updateDescription": {"updatedFields": dict.fromkeys(fields, {})}}
+
+
+def watch(collection, state, seconds=0.15):
+    """Run the watcher for a while; returns (triggers, mode)."""
+    calls = []
+
+    async def trigger():
+        calls.append(datetime.now(timezone.utc))
+
+    async def run():
+        watcher = TranscriptChangeWatcher("mongodb://unused", trigger)
+        watcher._client = lambda: FakeClient({DB_NAME: {RAW_COLLECTION: collection, STATE_COLLECTION: state}})
+        watcher.start()
+        await asyncio.sleep(seconds)
+        mode = watcher.mode
+        watcher.stop()
+        return mode
+
+    mode = asyncio.run(run())
+    return len(calls), mode
+
+
+@pytest.fixture
+def state(fake_db, monkeypatch):
+    monkeypatch.setattr(transcript_events, "debounce_seconds", 0.02)
+    monkeypatch.setattr(transcript_events, "reconnect_seconds", 0.01)
+    return fake_db[STATE_COLLECTION]
+
+
+def test_change_stream_resumes_and_saves_its_token(state):
+    state.insert_one({"_id": RESUME_TOKEN_ID, "resume_token": {"_data": "t0"}})
+    raw = WatchedCollection([event("t1"), event("t2", fields=["meetings.0.processed"]), event("t3")])
+
+    triggers, mode = watch(raw, state)
+
+    assert mode == "change_stream"
+    assert raw.resumed_after == [{"_data": "t0"}]
+    assert state.find_one({"_id": RESUME_TOKEN_ID})["resume_token"] == {"_data": "t3"}
+    # The catch-up run and the burst of new meetings are debounced into one
+    assert triggers == 1
+
+
+def test_expired_resume_token_restarts_from_now(state):
+    state.insert_one({"_id": RESUME_TOKEN_ID, "resume_token": {"_data": "gone"}})
+    raw = WatchedCollection([], errors=[OperationFailure("resume point lost", code=286)])
+
+    triggers, mode = watch(raw, state)
+
+    assert mode == "change_stream"
+    assert raw.resumed_after == [{"_data": "gone"}, None]
+    assert triggers == 1
+
+
+def test_standalone_server_falls_back_to_polling(state, raw):
+    unsupported = WatchedCollection([], errors=[
+        OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+    ])
+    unsupported.find_one = raw.find_one
+    raw.insert_one({"_id": ObjectId(), "meetings": [meeting("New")]})
+
+    triggers, mode = watch(unsupported, state)
+
+    assert mode == "polling"
+    assert triggers > 0
@@ -0,0 +1,60 @@
+"""
+Out-of-line transcript storage: compression, both meeting shapes on read,
+and the inline-to-blob migration.
+"""
+from bson import ObjectId
+
+from src.Agentic.utils import transcript_store
+from src.Agentic.utils.transcript_store import (
+    BLOB_COLLECTION,
+    RAW_COLLECTION,
+    compress_transcript,
+    decompress_transcript,
+    load_transcript_text,
+    migrate_inline_transcripts,
+    store_transcript_blob,
+    transcript_content_hash
+)
+
+
+TRANSCRIPT = "Alice Smith 0:05\nStaging access is still blocked.\n" * 50
+
+
+def test_compression_round_trip():
+    data = compress_transcript(TRANSCRIPT)
+
+    assert len(data) < len(TRANSCRIPT) / 5
+    assert decompress_transcript(data) == TRANSCRIPT
+
+
+def test_content_hash_ignores_case_and_spacing():
+    assert transcript_content_hash("Hello   World\n") == transcript_content_hash("hello world")
+    assert transcript_content_hash("hello world") != transcript_content_hash("hello, world")
+
+
+def test_reads_blob_and_legacy_inline_meetings(fake_db):
+    blob_id = store_transcript_blob(fake_db, TRANSCRIPT)
+
+    assert load_transcript_text(fake_db, {"transcript_ref": blob_id}) == TRANSCRIPT
+    assert load_transcript_text(fake_db, {"Transcript": [TRANSCRIPT]}) == TRANSCRIPT
+    assert load_transcript_text(fake_db, {"Transcript": TRANSCRIPT}) == TRANSCRIPT
+    assert load_transcript_text(fake_db, {"transcript_ref": ObjectId()}) == ""
+
+
+def test_migration_moves_inline_transcripts_out(fake_db, monkeypatch):
+    monkeypatch.setattr(transcript_store, "MongoClient", lambda uri: {"OMNI_MEET_DB": fake_db})
+    raw = fake_db[RAW_COLLECTION]
+    project_id = ObjectId()
+    raw.insert_one({"_id": project_id, "meetings": [
+        {"meeting_name": "Kickoff", "Transcript": [TRANSCRIPT]},
+        {"meeting_name": "Retro", "Transcript": [TRANSCRIPT.upper()]}
+    ]})
+
+    assert migrate_inline_transcripts("mongodb://unused") == 2
+
+    meetings = raw.find_one({"_id": project_id})["meetings"]
+    assert all("Transcript" not in meeting for meeting in meetings)
+    assert load_transcript_text(fake_db, meetings[0]) == TRANSCRIPT
+    # Same normalised content: both meetings share one blob
+    assert meetings[0]["transcript_ref"] == meetings[1]["transcript_ref"]
+    assert len(fake_db[BLOB_COLLECTION].docs) == 1
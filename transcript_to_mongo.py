@@ -1,21 +1,33 @@
 """
 Scheduler for automatically uploading new transcripts from SampleData/Transcripts to MongoDB.
-Runs every hour to check for new transcript files and upload them to OrbitMeetDB.raw_transcripts.
+Watches the directory for new transcript files (watchdog, or short-interval
+polling when it is not installed) and uploads them to OrbitMeetDB.raw_transcripts,
+with an hourly check kept as a safety net. Files already handled are tracked in
+a persisted manifest so they are never re-parsed across restarts.
 """
 import os
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from typing import Set, List
+from typing import Set, List, Optional, Tuple
 from pymongo import MongoClient
 import certifi
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from loguru import logger
 from dotenv import load_dotenv
 
 # Import helper functions
-from src.Agentic.utils.store_to_mongodb import add_transcript_to_mongo, extract_transcripts, process_transcript
+from src.Agentic.utils.store_to_mongodb import (
+    add_transcript_to_mongo,
+    process_transcript,
+    extract_transcript_cached,
+    cache_extracted_transcript
+)
+from src.Agentic.utils.extraction_cache import extraction_cache
+from src.Agentic.utils.ingest_manifest import IngestManifest, MANIFEST_FILENAME
+from src.Agentic.utils.extraction_pool import extract_files
 
 load_dotenv()
 
@@ -37,11 +49,24 @@ logger.add(
 scheduler: AsyncIOScheduler = None
 mongo_uri = os.getenv("MONGO_URI")
 transcripts_dir = Path("SampleData/Transcripts")
-processed_files: Set[str] = set()  # Track processed files by their absolute path
+
+# Files already handled (uploaded, or found in the DB), persisted across restarts
+manifest = IngestManifest(Path(os.getenv("INGEST_MANIFEST_PATH", transcripts_dir / MANIFEST_FILENAME)))
 
 # Supported file extensions
 SUPPORTED_EXTENSIONS = {".txt", ".docx", ".pdf"}
 
+# File watcher: quiet period before a burst of file events triggers an upload run
+watch_debounce_seconds = float(os.getenv("INGEST_WATCH_DEBOUNCE_SECONDS", 3))
+poll_interval_seconds = max(1, int(os.getenv("INGEST_POLL_SECONDS", 60)))
+file_observer = None
+event_loop: Optional[asyncio.AbstractEventLoop] = None
+_pending_upload: Optional[asyncio.TimerHandle] = None
+
+# Uploads triggered while one is running are folded into one follow-up run
+_upload_lock = asyncio.Lock()
+_rerun_requested = False
+
 
 # ======================================================================
 # LOAD PROCESSED FILES FROM MONGODB
@@ -125,22 +150,23 @@ def project_key_exists(project_key: str) -> bool:
 # ======================================================================
 # GET PROJECT KEY FROM TRANSCRIPT FILE
 # ======================================================================
-def get_project_key_from_file(file_path: Path) -> str:
+def get_project_key_from_file(file_path: Path, transcript: Optional[str] = None) -> str:
     """
     Extract project key from a transcript file without uploading it.
     
     Args:
         file_path: Path to the transcript file
+        transcript: Already-extracted text, if available
         
     Returns:
         Project key string, or None if extraction fails
     """
     try:
-        # Use helper function to extract transcript
-        transcript = extract_transcripts([str(file_path)])
-        
-        # Process transcript to get metadata
-        meta = process_transcript(transcript)
+        # Extract and parse (each file only once, via the extraction cache)
+        if transcript is None:
+            meta = extract_transcript_cached(str(file_path))
+        else:
+            meta = process_transcript(transcript)
         
         return meta.get("Project_key", "").strip()
     
@@ -168,34 +194,56 @@ def scan_for_new_transcripts() -> List[Path]:
     # Get all supported files in the directory
     for file_path in transcripts_dir.iterdir():
         if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-            # Check if file has been processed
-            abs_path = str(file_path.resolve())
-            if abs_path not in processed_files:
+            # Unchanged files are skipped on size + mtime alone
+            if manifest.lookup(file_path) is None:
                 new_files.append(file_path)
     
     return new_files
 
 
+def plan_extraction(files: List[Path]) -> Tuple[List[Path], List[Path]]:
+    """
+    Hash new files (memoised by size and mtime) and split out those whose
+    content is not in the extraction cache yet. Reads whole files, so call
+    it off the event loop.
+    
+    Returns:
+        (files still present, files to extract); files deleted since the
+        directory scan are dropped
+    """
+    present, to_extract = [], []
+    for file_path in files:
+        try:
+            key = extraction_cache.file_key(file_path)
+        except FileNotFoundError:
+            logger.info(f"{file_path.name} was removed before it could be processed. Skipping.")
+            continue
+        present.append(file_path)
+        if key not in extraction_cache:
+            to_extract.append(file_path)
+    return present, to_extract
+
+
 # ======================================================================
 # UPLOAD TRANSCRIPT TO MONGODB
 # ======================================================================
-def upload_transcript(file_path: Path) -> bool:
+def upload_transcript(file_path: Path, transcript: Optional[str] = None) -> bool:
     """
     Upload a single transcript file to MongoDB.
     
     Args:
         file_path: Path to the transcript file
+        transcript: Text already extracted by the extraction pool, if available
         
     Returns:
         True if upload was successful, False otherwise
     """
-    abs_path = str(file_path.resolve())
-    
     try:
         logger.info(f"Processing transcript file: {file_path.name}")
+        sha256 = extraction_cache.file_key(file_path)  # memoised; shared with the cache key
         
         # First, check if project_key already exists
-        project_key = get_project_key_from_file(file_path)
+        project_key = get_project_key_from_file(file_path, transcript)
         
         if not project_key:
             logger.warning(f"Could not extract project key from {file_path.name}. Skipping.")
@@ -205,19 +253,19 @@ def upload_transcript(file_path: Path) -> bool:
         if project_key_exists(project_key):
             logger.info(f"Project key '{project_key}' already exists in database. Skipping {file_path.name}.")
             # Mark as processed even though we didn't upload (to avoid re-checking)
-            processed_files.add(abs_path)
+            manifest.record(file_path, "exists", sha256=sha256, project_key=project_key)
             return True
         
         # Upload transcript using the existing function
-        result = add_transcript_to_mongo(str(file_path), mongo_uri)
+        result = add_transcript_to_mongo(str(file_path), mongo_uri, transcript=transcript)
         
         if result and "already exists" not in result.lower():
             logger.success(f"Successfully uploaded {file_path.name}: {result}")
-            processed_files.add(abs_path)
+            manifest.record(file_path, "uploaded", sha256=sha256, project_key=project_key)
             return True
         elif "already exists" in result.lower():
             logger.info(f"Transcript already exists: {file_path.name}")
-            processed_files.add(abs_path)
+            manifest.record(file_path, "exists", sha256=sha256, project_key=project_key)
             return True
         else:
             logger.error(f"Failed to upload {file_path.name}: {result}")
@@ -233,14 +281,15 @@ def upload_transcript(file_path: Path) -> bool:
 # ======================================================================
 async def check_and_upload_transcripts():
     """
-    Scheduled job that runs every hour to check for new transcripts and upload them.
+    Job that checks for new transcripts and uploads them (triggered by the
+    file watcher, polling or the hourly safety-net check).
     """
     logger.info("=" * 60)
     logger.info(f"Scheduled job started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("=" * 60)
     
-    # Scan for new transcript files
-    new_files = scan_for_new_transcripts()
+    # Scan for new transcript files (stat, and hash touched files, off the event loop)
+    new_files = await asyncio.to_thread(scan_for_new_transcripts)
     
     if not new_files:
         logger.info("No new transcript files found. Skipping.")
@@ -253,45 +302,157 @@ async def check_and_upload_transcripts():
     failure_count = 0
     skipped_count = 0
     
+    # Extract new files not already in the extraction cache in parallel
+    # worker processes, off the event loop, and cache their results
+    new_files, to_extract = await asyncio.to_thread(plan_extraction, new_files)
+    extracted = await asyncio.to_thread(extract_files, to_extract)
+    
     for file_path in new_files:
-        result = upload_transcript(file_path)
+        outcome = extracted.get(str(file_path), {})
+        if "error" in outcome:
+            logger.error(f"Could not extract {file_path.name}: {outcome['error']}")
+            failure_count += 1
+            continue
+        if "text" in outcome:
+            cache_extracted_transcript(str(file_path), outcome["text"])
+        
+        # Project-key lookup and upload both read the cached extraction
+        result = await asyncio.to_thread(upload_transcript, file_path)
         if result:
             success_count += 1
         else:
             failure_count += 1
     
+    manifest.save()
+    
     logger.info("=" * 60)
     logger.info(f"Job completed: {success_count} succeeded, {failure_count} failed")
     logger.info("=" * 60)
 
 
+async def trigger_upload():
+    """
+    Run check_and_upload_transcripts, coalescing concurrent triggers.
+    
+    If a run is already in progress the request is recorded and one more
+    run starts when it finishes, so files arriving mid-run are not missed.
+    """
+    global _rerun_requested
+    
+    if _upload_lock.locked():
+        _rerun_requested = True
+        return
+    
+    async with _upload_lock:
+        while True:
+            _rerun_requested = False
+            await check_and_upload_transcripts()
+            if not _rerun_requested:
+                break
+
+
+# ======================================================================
+# FILE WATCHER
+# ======================================================================
+def _schedule_upload():
+    """Debounce file events on the event loop: fire once the directory goes quiet."""
+    global _pending_upload
+    
+    if _pending_upload is not None:
+        _pending_upload.cancel()
+    _pending_upload = event_loop.call_later(
+        watch_debounce_seconds,
+        lambda: event_loop.create_task(trigger_upload())
+    )
+
+
+def start_file_watcher() -> bool:
+    """
+    Watch the transcripts directory with watchdog (inotify on Linux).
+    
+    Returns:
+        True if the watcher started, False if watchdog is not installed
+    """
+    global file_observer
+    
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return False
+    
+    class TranscriptEventHandler(FileSystemEventHandler):
+        def _handle(self, path: str):
+            if Path(path).suffix.lower() in SUPPORTED_EXTENSIONS:
+                event_loop.call_soon_threadsafe(_schedule_upload)
+        
+        def on_created(self, event):
+            if not event.is_directory:
+                self._handle(event.src_path)
+        
+        def on_modified(self, event):
+            if not event.is_directory:
+                self._handle(event.src_path)
+        
+        def on_moved(self, event):
+            if not event.is_directory:
+                self._handle(event.dest_path)
+    
+    transcripts_dir.mkdir(parents=True, exist_ok=True)
+    file_observer = Observer()
+    file_observer.schedule(TranscriptEventHandler(), str(transcripts_dir), recursive=False)
+    file_observer.daemon = True
+    file_observer.start()
+    return True
+
+
+def stop_file_watcher():
+    global file_observer, _pending_upload
+    
+    if _pending_upload is not None:
+        _pending_upload.cancel()
+        _pending_upload = None
+    if file_observer is not None:
+        file_observer.stop()
+        file_observer.join(timeout=5)
+        file_observer = None
+
+
 # ======================================================================
 # INITIALIZE PROCESSED FILES
 # ======================================================================
 def initialize_processed_files():
     """
-    Initialize the set of processed files by scanning the directory
-    and checking against MongoDB.
+    Load the ingest manifest, then check only files it does not know about
+    against MongoDB. Files recorded in the manifest are not parsed again.
     """
-    global processed_files
-    
     logger.info("Initializing processed files tracking...")
     
+    manifest.load()
+    removed = manifest.forget_missing()
+    if removed:
+        logger.info(f"Dropped {removed} deleted file(s) from the ingest manifest")
+    
     # Load from database
-    db_processed = load_processed_files_from_db()
-    processed_files.update(db_processed)
+    load_processed_files_from_db()
     
-    # Also scan directory and check each file against MongoDB
+    # Check unknown files against MongoDB
+    checked = 0
     if transcripts_dir.exists():
         for file_path in transcripts_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                project_key = get_project_key_from_file(file_path)
-                if project_key and project_key_exists(project_key):
-                    abs_path = str(file_path.resolve())
-                    processed_files.add(abs_path)
-                    logger.debug(f"Marked as processed (exists in DB): {file_path.name}")
-    
-    logger.info(f"Initialized {len(processed_files)} processed files")
+            if not (file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS):
+                continue
+            if manifest.lookup(file_path) is not None:
+                continue
+            
+            checked += 1
+            project_key = get_project_key_from_file(file_path)
+            if project_key and project_key_exists(project_key):
+                manifest.record(file_path, "exists", project_key=project_key)
+                logger.debug(f"Marked as processed (exists in DB): {file_path.name}")
+    
+    manifest.save()
+    logger.info(f"Initialized {len(manifest)} processed files ({checked} checked against the database)")
 
 
 # ======================================================================
@@ -299,7 +460,7 @@ def initialize_processed_files():
 # ======================================================================
 def start_scheduler():
     """Start the background scheduler"""
-    global scheduler
+    global scheduler, event_loop
     
     if scheduler is not None:
         logger.warning("Scheduler is already running")
@@ -311,20 +472,35 @@ def start_scheduler():
     initialize_processed_files()
     
     # Create scheduler
-    scheduler = AsyncIOScheduler()
+    event_loop = asyncio.get_event_loop()
+    scheduler = AsyncIOScheduler(event_loop=event_loop)
     
-    # Schedule job to run every hour
+    # Hourly safety net (catches anything the watcher missed)
     scheduler.add_job(
-        check_and_upload_transcripts,
+        trigger_upload,
         trigger=CronTrigger(minute=0),  # Run at the start of every hour
         id="upload_transcripts",
         name="Upload new transcripts to MongoDB",
         replace_existing=True
     )
     
+    # Pick up new files within seconds: watchdog if available, else short polling
+    if start_file_watcher():
+        logger.success(f"Watching for new transcripts (debounce {watch_debounce_seconds}s)")
+    else:
+        scheduler.add_job(
+            trigger_upload,
+            trigger=IntervalTrigger(seconds=poll_interval_seconds),
+            id="poll_transcripts",
+            name="Poll for new transcripts",
+            replace_existing=True
+        )
+        logger.info(f"watchdog not installed; polling for new transcripts every {poll_interval_seconds}s")
+    
     # Start scheduler
     scheduler.start()
-    logger.success("Background scheduler started. Will check for new transcripts every hour.")
+    logger.success("Background scheduler started. New transcripts are uploaded as they arrive "
+                   "(hourly check kept as a safety net).")
     logger.info(f"Monitoring directory: {transcripts_dir.absolute()}")
 
 
@@ -336,6 +512,7 @@ def stop_scheduler():
         return
     
     logger.info("Stopping transcript upload scheduler...")
+    stop_file_watcher()
     scheduler.shutdown()
     scheduler = None
     logger.success("Background scheduler stopped")
@@ -347,7 +524,7 @@ def stop_scheduler():
 async def run_manual_check():
     """Manually trigger check and upload of new transcripts (for testing)"""
     logger.info("Manual check triggered")
-    await check_and_upload_transcripts()
+    await trigger_upload()
 
 
 # ======================================================================
@@ -357,18 +534,13 @@ if __name__ == "__main__":
     # For standalone execution
     logger.info("Starting transcript upload scheduler as standalone service...")
     
-    # Initialize processed files
-    initialize_processed_files()
-    
-    # Start scheduler
+    # Start scheduler (initializes processed files tracking)
     start_scheduler()
     
     try:
-        # Keep the script running
-        # AsyncIOScheduler runs in the background, so we just need to keep the main thread alive
-        import time
-        while True:
-            time.sleep(1)
+        # Keep the script running: AsyncIOScheduler and the watcher's
+        # debounced uploads both run on this event loop
+        asyncio.get_event_loop().run_forever()
     except KeyboardInterrupt:
         logger.info("Shutting down...")
         stop_scheduler()